@@ -0,0 +1,326 @@
+"""Steady-state memory allocations of the per-event path, by stage.
+
+Replays a synthetic key stream under ``tracemalloc`` and reports, per unit
+(one passed-through key event, or one two-key hotkey tap of four events):
+
+- ``alloc%``: share of the units during which anything was allocated;
+- ``peak B``: mean and largest transient peak, in bytes above the memory in
+  use before the unit (allocations freed again before it ended);
+- ``kept``: blocks and bytes still allocated after the run, per unit (zero
+  in the steady state), with the source lines that allocated them.
+
+Each stage is measured on its own, after a warm-up that fills the caches:
+
+- ``parser``: ``EventParser`` (raw evdev event → reused ``ParsedEvent``);
+- ``processor``: ``EventProcessor.process`` with no-op callbacks;
+- ``tap_monitor``: ``TapMonitor._on_press`` / ``_on_release``;
+- ``hotkey_matcher``: ``HotkeyMatcher.match`` of each completed tap;
+- ``pipeline``: all of them chained as in the event loop, with the event
+  loop's timer heap.
+
+The number boxes of counters and of the flight recorder timestamp are
+allocated by CPython on every event; they show up as a few dozen bytes of
+transient peak, never as kept blocks.
+
+Usage:
+    python benchmarks/allocations.py
+    python benchmarks/allocations.py --units 20000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import logging
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC = PROJECT_ROOT / 'src'
+sys.path.insert(0, str(SRC))
+
+from evdev import InputEvent  # noqa: E402
+from evdev import ecodes  # noqa: E402
+
+from common.backends.evdev_backend.key_state import KeyState  # noqa: E402
+from common.backends.evdev_backend.parser import EventParser  # noqa: E402
+from common.backends.evdev_backend.parser import key_names  # noqa: E402
+from common.backends.evdev_backend.parser import parse_event  # noqa: E402
+from common.backends.evdev_backend.processor import EventProcessor  # noqa: E402
+from common.backends.evdev_backend.timers import DeadlineScheduler  # noqa: E402
+from common.tap_monitor import TapMonitor  # noqa: E402
+from launcher.hotkey_matcher import HotkeyMatcher  # noqa: E402
+from launcher.models import HotkeyConfig  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+HOTKEYS = [
+    HotkeyConfig(keys=['ctrl_l', 'shift_l'], command='true'),
+    HotkeyConfig(keys=['ctrl_r', 'shift_r'], command='true'),
+    HotkeyConfig(keys=['super_l', 'alt_l'], command='true'),
+    HotkeyConfig(keys=['ctrl_l', 'alt_l', 'p'], command='true'),
+    HotkeyConfig(keys=['ctrl_r', '/'], command='true'),
+]
+
+# Keys no hotkey uses, typed in turn
+TYPED = [ecodes.KEY_A, ecodes.KEY_S, ecodes.KEY_D, ecodes.KEY_F, ecodes.KEY_J, ecodes.KEY_K, ecodes.KEY_SPACE]
+TAP = [(ecodes.KEY_LEFTCTRL, 1), (ecodes.KEY_LEFTSHIFT, 1), (ecodes.KEY_LEFTSHIFT, 0), (ecodes.KEY_LEFTCTRL, 0)]
+TAP_KEYS = {'ctrl_l', 'shift_l'}
+
+
+class _Handle:
+    def cancel(self) -> None:
+        pass
+
+
+class BenchBackend:
+    """Backend stand-in; timers go to ``scheduler`` (None: not armed)."""
+
+    _handle = _Handle()
+
+    def __init__(self, scheduler: DeadlineScheduler | None = None) -> None:
+        self.scheduler = scheduler
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> Any:
+        if self.scheduler is None:
+            return self._handle
+        return self.scheduler.call_later(delay, callback)
+
+    def suppress_key(self, key_name: str) -> None:
+        pass
+
+    def get_backend_name(self) -> str:
+        return 'benchmark'
+
+
+class NullWriter:
+    """uinput writer stand-in."""
+
+    def emit_press(self, code: int) -> None:
+        pass
+
+    def emit_release(self, code: int) -> None:
+        pass
+
+    def emit_repeat(self, code: int) -> None:
+        pass
+
+
+class BenchDevice:
+    def fileno(self) -> int:
+        return 3
+
+
+DEVICE = BenchDevice()
+
+
+def _noop(*_args: Any) -> None:
+    pass
+
+
+def _tap_monitor(matcher: HotkeyMatcher, backend: BenchBackend, on_keys_detected: Callable[..., None]) -> TapMonitor:
+    return TapMonitor(
+        timeout=0.2,
+        on_keys_detected=on_keys_detected,
+        on_tap_invalid=_noop,
+        check_timer_delay=matcher.should_delay_timer_start,
+        candidates=matcher,
+        backend=backend,
+    )
+
+
+def _processor() -> EventProcessor:
+    logger = logging.getLogger('bench')
+    return EventProcessor(logger, KeyState(logger), NullWriter())
+
+
+def build_units(scenario: str, count: int) -> list[list[Any]]:
+    """Return ``count`` units of raw events: single typed events, or whole taps."""
+    if scenario == 'passthrough':
+        return [
+            [InputEvent(0, 0, ecodes.EV_KEY, TYPED[(i // 2) % len(TYPED)], 1 - i % 2)]
+            for i in range(count)
+        ]
+    return [[InputEvent(0, 0, ecodes.EV_KEY, code, value) for code, value in TAP] for _ in range(count)]
+
+
+def build_stages(scenario: str, units: list[list[Any]]) -> dict[str, Callable[[int], None]]:
+    """Return the stages to measure, each run on the unit of the given index.
+
+    The inputs of each stage (raw events, parsed events or key names) are
+    prepared here, so that only the stage itself runs while measuring.
+    """
+    matcher = HotkeyMatcher(HOTKEYS)
+    parser = EventParser()
+
+    def parse(index: int) -> None:
+        for raw in units[index]:
+            parser(DEVICE, raw)
+
+    processor = _processor()
+    parsed = [[parse_event(DEVICE, raw) for raw in unit] for unit in units]
+
+    def process(index: int) -> None:
+        for evt in parsed[index]:
+            processor.process(evt, _noop, _noop)  # type: ignore[arg-type]
+
+    names = key_names()
+    keys = [[(names[raw.code], raw.value) for raw in unit] for unit in units]
+    monitor = _tap_monitor(matcher, BenchBackend(), _noop)
+
+    def track(index: int) -> None:
+        for key_name, value in keys[index]:
+            if value:
+                monitor._on_press(key_name)
+            else:
+                monitor._on_release(key_name)
+
+    def match(_index: int) -> None:
+        matcher.match(TAP_KEYS, 0.05)
+
+    stages: dict[str, Callable[[int], None]] = {'parser': parse, 'processor': process, 'tap_monitor': track}
+    if scenario == 'tap':
+        stages['hotkey_matcher'] = match
+    stages['pipeline'] = _pipeline(matcher, units)
+    return stages
+
+
+def _pipeline(matcher: HotkeyMatcher, units: list[list[Any]]) -> Callable[[int], None]:
+    """Return the whole path of an event, as the event loop runs it."""
+    scheduler = DeadlineScheduler()
+    processor = _processor()
+    parser = EventParser()
+    monitor = _tap_monitor(
+        matcher, BenchBackend(scheduler), lambda tap_keys, duration, *_: matcher.match(tap_keys, duration)
+    )
+    on_press = monitor._on_press
+    on_release = monitor._on_release
+
+    def run(index: int) -> None:
+        for raw in units[index]:
+            evt = parser(DEVICE, raw)
+            if evt is not None and not processor.handle_unknown(evt):
+                processor.process(evt, on_press, on_release)
+            scheduler.next_delay()
+
+    return run
+
+
+def _idle(units: list[list[Any]]) -> Callable[[int], None]:
+    """Return a stage that only loops over the events of a unit."""
+
+    def run(index: int) -> None:
+        for _raw in units[index]:
+            pass
+
+    return run
+
+
+def _peaks(fn: Callable[[int], None], indices: range, peaks: list[int]) -> None:
+    """Store the transient peak of each unit in ``peaks`` (tracemalloc running)."""
+    traced = tracemalloc.get_traced_memory
+    reset = tracemalloc.reset_peak
+    first = indices.start
+    for index in indices:
+        before = traced()[0]
+        reset()
+        fn(index)
+        peaks[index - first] = traced()[1] - before
+
+
+def measure(
+    fn: Callable[[int], None], idle: Callable[[int], None], count: int, warmup: int, top: int
+) -> dict[str, Any]:
+    """Measure allocations of ``fn`` over units ``warmup`` to ``count`` (after running the first ``warmup``).
+
+    ``idle`` loops over a unit doing nothing: its smallest peak is the cost
+    of the measurement itself, subtracted from every peak of ``fn``.
+    """
+    for index in range(warmup):
+        fn(index)
+    indices = range(warmup, count)
+    n = len(indices)
+    peaks = [0] * n
+    overhead = [0] * n
+    gc.collect()
+    gc.disable()
+    tracemalloc.start(1)
+    try:
+        _peaks(idle, indices, overhead)  # cost of the measurement itself
+        before = tracemalloc.take_snapshot()
+        _peaks(fn, indices, peaks)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    floor = min(overhead)
+    transient = [max(peak - floor, 0) for peak in peaks]
+    only_src = [tracemalloc.Filter(True, f'{SRC}/*')]
+    kept = [
+        stat
+        for stat in after.filter_traces(only_src).compare_to(before.filter_traces(only_src), 'lineno')
+        if stat.count_diff * 100 >= n  # one block per 100 units: not just the last counter values
+    ]
+    return {
+        'units': n,
+        'alloc_pct': round(sum(1 for peak in transient if peak) / n * 100, 1),
+        'peak_bytes_mean': round(sum(transient) / n, 1),
+        'peak_bytes_max': max(transient),
+        'kept_blocks_per_unit': round(sum(stat.count_diff for stat in kept) / n, 3),
+        'kept_bytes_per_unit': round(sum(stat.size_diff for stat in kept) / n, 1),
+        'kept_sites': [
+            {
+                'site': f'{Path(stat.traceback[0].filename).relative_to(SRC)}:{stat.traceback[0].lineno}',
+                'blocks': stat.count_diff,
+                'bytes': stat.size_diff,
+            }
+            for stat in kept[:top]
+        ],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--units', type=int, default=5000, help='Measured units per scenario and stage')
+    parser.add_argument('--warmup', type=int, default=500, help='Units run before measuring')
+    parser.add_argument('--top', type=int, default=5, help='Source lines listed per stage that kept memory')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    results: dict[str, dict[str, Any]] = {}
+    for scenario in ('passthrough', 'tap'):
+        count = args.warmup + args.units
+        units = build_units(scenario, count)
+
+        idle = _idle(units)
+        results[scenario] = {
+            stage: measure(fn, idle, count, args.warmup, args.top)
+            for stage, fn in build_stages(scenario, units).items()
+        }
+
+    if args.json:
+        json.dump({'units': args.units, 'warmup': args.warmup, 'scenarios': results}, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return 0
+    header = f"  {'stage':<16} {'alloc%':>7} {'peak B':>8} {'max B':>7} {'kept blocks':>12} {'kept B':>8}\n"
+    for scenario, measured in results.items():
+        unit = 'event' if scenario == 'passthrough' else 'tap'
+        sys.stdout.write(f'\n{scenario} (per {unit}, {args.units} {unit}s after {args.warmup} warm-up):\n')
+        sys.stdout.write(header)
+        for stage, r in measured.items():
+            sys.stdout.write(
+                f"  {stage:<16} {r['alloc_pct']:>6.1f}% {r['peak_bytes_mean']:>8.1f} {r['peak_bytes_max']:>7}"
+                f" {r['kept_blocks_per_unit']:>12.3f} {r['kept_bytes_per_unit']:>8.1f}\n"
+            )
+            for site in r['kept_sites']:
+                sys.stdout.write(f"      kept by {site['site']}: {site['blocks']} blocks, {site['bytes']} B\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""Accuracy of hold hotkey deadlines under typing load.
+
+Runs the real event loop (``EventRouter`` with its ``DeadlineScheduler``),
+``TapMonitor`` and ``HoldTracker`` on a synthetic event queue. A feeder
+thread presses and holds ``super_l+h`` (a hold hotkey) over and over while
+"typing" other keys at the given rate; each time the hold fires, its
+lateness (timer callback minus deadline) is recorded.
+
+Scenarios:
+
+- ``idle``: only the holds, the loop blocks on the queue between events;
+- ``typing``: keys typed at ``--rate`` per second meanwhile;
+- ``flood``: keys as fast as the feeder can queue them (worst case).
+
+Usage:
+    python benchmarks/hold_timer_accuracy.py
+    python benchmarks/hold_timer_accuracy.py --holds 50 --rate 40 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from common.backends.evdev_backend.event_router import EventRouter  # noqa: E402
+from common.backends.evdev_backend.types import ParsedEvent  # noqa: E402
+from common.tap_monitor import TapMonitor  # noqa: E402
+from launcher.hold_engine import HoldTracker  # noqa: E402
+from launcher.hotkey_matcher import HotkeyMatcher  # noqa: E402
+from launcher.models import HotkeyConfig  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from common.backends.evdev_backend.timers import TimerHandle
+
+HOLD_MS = 300
+# Device ids of the keyboard holding the hotkey and of the one typing
+HOLDING, TYPING = 1, 2
+TYPED_KEYS = ('a', 's', 'd', 'f', 'j', 'k', 'l', 'e', 'r', 'i', 'o')
+
+
+class BenchBackend:
+    """Backend stand-in: timers come from the router, key buffering is a no-op."""
+
+    def __init__(self, router: EventRouter) -> None:
+        self.router = router
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        return self.router.timers.call_later(delay, callback)
+
+    def buffer_key(self, key_name: str) -> None:
+        pass
+
+    def restore_key(self, key_name: str) -> None:
+        pass
+
+    def suppress_key(self, key_name: str) -> None:
+        pass
+
+    def get_backend_name(self) -> str:
+        return 'benchmark'
+
+
+def _event(device: int, key: str, value: int) -> tuple[int, ParsedEvent]:
+    return device, ParsedEvent(device, (device, 0), 0, value, key)
+
+
+def _feed(events: queue.Queue, holds: int, rate: float | None, done: threading.Event) -> None:
+    """Queue hold gestures, typing ``rate`` keys per second meanwhile (0 = none, None = flood)."""
+    hold_time = HOLD_MS / 1000 + 0.05
+    typed = 0
+    for _ in range(holds):
+        events.put(_event(HOLDING, 'super_l', 1))
+        events.put(_event(HOLDING, 'h', 1))
+        start = time.perf_counter()
+        # Type on a second keyboard while the hold is pending; the typed
+        # keys reach the loop but do not interrupt the hold
+        while rate != 0 and time.perf_counter() - start < hold_time:
+            if rate is not None:
+                time.sleep(1 / rate)
+            elif typed % 64 == 0:
+                time.sleep(0)
+            key = TYPED_KEYS[typed % len(TYPED_KEYS)]
+            events.put(_event(TYPING, key, 1))
+            events.put(_event(TYPING, key, 0))
+            typed += 1
+        time.sleep(max(hold_time - (time.perf_counter() - start), 0.0))
+        events.put(_event(HOLDING, 'h', 0))
+        events.put(_event(HOLDING, 'super_l', 0))
+        time.sleep(0.02)
+    done.set()
+    events.put((None, None))
+
+
+def run_scenario(holds: int, rate: float | None) -> dict[str, float]:
+    hotkeys = [
+        HotkeyConfig(keys=['super_l', 'h'], command='true', trigger='hold', hold_ms=HOLD_MS),
+        HotkeyConfig(keys=['ctrl_l', 'shift_l'], command='true'),
+    ]
+    matcher = HotkeyMatcher(hotkeys)
+    lateness: list[float] = []
+
+    def fire(_hotkey: HotkeyConfig, _device: object, pressed_at: float, fired_at: float) -> None:
+        lateness.append(fired_at - (pressed_at + HOLD_MS / 1000))
+
+    logger = logging.getLogger('bench.hold')
+    logger.disabled = True
+
+    monitors: dict[int, TapMonitor] = {}
+
+    def handle_value(parsed: ParsedEvent) -> None:
+        # Held keys and typed keys come from different keyboards
+        monitor = monitors[parsed.device_id]
+        if parsed.value:
+            monitor._on_press(parsed.key_name)
+        else:
+            monitor._on_release(parsed.key_name)
+
+    router = EventRouter(logger, lambda _device, event: event, lambda _parsed: False, handle_value)
+    backend = BenchBackend(router)
+    tracker = HoldTracker(matcher, fire, backend.call_later, backend)
+    for device in (HOLDING, TYPING):
+        monitor = TapMonitor(timeout=0.2, candidates=matcher, backend=backend)
+        if device == HOLDING:
+            monitor.holds = tracker
+        monitors[device] = monitor
+
+    events: queue.Queue = queue.Queue()
+    done = threading.Event()
+    feeder = threading.Thread(target=_feed, args=(events, holds, rate, done), daemon=True)
+    feeder.start()
+    router.run(events.get, done)
+    feeder.join()
+
+    ordered = sorted(lateness) or [0.0]
+    return {
+        'holds': len(lateness),
+        'events': router.events_total,
+        'p50_us': round(ordered[len(ordered) // 2] * 1e6, 1),
+        'p99_us': round(ordered[min(int(len(ordered) * 0.99), len(ordered) - 1)] * 1e6, 1),
+        'max_us': round(ordered[-1] * 1e6, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--holds', type=int, default=20, help='Hold gestures per scenario')
+    parser.add_argument('--rate', type=float, default=30.0, help='Typed keys per second in the typing scenario')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    results = {
+        'idle': run_scenario(args.holds, 0),
+        'typing': run_scenario(args.holds, args.rate),
+        'flood': run_scenario(args.holds, None),
+    }
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return 0
+    sys.stdout.write(f'Hold deadline lateness ({args.holds} holds of {HOLD_MS} ms per scenario):\n')
+    for name, r in results.items():
+        sys.stdout.write(
+            f"  {name:<7} {r['events']:>8} events  p50 {r['p50_us']:8.1f} us  "
+            f"p99 {r['p99_us']:8.1f} us  max {r['max_us']:8.1f} us\n"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
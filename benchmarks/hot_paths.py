@@ -0,0 +1,281 @@
+"""Micro-benchmarks of the functions run for every key event.
+
+Each case times one call of a hot function with ``timeit`` (stdlib only);
+the reported cost is the best of ``--repeat`` runs of ``--number`` calls,
+in nanoseconds per call (the median run is reported as well):
+
+- key names: ``normalize_key``, ``is_modifier_key``, ``format_keys_display``,
+  ``evdev_to_key_name``, ``key_name_to_evdev_code``;
+- evdev backend: ``parse_event``, ``EventParser`` (the event loop's parser,
+  reusing one record), ``KeyState.is_suppressed``,
+  ``EventProcessor.process`` (a passed-through press and release);
+- tap engine: ``HotkeyMatcher.match``, ``TapMonitor._on_press`` /
+  ``_on_release`` (a two-key hotkey tap, and typing a key no hotkey uses).
+
+Results can be saved as JSON and compared with a baseline; cases slower
+than the baseline by more than ``--threshold`` percent are flagged and the
+exit status is 1. With ``--pyperf`` (and pyperf installed) the cases are
+run by ``pyperf.Runner`` instead, with its worker processes, calibration
+and options (e.g. ``-o results.json``, ``--fast``).
+
+Usage:
+    python benchmarks/hot_paths.py
+    python benchmarks/hot_paths.py --json > baseline.json
+    python benchmarks/hot_paths.py --compare baseline.json --threshold 10
+    python benchmarks/hot_paths.py --cases 'tap_monitor.*'
+    python benchmarks/hot_paths.py --pyperf --fast
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import logging
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from evdev import InputEvent  # noqa: E402
+from evdev import ecodes  # noqa: E402
+
+from common.backends.evdev_backend.key_state import KeyState  # noqa: E402
+from common.backends.evdev_backend.parser import EventParser  # noqa: E402
+from common.backends.evdev_backend.parser import parse_event  # noqa: E402
+from common.backends.evdev_backend.processor import EventProcessor  # noqa: E402
+from common.backends.evdev_backend.types import ParsedEvent  # noqa: E402
+from common.backends.key_mapping import evdev_to_key_name  # noqa: E402
+from common.backends.key_mapping import key_name_to_evdev_code  # noqa: E402
+from common.key_normalizer import format_keys_display  # noqa: E402
+from common.key_normalizer import is_modifier_key  # noqa: E402
+from common.key_normalizer import normalize_key  # noqa: E402
+from common.tap_monitor import TapMonitor  # noqa: E402
+from launcher.hotkey_matcher import HotkeyMatcher  # noqa: E402
+from launcher.models import HotkeyConfig  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_THRESHOLD = 10.0
+
+# A typical configuration: layout switches, launchers and a sequence
+HOTKEYS = [
+    HotkeyConfig(keys=['ctrl_l', 'shift_l'], command='true'),
+    HotkeyConfig(keys=['ctrl_r', 'shift_r'], command='true'),
+    HotkeyConfig(keys=['super_l', 'alt_l'], command='true'),
+    HotkeyConfig(keys=['super_l', 'shift_l'], command='true'),
+    HotkeyConfig(keys=['ctrl_l', 'alt_l', 'p'], command='true'),
+    HotkeyConfig(keys=['ctrl_r', '/'], command='true'),
+    HotkeyConfig(keys=['ctrl_l'], sequence=[['ctrl_l'], ['ctrl_l']], command='true'),
+]
+
+
+class _Handle:
+    def cancel(self) -> None:
+        pass
+
+
+class BenchBackend:
+    """Backend stand-in: timers are not armed, suppression is a no-op."""
+
+    _handle = _Handle()
+
+    def call_later(self, _delay: float, _callback: Callable[[], None]) -> _Handle:
+        return self._handle
+
+    def suppress_key(self, key_name: str) -> None:
+        pass
+
+    def get_backend_name(self) -> str:
+        return 'benchmark'
+
+
+class NullWriter:
+    """uinput writer stand-in."""
+
+    def emit_press(self, code: int) -> None:
+        pass
+
+    def emit_release(self, code: int) -> None:
+        pass
+
+    def emit_repeat(self, code: int) -> None:
+        pass
+
+
+class BenchDevice:
+    def fileno(self) -> int:
+        return 3
+
+
+def _noop(_key: Any) -> None:
+    pass
+
+
+def _tap_monitor() -> TapMonitor:
+    matcher = HotkeyMatcher(HOTKEYS)
+    return TapMonitor(
+        timeout=0.2,
+        on_keys_detected=lambda *_args: None,
+        on_tap_invalid=lambda *_args: None,
+        check_timer_delay=matcher.should_delay_timer_start,
+        candidates=matcher,
+        backend=BenchBackend(),
+    )
+
+
+def build_cases() -> dict[str, Callable[[], object]]:
+    """Return the benchmark cases: one call of a hot function each."""
+    matcher = HotkeyMatcher(HOTKEYS)
+    tap_keys = {'ctrl_l', 'shift_l'}
+    key_state = KeyState(logging.getLogger('bench'))
+    suppressed_ref = (3, ecodes.KEY_C)
+    key_state.suppressed_keys.add(suppressed_ref)
+    passthrough_ref = (3, ecodes.KEY_A)
+    device = BenchDevice()
+    press = InputEvent(0, 0, ecodes.EV_KEY, ecodes.KEY_A, 1)
+    event_parser = EventParser()
+    processor = EventProcessor(logging.getLogger('bench'), KeyState(logging.getLogger('bench')), NullWriter())
+
+    def process_press_release() -> None:
+        processor.process(ParsedEvent(3, passthrough_ref, ecodes.KEY_A, 1, 'a'), _noop, _noop)
+        processor.process(ParsedEvent(3, passthrough_ref, ecodes.KEY_A, 0, 'a'), _noop, _noop)
+
+    hotkey_monitor = _tap_monitor()
+    on_press = hotkey_monitor._on_press
+    on_release = hotkey_monitor._on_release
+
+    def hotkey_tap() -> None:
+        on_press('ctrl_l')
+        on_press('shift_l')
+        on_release('shift_l')
+        on_release('ctrl_l')
+
+    typing_monitor = _tap_monitor()
+    typing_press = typing_monitor._on_press
+    typing_release = typing_monitor._on_release
+
+    def typing() -> None:
+        typing_press('a')
+        typing_release('a')
+
+    return {
+        'key_normalizer.normalize_key': lambda: normalize_key('ctrl_l'),
+        'key_normalizer.is_modifier_key': lambda: is_modifier_key('a'),
+        'key_normalizer.format_keys_display': lambda: format_keys_display(tap_keys),
+        'key_mapping.evdev_to_key_name': lambda: evdev_to_key_name('KEY_LEFTCTRL'),
+        'key_mapping.key_name_to_evdev_code': lambda: key_name_to_evdev_code('ctrl_l'),
+        'parser.parse_event': lambda: parse_event(device, press),
+        'parser.EventParser': lambda: event_parser(device, press),
+        'key_state.is_suppressed.miss': lambda: key_state.is_suppressed(passthrough_ref, 1),
+        'key_state.is_suppressed.hit': lambda: key_state.is_suppressed(suppressed_ref, 1),
+        'processor.process.press_release': process_press_release,
+        'hotkey_matcher.match': lambda: matcher.match(tap_keys, 0.05),
+        'tap_monitor.hotkey_tap': hotkey_tap,
+        'tap_monitor.typing': typing,
+    }
+
+
+def run_case(fn: Callable[[], object], number: int, repeat: int) -> dict[str, float]:
+    runs = sorted(timeit.Timer(fn).repeat(repeat=repeat, number=number))
+    return {
+        'ns_per_call': round(runs[0] / number * 1e9, 1),
+        'median_ns': round(runs[len(runs) // 2] / number * 1e9, 1),
+    }
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Write a comparison with ``baseline`` and return the names of the regressed cases."""
+    base_cases = baseline.get('cases', {})
+    regressed = []
+    sys.stdout.write(f"{'case':<40} {'baseline':>10} {'now':>10} {'change':>8}\n")
+    for name, result in results.items():
+        base = base_cases.get(name)
+        now = result['ns_per_call']
+        if base is None:
+            sys.stdout.write(f"{name:<40} {'-':>10} {now:>8.1f}ns {'new':>8}\n")
+            continue
+        before = base['ns_per_call']
+        change = (now - before) / before * 100 if before else 0.0
+        flag = ''
+        if change > threshold:
+            regressed.append(name)
+            flag = '  REGRESSION'
+        sys.stdout.write(f'{name:<40} {before:>8.1f}ns {now:>8.1f}ns {change:>+7.1f}%{flag}\n')
+    return regressed
+
+
+def run_pyperf(cases: dict[str, Callable[[], object]]) -> int:
+    """Run the cases with ``pyperf.Runner`` (which parses the remaining options)."""
+    try:
+        import pyperf  # noqa: PLC0415
+    except ImportError:
+        sys.stderr.write('pyperf is not installed (pip install pyperf)\n')
+        return 2
+
+    def add_cmdline_args(cmd: list[str], args: argparse.Namespace) -> None:
+        cmd.extend(('--pyperf', '--cases', args.cases))
+
+    runner = pyperf.Runner(add_cmdline_args=add_cmdline_args)
+    runner.argparser.add_argument('--pyperf', action='store_true')
+    runner.argparser.add_argument('--cases', default='*')
+    args = runner.parse_args()
+    for name, fn in cases.items():
+        if fnmatch.fnmatchcase(name, args.cases):
+            runner.bench_func(name, fn)
+    return 0
+
+
+def main() -> int:
+    if '--pyperf' in sys.argv:
+        return run_pyperf(build_cases())
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000, help='Calls per timing run')
+    parser.add_argument('--repeat', type=int, default=7, help='Timing runs per case')
+    parser.add_argument('--cases', default='*', help='Only run cases matching this pattern')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    parser.add_argument('--compare', type=Path, help='Baseline JSON (from --json) to compare with')
+    parser.add_argument(
+        '--threshold', type=float, default=DEFAULT_THRESHOLD, help='Slowdown in percent flagged as a regression'
+    )
+    parser.add_argument('--pyperf', action='store_true', help='Run with pyperf (remaining options go to pyperf)')
+    args = parser.parse_args()
+
+    results = {
+        name: run_case(fn, args.number, args.repeat)
+        for name, fn in build_cases().items()
+        if fnmatch.fnmatchcase(name, args.cases)
+    }
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        regressed = compare(results, baseline, args.threshold)
+        if regressed:
+            sys.stdout.write(f"\n{len(regressed)} regression(s) above {args.threshold:g}%: {', '.join(regressed)}\n")
+            return 1
+        return 0
+
+    if args.json:
+        report = {
+            'python': platform.python_version(),
+            'number': args.number,
+            'repeat': args.repeat,
+            'cases': results,
+        }
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return 0
+    sys.stdout.write(f'Hot path cost (best of {args.repeat} x {args.number} calls):\n')
+    for name, r in results.items():
+        sys.stdout.write(f"  {name:<40} {r['ns_per_call']:>9.1f} ns  (median {r['median_ns']:.1f} ns)\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
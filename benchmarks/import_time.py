@@ -0,0 +1,173 @@
+"""CLI startup-time regression benchmark based on ``python -X importtime``.
+
+Runs each launch/detect subcommand in a fresh interpreter (with an empty
+HOME, so no real daemon is touched), parses the import-time report and
+checks two things:
+
+- modules that a subcommand must not import (evdev, the keyboard backend,
+  the tap engine) are absent;
+- total import time stays within the subcommand's budget.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 10 --json
+    python benchmarks/import_time.py --budget-scale 2   # slow machine / CI
+
+Exits with status 1 when a check fails.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = PROJECT_ROOT / 'src'
+EXAMPLE_CONFIG = PROJECT_ROOT / 'config' / 'tap-launcher.toml.example'
+
+# Modules that only the commands reading keyboards may import
+HEAVY_MODULES = (
+    'evdev',
+    'common.backends.evdev_backend',
+    'common.tap_monitor',
+    'launcher.monitor',
+    'launcher.command_executor',
+)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A subcommand invocation to measure.
+
+    Attributes:
+        name: Scenario name used in reports
+        module: CLI module run with ``python -m``
+        args: Command-line arguments
+        budget_ms: Maximum total import time in milliseconds
+        forbidden: Modules (or packages) that must not be imported
+    """
+    name: str
+    module: str
+    args: tuple[str, ...]
+    budget_ms: float
+    forbidden: tuple[str, ...] = HEAVY_MODULES
+
+
+SCENARIOS: tuple[Scenario, ...] = (
+    # --help renders through rich, which alone costs ~100 ms
+    Scenario('launch --help', 'launcher.main', ('--help',), 300.0),
+    Scenario('launch status', 'launcher.main', ('status',), 150.0),
+    Scenario('launch stop', 'launcher.main', ('stop',), 150.0),
+    Scenario('launch stats', 'launcher.main', ('stats',), 150.0),
+    Scenario(
+        'launch check-config',
+        'launcher.main',
+        ('check-config', '--config', str(EXAMPLE_CONFIG)),
+        150.0,
+        forbidden=HEAVY_MODULES[:4],
+    ),
+    Scenario('detect --help', 'detector.main', ('--help',), 300.0, forbidden=HEAVY_MODULES[:2]),
+)
+
+
+@dataclass
+class Measurement:
+    """Import-time result of one scenario (best of all repeats)."""
+    scenario: Scenario
+    total_ms: float
+    modules: dict[str, float]
+    violations: list[str]
+
+
+def parse_importtime(stderr: str) -> dict[str, float]:
+    """Parse ``-X importtime`` output into module → self time (ms)."""
+    modules: dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _cumulative_us, name = line[len('import time:'):].split('|', 2)
+        modules[name.strip()] = int(self_us) / 1000.0
+    return modules
+
+
+def run_once(scenario: Scenario, home: str) -> dict[str, float]:
+    """Run a scenario in a fresh interpreter and return its import times."""
+    env = {**os.environ, 'HOME': home, 'PYTHONPATH': str(SRC_DIR), 'PYTHONDONTWRITEBYTECODE': '1'}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-m', scenario.module, *scenario.args],
+        cwd=home,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return parse_importtime(result.stderr)
+
+
+def measure(scenario: Scenario, repeat: int, home: str) -> Measurement:
+    """Measure a scenario, keeping the fastest run."""
+    best: dict[str, float] | None = None
+    for _ in range(repeat):
+        modules = run_once(scenario, home)
+        if best is None or sum(modules.values()) < sum(best.values()):
+            best = modules
+    modules = best or {}
+    violations = [
+        forbidden for forbidden in scenario.forbidden
+        if any(name == forbidden or name.startswith(forbidden + '.') for name in modules)
+    ]
+    return Measurement(scenario, sum(modules.values()), modules, violations)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per scenario (best is kept)')
+    parser.add_argument('--budget-scale', type=float, default=1.0, help='Multiply all budgets')
+    parser.add_argument('--top', type=int, default=5, help='Slowest modules to show per scenario')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    failed = False
+    results = []
+    with tempfile.TemporaryDirectory(prefix='tap-launcher-importtime-') as home:
+        for scenario in SCENARIOS:
+            m = measure(scenario, args.repeat, home)
+            budget = scenario.budget_ms * args.budget_scale
+            ok = not m.violations and m.total_ms <= budget
+            failed |= not ok
+            top = sorted(m.modules.items(), key=lambda item: item[1], reverse=True)[:args.top]
+            results.append({
+                'scenario': scenario.name,
+                'total_ms': round(m.total_ms, 2),
+                'budget_ms': budget,
+                'modules': len(m.modules),
+                'forbidden_imported': m.violations,
+                'slowest': {name: round(ms, 2) for name, ms in top},
+                'ok': ok,
+            })
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        for r in results:
+            status = 'ok  ' if r['ok'] else 'FAIL'
+            sys.stdout.write(
+                f"{status} {r['scenario']:<22} {r['total_ms']:8.2f} ms / {r['budget_ms']:.0f} ms  "
+                f"({r['modules']} modules)\n"
+            )
+            for name in r['forbidden_imported']:
+                sys.stdout.write(f'       forbidden import: {name}\n')
+            slowest = ', '.join(f'{name} {ms:.1f}' for name, ms in r['slowest'].items())
+            sys.stdout.write(f'       slowest: {slowest}\n')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""Event-thread cost of logging: synchronous file handler vs the queue pipeline.
+
+Measures how long a ``logger.info`` call blocks the calling thread — the
+keyboard event thread in the launcher — for:
+
+- ``sync``: the previous setup, a ``FileHandler`` formatting each record with
+  ``datetime.fromtimestamp(...).isoformat()`` on the calling thread;
+- ``queue``: ``setup_logging_handler`` (records are enqueued, a listener
+  thread formats with the cached-second formatter and writes);
+- ``queue+rotate``: the same with a small ``max_bytes`` so that rotation and
+  background compression happen during the run.
+
+Formatter cost alone is reported as well.
+
+Usage:
+    python benchmarks/logging_overhead.py
+    python benchmarks/logging_overhead.py --records 50000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from common.logging_utils import ISOFormatter  # noqa: E402
+from common.logging_utils import LogRotation  # noqa: E402
+from common.logging_utils import setup_logging_handler  # noqa: E402
+from common.logging_utils import shutdown_logging  # noqa: E402
+
+
+class LegacyISOFormatter(logging.Formatter):
+    """The formatter as it was before timestamp caching."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp = datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds')
+        return f'{timestamp} {record.levelname} [{record.module}:{record.lineno}]: {record.getMessage()}'
+
+
+def _log_calls(logger: logging.Logger, records: int, interval: float) -> list[int]:
+    """Return the calling-thread duration of each log call in nanoseconds.
+
+    Calls are spaced by ``interval`` seconds, like log lines between key
+    events; a zero interval measures a tight burst instead.
+    """
+    durations = []
+    perf = time.perf_counter_ns
+    for i in range(records):
+        start = perf()
+        logger.info(f'Tap detected: Switch layout (keys: ctrl_l+shift_l, duration: 0.{i % 1000:03d}s)')
+        durations.append(perf() - start)
+        if interval:
+            time.sleep(interval)
+    return durations
+
+
+def _summary(durations: list[int]) -> dict[str, float]:
+    ordered = sorted(durations)
+    return {
+        'mean_us': round(sum(ordered) / len(ordered) / 1000, 3),
+        'p50_us': round(ordered[len(ordered) // 2] / 1000, 3),
+        'p99_us': round(ordered[int(len(ordered) * 0.99)] / 1000, 3),
+        'max_us': round(ordered[-1] / 1000, 3),
+    }
+
+
+def run_sync(log_file: Path, records: int, interval: float) -> dict[str, float]:
+    logger = logging.getLogger('bench.sync')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = logging.FileHandler(log_file)
+    handler.setFormatter(LegacyISOFormatter())
+    logger.addHandler(handler)
+    try:
+        return _summary(_log_calls(logger, records, interval))
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def run_queue(log_file: Path, records: int, interval: float, rotation: LogRotation | None) -> dict[str, float]:
+    name = 'bench.queue_rotate' if rotation else 'bench.queue'
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    setup_logging_handler(logger, 'INFO', foreground=False, log_file=log_file, rotation=rotation)
+    return _summary(_log_calls(logger, records, interval))
+
+
+def run_formatters(records: int) -> dict[str, float]:
+    record = logging.LogRecord('bench', logging.INFO, __file__, 1, 'Executing: setxkbmap us', None, None)
+    results = {}
+    for label, formatter in (('legacy', LegacyISOFormatter()), ('cached', ISOFormatter())):
+        start = time.perf_counter_ns()
+        for _ in range(records):
+            formatter.format(record)
+        results[f'{label}_ns'] = round((time.perf_counter_ns() - start) / records, 1)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=10000, help='Log calls per scenario')
+    parser.add_argument(
+        '--interval-us', type=float, default=100.0, help='Pause between log calls (0 = tight burst)'
+    )
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='tap-launcher-logbench-') as tmp:
+        tmp_dir = Path(tmp)
+        interval = args.interval_us / 1_000_000
+        results = {
+            'sync': run_sync(tmp_dir / 'sync.log', args.records, interval),
+            'queue': run_queue(tmp_dir / 'queue.log', args.records, interval, None),
+            'queue+rotate': run_queue(
+                tmp_dir / 'rotate.log', args.records, interval, LogRotation(max_bytes=256 * 1024, backup_count=3)
+            ),
+        }
+        formatters = run_formatters(args.records)
+        # Drain listeners before the directory is removed
+        shutdown_logging()
+
+    if args.json:
+        json.dump({'log_call': results, 'format': formatters}, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return 0
+    sys.stdout.write(f'Calling-thread time per logger.info ({args.records} records):\n')
+    for name, r in results.items():
+        sys.stdout.write(
+            f"  {name:<13} mean {r['mean_us']:7.2f} us  p50 {r['p50_us']:7.2f} us  "
+            f"p99 {r['p99_us']:7.2f} us  max {r['max_us']:9.2f} us\n"
+        )
+    sys.stdout.write(
+        f"Formatter: legacy {formatters['legacy_ns']:.0f} ns, cached {formatters['cached_ns']:.0f} ns per record\n"
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,13 +4,14 @@ This module provides backend abstraction for keyboard event handling,
 allowing tap_detector and tap_launcher to work on both X11 and Wayland.
 """
 
-from .base import BackendNotAvailableError, KeyboardBackend
+from .base import BackendNotAvailableError, DeviceInfo, KeyboardBackend
 from .detector import create_backend
 from .device_listing import list_keyboard_devices
 
 __all__ = [
     'KeyboardBackend',
     'BackendNotAvailableError',
+    'DeviceInfo',
     'create_backend',
     'list_keyboard_devices',
 ]
@@ -5,9 +5,45 @@ Using Protocol instead of ABC allows for structural subtyping (duck typing + typ
 without requiring explicit inheritance.
 """
 
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
 from typing import Any, Callable, Protocol
 
 
+@dataclass(frozen=True)
+class DeviceInfo:
+    """Identity of an input device, used to scope hotkeys to devices.
+
+    Attributes:
+        name: Device name reported by the kernel (e.g., "Keychron K2")
+        vendor: USB/Bluetooth vendor id
+        product: USB/Bluetooth product id
+        path: Device node (e.g., "/dev/input/event3")
+    """
+    name: str
+    vendor: int = 0
+    product: int = 0
+    path: str = ''
+
+    def matches(self, pattern: str) -> bool:
+        """Check if the device matches a ``devices`` entry of a hotkey.
+
+        ``"vvvv:pppp"`` (hexadecimal) matches vendor and product ids;
+        anything else matches the name, case-insensitively, with ``*`` and
+        ``?`` wildcards.
+        """
+        vendor, sep, product = pattern.partition(':')
+        if sep:
+            try:
+                return (int(vendor, 16), int(product, 16)) == (self.vendor, self.product)
+            except ValueError:
+                pass
+        return fnmatchcase(self.name.lower(), pattern.lower())
+
+    def __str__(self) -> str:
+        return f'{self.name} ({self.vendor:04x}:{self.product:04x})'
+
+
 class KeyboardBackend(Protocol):
     """Protocol for keyboard event sources.
     
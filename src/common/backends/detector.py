@@ -10,7 +10,6 @@ from typing import Any
 from common.logging_utils import get_logger
 
 from .base import BackendNotAvailableError, KeyboardBackend
-from .evdev_backend import EvdevBackend
 
 
 logger = get_logger('common.backend')
@@ -62,6 +61,9 @@ def create_backend(
             f'Always using evdev backend.'
         )
     
+    # Imported here: evdev is only needed by commands that read keyboards
+    from .evdev_backend import EvdevBackend  # noqa: PLC0415
+
     try:
         backend = EvdevBackend(**kwargs)
         logger.info(f'Created backend: {backend.get_backend_name()}')
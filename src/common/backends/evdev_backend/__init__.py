@@ -9,17 +9,27 @@ import atexit
 import os
 import queue
 import signal
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 from contextlib import suppress
 
-from ..base import BackendNotAvailableError
+from common.backends.base import BackendNotAvailableError, DeviceInfo
 from .device_manager import DeviceManager
 from .event_router import EventRouter
 from .key_state import KeyState
-from .parser import parse_event
+from .parser import EventParser
 from .processor import EventProcessor
-from .types import ParsedEvent
+from .remap import KEY_CNT
+from .remap import compile_remap
+from .remap import remap_targets
+from .timers import DeadlineScheduler
+from .timers import TimerHandle
 from .uinput_writer import UInputWriter
+from .wakeup import Wakeup
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .types import ParsedEvent
 
 
 class EvdevBackend:
@@ -36,8 +46,22 @@ class EvdevBackend:
         self.uinput_device: UInputWriter | None = None
         import threading
         self._stop_event = threading.Event()
+        self._wakeup: Wakeup | None = None
         self._device_threads: list[threading.Thread] = []
         self._event_queue: queue.Queue[tuple[Any, Any]] = queue.Queue(maxsize=1000)
+        self._device_manager: DeviceManager | None = None
+        self._processor: EventProcessor | None = None
+        self._router: EventRouter | None = None
+        self._timers = DeadlineScheduler()
+        self._key_observer: Callable[[int, str], None] | None = None
+        # Optional: returns (on_press, on_release) for each device, so taps
+        # on different keyboards are tracked separately (see TapMonitor.bind_devices)
+        self.device_binder: (
+            Callable[[list[DeviceInfo]], list[tuple[Callable[[Any], None], Callable[[Any], None]]]] | None
+        ) = None
+        # Optional: returns the static remapping ``{source: target}`` (key
+        # names) of each device; applied to its events before anything else
+        self.key_remapper: Callable[[DeviceInfo], dict[str, str]] | None = None
 
         # Per-device/press key state
         self.key_state = KeyState(self.logger)
@@ -69,13 +93,13 @@ class EvdevBackend:
             EvdevBackend._cleanup_registered = True
 
     # -------------- uinput creation --------------
-    def _create_uinput_device(self) -> None:
+    def _create_uinput_device(self, extra_keys: Iterable[int] = ()) -> None:
         if self.uinput_device is not None:
             return
         if not self.devices:
             raise RuntimeError('Cannot create uinput: no devices initialized')
         try:
-            self.uinput_device = UInputWriter.create_from_devices(self.devices, self.logger)
+            self.uinput_device = UInputWriter.create_from_devices(self.devices, self.logger, extra_keys)
         except OSError as e:
             self.logger.error(
                 f'Failed to create uinput device: {e}. '
@@ -94,6 +118,9 @@ class EvdevBackend:
 
     def _cleanup_devices(self) -> None:
         self._stop_event.set()
+        if self._wakeup is not None:
+            self._wakeup.set()
+        self._wake_event_loop()
 
         self._release_pressed_keys()
 
@@ -102,11 +129,16 @@ class EvdevBackend:
                 self.uinput_device.close()
             self.uinput_device = None
 
+        # Readers wake up through the wakeup fd; the timeout only guards
+        # against a reader stuck outside poll()
         for thread in self._device_threads:
             if thread.is_alive():
                 with suppress(Exception):
                     thread.join(timeout=0.2)
         self._device_threads.clear()
+        if self._wakeup is not None:
+            self._wakeup.close()
+            self._wakeup = None
         for device in self.devices:
             with suppress(Exception):
                 if hasattr(device, 'ungrab'):
@@ -115,6 +147,11 @@ class EvdevBackend:
                 device.close()
         self.devices.clear()
 
+    def _wake_event_loop(self) -> None:
+        """Unblock the event loop so it notices the stop event."""
+        with suppress(queue.Full):
+            self._event_queue.put_nowait((None, None))
+
     def _release_pressed_keys(self) -> None:
         if not self.uinput_device or not self.key_state.pressed_keys:
             return
@@ -133,6 +170,7 @@ class EvdevBackend:
         import evdev
         # Resolve devices via DeviceManager
         dm = DeviceManager(self.logger)
+        self._device_manager = dm
         if self.device_path:
             try:
                 device = evdev.InputDevice(self.device_path)
@@ -163,9 +201,12 @@ class EvdevBackend:
         if not grabbed_devices:
             raise BackendNotAvailableError('Failed to grab any keyboard devices. All devices may be busy.')
 
+        # Remap targets the keyboards lack must be keys of the uinput device
+        remap_tables, remap_names = self._compile_remap()
+
         # Create uinput
         try:
-            self._create_uinput_device()
+            self._create_uinput_device(remap_targets(remap_tables))
         except OSError:
             for device in grabbed_devices:
                 with suppress(Exception):
@@ -178,7 +219,10 @@ class EvdevBackend:
         try:
             # Start reader threads via DeviceManager
             self.logger.info(f'Starting event read threads for {len(self.devices)} device(s)...')
-            self._device_threads = dm.start_reader_threads(self.devices, self._event_queue.put, self._stop_event)
+            self._wakeup = Wakeup()
+            self._device_threads = dm.start_reader_threads(
+                self.devices, self._event_queue.put, self._stop_event, self._wakeup.fileno()
+            )
 
             # Run router with processor
             processor = EventProcessor(
@@ -186,12 +230,17 @@ class EvdevBackend:
                 key_state=self.key_state,
                 uinput_writer=self.uinput_device,
             )
+            processor.set_remap(remap_tables, remap_names)
             router = EventRouter(
                 logger=self.logger,
-                parse_event=parse_event,
+                parse_event=EventParser(),
                 handle_unknown=processor.handle_unknown,
-                handle_value=lambda evt: processor.process(evt, on_press, on_release),
+                handle_value=self._value_handler(processor, on_press, on_release),
+                timers=self._timers,
             )
+            processor.observer = self._key_observer
+            self._processor = processor
+            self._router = router
             router.run(self._event_queue.get, self._stop_event)
         except Exception as e:
             self.logger.error(f'Error in main event loop: {e}')
@@ -201,6 +250,62 @@ class EvdevBackend:
         finally:
             self._cleanup_devices()
 
+    def _device_infos(self) -> list[DeviceInfo]:
+        return [
+            DeviceInfo(device.name, device.info.vendor, device.info.product, str(device.path))
+            for device in self.devices
+        ]
+
+    def _compile_remap(self) -> tuple[dict[int, list[int] | None], list[str | None]]:
+        """Compile the remapping of each device (see ``key_remapper``) into keycode tables.
+
+        Returns:
+            tuple: Tables by device id and key names of the targets (see
+                ``EventProcessor.set_remap``); no tables without a ``key_remapper``
+        """
+        names: list[str | None] = [None] * KEY_CNT
+        tables: dict[int, list[int] | None] = {}
+        remapper = self.key_remapper
+        if remapper is None:
+            return tables, names
+        for device, info in zip(self.devices, self._device_infos(), strict=True):
+            mapping = remapper(info)
+            table = compile_remap(mapping, names, self.logger) if mapping else None
+            tables[device.fileno()] = table
+            if table is not None:
+                remapped = ', '.join(f'{source} → {target}' for source, target in sorted(mapping.items()))
+                self.logger.info(f'Remapping keys of {info}: {remapped}')
+        return tables, names
+
+    def _value_handler(
+        self,
+        processor: EventProcessor,
+        on_press: Callable[[Any], None],
+        on_release: Callable[[Any], None],
+    ) -> Callable[[ParsedEvent], None]:
+        """Return the router's handler of key events, with callbacks bound per device.
+
+        With a single device (or no ``device_binder``) the callbacks are
+        fixed, so dispatch does no lookup; otherwise each event picks the
+        callbacks of its device by id.
+        """
+        if self.device_binder is None:
+            return lambda evt: processor.process(evt, on_press, on_release)
+        infos = self._device_infos()
+        bound = self.device_binder(infos)
+        if len(bound) > 1:
+            self.logger.info(f"Tracking taps per device: {', '.join(str(info) for info in infos)}")
+        if len(bound) == 1:
+            press, release = bound[0]
+            return lambda evt: processor.process(evt, press, release)
+        by_id = {device.fileno(): callbacks for device, callbacks in zip(self.devices, bound, strict=True)}
+        fallback = (on_press, on_release)
+
+        def handle(evt: ParsedEvent) -> None:
+            press, release = by_id.get(evt.device_id, fallback)
+            processor.process(evt, press, release)
+        return handle
+
     def stop(self) -> None:
         self.logger.info('Stopping evdev keyboard listener')
         self._stop_event.set()
@@ -208,6 +313,108 @@ class EvdevBackend:
         if hasattr(EvdevBackend, '_instances'):
             EvdevBackend._instances.discard(self)
 
+    def call_soon(self, callback: Callable[[], None], timeout: float = 1.0) -> None:
+        """Run a callable on the event thread.
+
+        Use this from other threads (e.g. the control socket) to mutate
+        backend or tap state without locks: the callable is queued behind
+        pending keyboard events and executed by the event loop.
+
+        Args:
+            callback: Callable without arguments
+            timeout: Maximum time to wait for space in the event queue
+
+        Raises:
+            queue.Full: If the event queue stays full for ``timeout`` seconds
+        """
+        self._event_queue.put((None, callback), timeout=timeout)
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        """Run a callable on the event thread after ``delay`` seconds.
+
+        Call on the event thread (from tap callbacks or a ``call_soon``
+        callable); the timer wakes the event loop itself, so no helper
+        thread is involved.
+
+        Args:
+            delay: Seconds from now
+            callback: Callable without arguments
+
+        Returns:
+            TimerHandle: Handle whose ``cancel()`` disarms the timer
+        """
+        return self._timers.call_later(delay, callback)
+
+    def set_key_observer(self, observer: Callable[[int, str], None] | None) -> None:
+        """Install or remove an observer of named key presses/releases.
+
+        The observer receives ``(value, key_name)`` with value 1 for press and
+        0 for release, before tap callbacks run. Call on the event thread
+        (or before ``start``).
+
+        Args:
+            observer: Callable, or None to remove the observer
+        """
+        self._key_observer = observer
+        if self._processor is not None:
+            self._processor.observer = observer
+
+    def suspend(self) -> bool:
+        """Stop handling events and ungrab devices (call on the event thread).
+
+        Pressed keys are released through uinput first, so nothing stays stuck
+        while the desktop receives events directly from the keyboards.
+
+        Returns:
+            bool: True if the backend was suspended, False if it already was
+        """
+        if self._router is None or self._router.suspended:
+            return False
+        self._release_pressed_keys()
+        if self._device_manager is not None:
+            self._device_manager.ungrab_all(self.devices)
+        self._router.suspended = True
+        self.logger.info('Keyboard grabbing suspended')
+        return True
+
+    def resume(self) -> bool:
+        """Grab devices again and resume handling events (call on the event thread).
+
+        Returns:
+            bool: True if the backend was resumed, False if it was not suspended
+        """
+        if self._router is None or not self._router.suspended:
+            return False
+        if self._device_manager is not None:
+            self._device_manager.grab_all(self.devices)
+        self.key_state.pressed_keys.clear()
+        self.key_state.suppressed_keys.clear()
+        self.key_state.buffered_presses.clear()
+        self._router.suspended = False
+        self.logger.info('Keyboard grabbing resumed')
+        return True
+
+    def is_suspended(self) -> bool:
+        """Return True if event handling is suspended."""
+        return self._router is not None and self._router.suspended
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return live backend counters.
+
+        Counters are plain integers updated by the event thread only, so
+        reading them from another thread needs no locking.
+        """
+        router = self._router
+        processor = self._processor
+        return {
+            'devices': [{'name': d.name, 'path': d.path} for d in self.devices],
+            'suspended': self.is_suspended(),
+            'events_total': router.events_total if router else 0,
+            'key_events': processor.key_events if processor else 0,
+            'suppressed_events': processor.suppressed_events if processor else 0,
+            'queue_depth': self._event_queue.qsize(),
+        }
+
     def suppress_key(self, key_name: str) -> None:
         """Suppress a key by its canonical name.
 
@@ -216,6 +423,27 @@ class EvdevBackend:
         """
         self.key_state.mark_suppressed_for_active(key_name)
 
+    def buffer_key(self, key_name: str) -> None:
+        """Hold back the press of a key until ``restore_key()`` or ``suppress_key()``.
+
+        Call from the press callback: the press is not emitted, and neither
+        are its repeats.
+
+        Args:
+            key_name: Canonical key name (e.g., 'ctrl_l', 'delete')
+        """
+        self.key_state.mark_buffered_for_active(key_name)
+
+    def restore_key(self, key_name: str) -> None:
+        """Emit the press held back by ``buffer_key()``; later events pass through.
+
+        Args:
+            key_name: Canonical key name (e.g., 'ctrl_l', 'delete')
+        """
+        for _dev_id, keycode in self.key_state.take_buffered(key_name):
+            if self.uinput_device:
+                self.uinput_device.emit_press(keycode)
+
     def get_backend_name(self) -> str:
         """Return the name of this backend for logging and debugging.
 
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import select
 from contextlib import suppress
 from typing import Any, Iterable, Callable
 
 import evdev
 from evdev import ecodes
 
+from common.metrics import REGISTRY
+
+EVENTS_READ = REGISTRY.counter(
+    'tap_launcher_events_read_total',
+    'Input events read from each device (including sync events)',
+    ('device', 'path'),
+)
+
 
 class DeviceManager:
     def __init__(self, logger: Any) -> None:
@@ -69,18 +78,20 @@ class DeviceManager:
         devices: Iterable[Any],
         queue_put: Callable[[tuple[Any, Any]], None],
         stop_event,
+        wakeup_fd: int,
     ) -> list[Any]:
         """Start reader threads for devices.
 
         queue_put: Callable that accepts (device, event). Should raise queue.Full on overflow.
         stop_event: threading.Event-like with is_set().
+        wakeup_fd: Fd that becomes readable on shutdown; readers exit as soon as it does.
         """
         import threading
         threads = []
         for dev in devices:
             t = threading.Thread(
                 target=self._reader_loop,
-                args=(dev, queue_put, stop_event),
+                args=(dev, queue_put, stop_event, wakeup_fd),
                 daemon=True,
                 name=f'evdev-read-{dev.name}'
             )
@@ -88,18 +99,32 @@ class DeviceManager:
             threads.append(t)
         return threads
 
-    def _reader_loop(self, device: Any, queue_put, stop_event) -> None:
+    def _reader_loop(self, device: Any, queue_put, stop_event, wakeup_fd: int) -> None:
+        # Wait on the device and the wakeup fd together, so shutdown does not
+        # depend on the next key event arriving
+        poller = select.poll()
+        poller.register(device.fd, select.POLLIN)
+        poller.register(wakeup_fd, select.POLLIN)
+        # Each reader thread counts into its own metrics shard
+        counts = REGISTRY.shard().values
+        read_slot = EVENTS_READ.slot(device.name, str(device.path))
         try:
-            for event in device.read_loop():
-                if stop_event.is_set():
+            while not stop_event.is_set():
+                ready = poller.poll()
+                if any(fd == wakeup_fd for fd, _mask in ready):
                     break
                 try:
-                    queue_put((device, event))
-                except Exception as e:  # catch queue.Full if propagated
-                    self.logger.warning(f'Event queue put failed for {device.name}: {e}')
+                    events = device.read()
+                except BlockingIOError:
+                    continue
+                for event in events:
+                    counts[read_slot] += 1
+                    try:
+                        queue_put((device, event))
+                    except Exception as e:  # catch queue.Full if propagated
+                        self.logger.warning(f'Event queue put failed for {device.name}: {e}')
         except OSError as e:
-            self.logger.error(f'Error reading from device {device.name}: {e}')
+            if not stop_event.is_set():
+                self.logger.error(f'Error reading from device {device.name}: {e}')
         except Exception as e:  # noqa: BLE001
             self.logger.error(f'Unexpected error in read loop for {device.name}: {e}')
-
-
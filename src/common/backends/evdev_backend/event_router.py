@@ -1,23 +1,50 @@
 from __future__ import annotations
 
-from typing import Any
 import queue
+from typing import TYPE_CHECKING
+from typing import Any
+
+from .timers import DeadlineScheduler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 class EventRouter:
-    def __init__(self, logger: Any, parse_event, handle_unknown, handle_value) -> None:
+    """Main event loop: pulls raw events from the queue and dispatches them.
+
+    Queue items are ``(device, event)`` pairs from reader threads. An item with
+    ``device=None`` carries a callable posted by ``EvdevBackend.call_soon`` and
+    is executed on the event thread, which keeps all state mutations there;
+    ``(None, None)`` only wakes the loop up (used on shutdown).
+
+    Timers armed in ``timers`` run on the same thread: the loop waits on the
+    queue only until the earliest deadline. With no timer armed it blocks
+    without a timeout, so an idle launcher never wakes.
+    """
+
+    def __init__(
+        self, logger: Any, parse_event, handle_unknown, handle_value, timers: DeadlineScheduler | None = None
+    ) -> None:
         self.logger = logger
+        self.timers = timers if timers is not None else DeadlineScheduler()
         self._parse_event = parse_event
         self._handle_unknown = handle_unknown
         self._handle_value = handle_value
+        self.events_total = 0
+        self.suspended = False
 
     def run(self, queue_get, stop_event) -> None:
         event_count = 0
         self.logger.info('Starting main event processing loop...')
         while not stop_event.is_set():
-            try:
-                device, event = queue_get(timeout=0.1)
-            except queue.Empty:
+            device, event = self._next_item(queue_get)
+            if device is None:
+                if event is not None:
+                    self._run_call(event)
+                continue
+            self.events_total += 1
+            if self.suspended:
                 continue
             try:
                 event_count += 1
@@ -41,4 +68,30 @@ class EventRouter:
                 self.logger.debug(traceback.format_exc())
                 continue
 
+    def _next_item(self, queue_get: Callable[..., tuple[Any, Any]]) -> tuple[Any, Any]:
+        """Wait for the next queue item, or run due timers and return a wake-only item."""
+        delay = self.timers.next_delay()
+        if delay is None:
+            return queue_get()
+        if delay > 0:
+            try:
+                return queue_get(timeout=delay)
+            except queue.Empty:
+                pass
+        self._run_timers()
+        return None, None
+
+    def _run_timers(self) -> None:
+        for callback in self.timers.pop_due():
+            self._run_call(callback)
+
+    def _run_call(self, callback: Callable[[], object]) -> None:
+        """Run a callable posted to the event loop, logging any errors."""
+        try:
+            callback()
+        except Exception as e:  # noqa: BLE001
+            self.logger.error(f'Error in event loop call: {e}')
+            import traceback
+            self.logger.debug(traceback.format_exc())
+
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Set, Tuple
 
+from ..key_mapping import key_name_to_evdev_code
+
 DeviceId = int
 KeyRef = Tuple[DeviceId, int]
 
@@ -27,19 +29,57 @@ class KeyState:
     def mark_suppressed_for_active(self, key_name: str) -> None:
         """Mark all currently pressed keys with the given name for suppression.
 
+        A buffered press of the key is dropped for good.
+
         Args:
             key_name: Canonical key name (e.g., 'ctrl_l', 'delete')
         """
-        from ..key_mapping import key_name_to_evdev_code
         try:
             keycode = key_name_to_evdev_code(key_name)
             to_mark = [ref for ref in self.pressed_keys if ref[1] == keycode]
             for ref in to_mark:
                 self.suppressed_keys.add(ref)
+                self.buffered_presses.discard(ref)
             self.logger.debug(f'Suppressing keycode {keycode} (key: {key_name}, active presses: {len(to_mark)})')
         except KeyError:
             self.logger.warning(f'Cannot suppress key {key_name}: no evdev mapping')
 
+    def mark_buffered_for_active(self, key_name: str) -> None:
+        """Hold back the presses of all currently pressed keys with the given name.
+
+        A buffered key is suppressed like a marked one until
+        ``take_buffered()`` restores it or ``mark_suppressed_for_active()``
+        drops it.
+
+        Args:
+            key_name: Canonical key name (e.g., 'ctrl_l', 'delete')
+        """
+        try:
+            keycode = key_name_to_evdev_code(key_name)
+        except KeyError:
+            self.logger.warning(f'Cannot buffer key {key_name}: no evdev mapping')
+            return
+        for ref in self.pressed_keys:
+            if ref[1] == keycode and ref not in self.suppressed_keys:
+                self.suppressed_keys.add(ref)
+                self.buffered_presses.add(ref)
+
+    def take_buffered(self, key_name: str) -> list[KeyRef]:
+        """Stop buffering a key; return the references whose press must be emitted now.
+
+        Args:
+            key_name: Canonical key name (e.g., 'ctrl_l', 'delete')
+        """
+        try:
+            keycode = key_name_to_evdev_code(key_name)
+        except KeyError:
+            return []
+        refs = [ref for ref in self.buffered_presses if ref[1] == keycode]
+        for ref in refs:
+            self.buffered_presses.discard(ref)
+            self.suppressed_keys.discard(ref)
+        return refs
+
     def is_suppressed(self, ref: KeyRef, value: int) -> bool:
         """Check if a key event should be suppressed.
 
@@ -1,11 +1,52 @@
+"""Parsing of raw evdev events into ``ParsedEvent`` records.
+
+``parse_event`` builds a new record per event. The event loop uses
+``EventParser`` instead, which allocates nothing per event in the steady
+state: key names come from a table indexed by keycode (built once, with the
+same ``categorize`` / ``evdev_to_key_name`` lookup), key refs are cached per
+device and keycode, and every event is written into one reused record.
+"""
+
 from __future__ import annotations
 
+from functools import cache
 from typing import Any
-from evdev import ecodes, categorize
+from evdev import InputEvent, ecodes, categorize
 
-from .types import ParsedEvent
+from .types import DeviceId, KeyRef, ParsedEvent
 from ..key_mapping import evdev_to_key_name
 
+_KEY_CNT = ecodes.KEY_CNT
+
+# Key refs by device id, then by keycode (filled in on first use)
+_KEY_REFS: dict[DeviceId, list[KeyRef | None]] = {}
+
+
+def _key_name(event: Any) -> str | None:
+    try:
+        return evdev_to_key_name(categorize(event).keycode)
+    except Exception:
+        return None
+
+
+@cache
+def key_names() -> list[str | None]:
+    """Return the key name of every keycode below ``KEY_CNT`` (None if unknown)."""
+    return [_key_name(InputEvent(0, 0, ecodes.EV_KEY, code, 1)) for code in range(_KEY_CNT)]
+
+
+def key_ref(device_id: DeviceId, keycode: int) -> KeyRef:
+    """Return the ``(device_id, keycode)`` ref of a key, the same tuple every time."""
+    refs = _KEY_REFS.get(device_id)
+    if refs is None:
+        refs = _KEY_REFS[device_id] = [None] * _KEY_CNT
+    if keycode >= _KEY_CNT:
+        return (device_id, keycode)
+    ref = refs[keycode]
+    if ref is None:
+        ref = refs[keycode] = (device_id, keycode)
+    return ref
+
 
 def parse_event(device: Any, event: Any) -> ParsedEvent | None:
     """Parse raw evdev event into ParsedEvent.
@@ -14,16 +55,40 @@ def parse_event(device: Any, event: Any) -> ParsedEvent | None:
     """
     if event.type != ecodes.EV_KEY:
         return None
-    key_event = categorize(event)
     keycode = event.code
     value = event.value
     device_id = device.fileno() if hasattr(device, 'fileno') else id(device)
-    key_ref = (device_id, keycode)
-    key_name: str | None
-    try:
-        key_name = evdev_to_key_name(key_event.keycode)
-    except Exception:
-        key_name = None
-    return ParsedEvent(device_id, key_ref, keycode, value, key_name)
+    return ParsedEvent(device_id, (device_id, keycode), keycode, value, _key_name(event))
+
+
+class EventParser:
+    """Parse raw evdev events into a single, reused ``ParsedEvent``.
+
+    The returned record is only valid until the next call: consumers must
+    copy the fields they keep. Runs on the event thread only.
+    """
 
+    def __init__(self) -> None:
+        self._names = key_names()
+        self._record = ParsedEvent(0, (0, 0), 0, 0, None)
+        # Id of the device of the previous event (events come in bursts per device)
+        self._device: Any = None
+        self._device_id: DeviceId = 0
 
+    def __call__(self, device: Any, event: Any) -> ParsedEvent | None:
+        """Parse ``event`` from ``device``; None for non-keyboard events."""
+        if event.type != ecodes.EV_KEY:
+            return None
+        keycode = event.code
+        if device is self._device:
+            device_id = self._device_id
+        else:
+            device_id = self._device_id = device.fileno() if hasattr(device, 'fileno') else id(device)
+            self._device = device
+        record = self._record
+        record.device_id = device_id
+        record.key_ref = key_ref(device_id, keycode)
+        record.keycode = keycode
+        record.value = event.value
+        record.key_name = self._names[keycode] if keycode < _KEY_CNT else _key_name(event)
+        return record
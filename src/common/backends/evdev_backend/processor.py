@@ -3,8 +3,21 @@ from __future__ import annotations
 import logging
 from typing import Any, Callable
 
+from common import flight_recorder as fr
+from common.metrics import REGISTRY
+
+from .parser import key_ref as cached_key_ref
 from .types import ParsedEvent, KeyRef
 
+KEY_EVENTS = REGISTRY.counter(
+    'tap_launcher_key_events_total',
+    'Key events handled, by whether they were passed through or suppressed',
+    ('action',),
+)
+
+# Input event value → flight recorder stage
+_TRACE_STAGES = {1: fr.KEY_PRESS, 0: fr.KEY_RELEASE, 2: fr.KEY_REPEAT}
+
 
 class EventProcessor:
     """Processes keyboard events and handles suppression, callbacks, and emission."""
@@ -18,20 +31,70 @@ class EventProcessor:
         self.logger = logger
         self.key_state = key_state
         self.uinput_writer = uinput_writer
+        self.key_events = 0
+        self.suppressed_events = 0
+        # Optional observer of named press/release events: (value, key_name).
+        # None when nobody listens, so the hot path only pays the check in ``_observe``.
+        self.observer: Callable[[int, str], None] | None = None
+        # Static key remapping (see ``set_remap``): tables indexed by device
+        # id, then by keycode. None when no key is remapped.
+        self.remap_tables: list[list[int] | None] | None = None
+        self.remap_names: list[str | None] = []
+        # Created on the event thread, so this is the event thread's shard
+        self._counts = REGISTRY.shard().values
+        self._passthrough_slot = KEY_EVENTS.slot('passthrough')
+        self._suppressed_slot = KEY_EVENTS.slot('suppressed')
+        self._trace = fr.RECORDER.record
 
-    def _safe_call(self, label: str, fn: Callable[[Any], None], arg: Any) -> None:
+    def set_remap(self, tables: dict[int, list[int] | None], names: list[str | None]) -> None:
+        """Install compiled remapping tables (see ``remap.compile_remap``).
+
+        Args:
+            tables: Table of each device by device id (None for devices
+                without remapped keys); every bound device must be present
+            names: Key names by keycode, for the remapped codes
+        """
+        if not any(table is not None for table in tables.values()):
+            self.remap_tables = None
+            return
+        by_id: list[list[int] | None] = [None] * (max(tables) + 1)
+        for device_id, table in tables.items():
+            by_id[device_id] = table
+        self.remap_tables = by_id
+        self.remap_names = names
+
+    def _remap(self, evt: ParsedEvent) -> None:
+        """Replace the key of ``evt`` by the one it is remapped to on its device."""
+        assert self.remap_tables is not None
+        table = self.remap_tables[evt.device_id]
+        if table is not None:
+            code = table[evt.keycode]
+            if code != evt.keycode:
+                evt.keycode = code
+                evt.key_ref = cached_key_ref(evt.device_id, code)
+                evt.key_name = self.remap_names[code]
+
+    def _safe_call(self, label: str, fn: Callable[..., None], *args: Any) -> None:
         """Safely call a callback, logging any errors."""
         try:
-            fn(arg)
+            fn(*args)
         except Exception as e:
             self.logger.error(f'Error in {label} callback: {e}')
             import traceback
             self.logger.debug(traceback.format_exc())
 
+    def _observe(self, value: int, key_name: str) -> None:
+        """Report a named press or release to ``observer``, if any."""
+        observer = self.observer
+        if observer is not None:
+            self._safe_call('key observer', observer, value, key_name)
+
     def handle_unknown(self, evt: ParsedEvent) -> bool:
         """Fallback for unknown keycodes. Returns True if handled (consumed)."""
         if evt.key_name is not None:
             return False
+        self._counts[self._passthrough_slot] += 1
+        self._trace(_TRACE_STAGES.get(evt.value, fr.KEY_REPEAT), evt.keycode, fr.FLAG_UNKNOWN_KEY)
         if evt.value == 1:  # Press
             self.key_state.register_press(evt.key_ref)
             if self.uinput_writer:
@@ -60,32 +123,50 @@ class EventProcessor:
         """Process a parsed keyboard event.
 
         Handles key press/release/repeat events, calls callbacks, checks for suppression,
-        and emits events to the system if not suppressed.
+        and emits events to the system if not suppressed. A remapped key is
+        replaced first, so callbacks, suppression and emission all see the
+        key it is remapped to.
         """
+        if self.remap_tables is not None:
+            self._remap(evt)
         if self.handle_unknown(evt):
             return
 
+        self.key_events += 1
         key_ref: KeyRef = evt.key_ref
         keycode = evt.keycode
         value = evt.value
         key_name = evt.key_name
+        assert key_name is not None  # unknown keys were handled above
 
         if value == 1:  # Press
+            self._observe(value, key_name)
             self.key_state.register_press(key_ref)
             self._safe_call('on_press', on_press, key_name)
             if self.key_state.is_suppressed(key_ref, value):
-                self.logger.debug(f'Suppressing press: keycode={keycode}, key={key_name}')
+                self.logger.debug('Suppressing press: keycode=%d, key=%s', keycode, key_name)
+                self.suppressed_events += 1
+                self._counts[self._suppressed_slot] += 1
+                self._trace(fr.KEY_PRESS, keycode, fr.FLAG_SUPPRESSED)
                 return
+            self._counts[self._passthrough_slot] += 1
+            self._trace(fr.KEY_PRESS, keycode)
             if self.uinput_writer:
                 self.uinput_writer.emit_press(keycode)
 
         elif value == 0:  # Release
+            self._observe(value, key_name)
             self._safe_call('on_release', on_release, key_name)
             if self.key_state.is_suppressed(key_ref, value):
-                self.logger.debug(f'Suppressing release: keycode={keycode}, key={key_name}')
+                self.logger.debug('Suppressing release: keycode=%d, key=%s', keycode, key_name)
+                self.suppressed_events += 1
+                self._counts[self._suppressed_slot] += 1
+                self._trace(fr.KEY_RELEASE, keycode, fr.FLAG_SUPPRESSED)
                 self.key_state.discard_press(key_ref)
                 self.key_state.discard_buffered(key_ref)
                 return
+            self._counts[self._passthrough_slot] += 1
+            self._trace(fr.KEY_RELEASE, keycode)
             if self.uinput_writer:
                 self.uinput_writer.emit_release(keycode)
             self.key_state.discard_press(key_ref)
@@ -93,8 +174,13 @@ class EventProcessor:
 
         elif value == 2:  # Repeat
             if self.key_state.is_suppressed(key_ref, value):
-                self.logger.debug(f'Suppressing repeat: keycode={keycode}, key={key_name}')
+                self.logger.debug('Suppressing repeat: keycode=%d, key=%s', keycode, key_name)
+                self.suppressed_events += 1
+                self._counts[self._suppressed_slot] += 1
+                self._trace(fr.KEY_REPEAT, keycode, fr.FLAG_SUPPRESSED)
                 return
+            self._counts[self._passthrough_slot] += 1
+            self._trace(fr.KEY_REPEAT, keycode)
             if self.uinput_writer:
                 self.uinput_writer.emit_repeat(keycode)
 
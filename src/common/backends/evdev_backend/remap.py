@@ -0,0 +1,57 @@
+"""Static key remapping for the evdev backend.
+
+A remapping (e.g., caps_lock → ctrl_l) is compiled once, when the devices
+are bound, into a list indexed by keycode that holds the code to report
+instead (itself for keys left alone). ``EventProcessor`` then remaps an
+event with two list lookups: no dict or string work per event.
+
+The targets are added to the keys of the uinput device (``remap_targets``):
+the kernel drops codes a device does not advertise, so a target no grabbed
+keyboard has (e.g. f13) would otherwise never be reported.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from evdev import ecodes
+
+from common.backends.key_mapping import key_name_to_evdev_code
+from common.key_normalizer import normalize_key
+
+# Keycodes of EV_KEY events are below this
+KEY_CNT = ecodes.KEY_CNT
+
+
+def compile_remap(mapping: dict[str, str], names: list[str | None], logger: Any) -> list[int] | None:
+    """Compile a ``{source: target}`` remapping into a keycode-indexed table.
+
+    Args:
+        mapping: Key names of each remapped key and of its replacement
+        names: Key names by keycode; the names of the targets are filled in
+        logger: Logger for keys without an evdev code
+
+    Returns:
+        list[int] | None: Code to report for each keycode, or None if no key
+            is remapped
+    """
+    table = list(range(KEY_CNT))
+    remapped = False
+    for source, target in mapping.items():
+        try:
+            source_code = key_name_to_evdev_code(source)
+            target_code = key_name_to_evdev_code(target)
+        except KeyError as e:
+            logger.warning(f'Cannot remap {source} to {target}: {e}')
+            continue
+        table[source_code] = target_code
+        names[target_code] = normalize_key(target)
+        remapped = True
+    return table if remapped else None
+
+
+def remap_targets(tables: dict[int, list[int] | None]) -> set[int]:
+    """Return the codes that compiled tables report instead of another key."""
+    return {
+        code for table in tables.values() if table is not None for source, code in enumerate(table) if code != source
+    }
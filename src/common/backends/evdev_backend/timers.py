@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class TimerHandle:
+    """A scheduled callback; ``cancel()`` prevents it from running."""
+
+    __slots__ = ('callback', 'cancelled', 'deadline')
+
+    def __init__(self, deadline: float, callback: Callable[[], None]) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class DeadlineScheduler:
+    """Heap of deadlines run by the event loop between queue items.
+
+    Used only on the event thread, so it needs no locks. ``next_delay()``
+    tells the loop how long it may block on the event queue: ``None`` when no
+    timer is armed, so an idle loop still blocks without a timeout and never
+    wakes up. Cancelled timers stay in the heap until their deadline comes
+    up and are dropped then, so cancelling is O(1) and the heap never holds
+    more than the timers armed within the longest delay in use.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, TimerHandle]] = []
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def call_at(self, deadline: float, callback: Callable[[], None]) -> TimerHandle:
+        """Run ``callback`` once ``perf_counter()`` reaches ``deadline``."""
+        handle = TimerHandle(deadline, callback)
+        heapq.heappush(self._heap, (deadline, next(self._sequence), handle))
+        return handle
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        """Run ``callback`` after ``delay`` seconds."""
+        return self.call_at(perf_counter() + delay, callback)
+
+    def next_delay(self) -> float | None:
+        """Return seconds until the earliest timer (``None`` if none is armed)."""
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        return heap[0][0] - perf_counter()
+
+    def pop_due(self) -> list[Callable[[], None]]:
+        """Remove and return the callbacks of all expired timers, earliest first."""
+        heap = self._heap
+        now = perf_counter()
+        due = []
+        while heap and heap[0][0] <= now:
+            handle = heapq.heappop(heap)[2]
+            if not handle.cancelled:
+                due.append(handle.callback)
+        return due
@@ -12,9 +12,13 @@ class UInputWriter:
         self.logger = logger
 
     @staticmethod
-    def create_from_devices(devices: Iterable[Any], logger: Any) -> 'UInputWriter':
+    def create_from_devices(devices: Iterable[Any], logger: Any, extra_keys: Iterable[int] = ()) -> 'UInputWriter':
+        """Create a device with the keys of ``devices`` plus ``extra_keys`` (e.g. remap targets).
+
+        The kernel drops key events whose code the device does not advertise.
+        """
         from evdev import UInput
-        all_keys: set[int] = set()
+        all_keys: set[int] = set(extra_keys)
         for device in devices:
             caps = device.capabilities()
             if ecodes.EV_KEY in caps:
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import os
+from contextlib import suppress
+
+
+class Wakeup:
+    """One-shot wakeup file descriptor for blocking reader loops.
+
+    Reader threads poll their device fd together with ``fileno()``. After
+    ``set()`` the fd stays readable (it is never drained), so every reader
+    wakes up immediately instead of waiting for its next keyboard event.
+    Uses an eventfd on Linux and falls back to a self-pipe.
+    """
+
+    def __init__(self) -> None:
+        self._write_fd: int | None
+        if hasattr(os, 'eventfd'):
+            self._read_fd = os.eventfd(0, os.EFD_CLOEXEC | os.EFD_NONBLOCK)
+            self._write_fd = None
+        else:
+            self._read_fd, self._write_fd = os.pipe()
+            os.set_blocking(self._write_fd, False)
+        self._closed = False
+
+    def fileno(self) -> int:
+        return self._read_fd
+
+    def set(self) -> None:
+        """Make the wakeup fd readable (idempotent)."""
+        if self._closed:
+            return
+        with suppress(BlockingIOError):
+            if self._write_fd is None:
+                os.eventfd_write(self._read_fd, 1)
+            else:
+                os.write(self._write_fd, b'\0')
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        os.close(self._read_fd)
+        if self._write_fd is not None:
+            os.close(self._write_fd)
@@ -0,0 +1,114 @@
+"""Keyboard backend fed by a running tap-launcher daemon.
+
+Only one process can grab keyboard devices. Instead of stopping the
+launcher to let ``tap-detector`` read the keyboard, the detector subscribes
+to the launcher's key event stream over the control socket and receives
+the same press/release events the launcher sees. Launcher hotkeys stay
+active while the detector runs.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+from contextlib import suppress
+from typing import TYPE_CHECKING
+from typing import Any
+
+from common.control_socket import connect_control
+from common.logging_utils import get_logger
+from common.runtime_state import CONTROL_SOCKET
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+SUBSCRIBE_TIMEOUT = 1.0
+
+
+class LauncherStreamBackend:
+    """Receive key events from the tap-launcher event stream.
+
+    Use ``LauncherStreamBackend.attach()`` to create an instance; it returns
+    None when no launcher with an event stream is running.
+
+    Attributes:
+        launcher_pid: PID of the launcher serving the stream
+        suspended: Whether the launcher had released the keyboard when attaching
+            (a suspended launcher forwards no events)
+    """
+
+    def __init__(self, sock: socket.socket, launcher_pid: int | None, suspended: bool) -> None:
+        self.logger = get_logger('common.backends.stream')
+        self.launcher_pid = launcher_pid
+        self.suspended = suspended
+        self._sock: socket.socket | None = sock
+        self._reader = sock.makefile('rb')
+
+    @classmethod
+    def attach(cls, socket_path: Path = CONTROL_SOCKET) -> LauncherStreamBackend | None:
+        """Subscribe to the key event stream of a running launcher.
+
+        Args:
+            socket_path: Path of the launcher control socket
+
+        Returns:
+            LauncherStreamBackend: Attached backend, or None if no launcher is
+                running or it does not serve an event stream
+        """
+        sock = connect_control(socket_path, SUBSCRIBE_TIMEOUT)
+        if sock is None:
+            return None
+        try:
+            sock.sendall(b'{"cmd":"subscribe"}\n')
+            backend = cls(sock, None, False)
+            line = backend._reader.readline()
+            response = json.loads(line) if line else None
+        except (OSError, ValueError):
+            sock.close()
+            return None
+        if not isinstance(response, dict) or not response.get('ok'):
+            sock.close()
+            return None
+        sock.settimeout(None)
+        backend.launcher_pid = response.get('pid')
+        backend.suspended = bool(response.get('suspended', False))
+        return backend
+
+    def start(
+        self,
+        on_press: Callable[[Any], None],
+        on_release: Callable[[Any], None],
+    ) -> None:
+        """Dispatch streamed key events until the stream ends or stop() is called."""
+        try:
+            for line in self._reader:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                kind = event.get('event')
+                if kind == 'press':
+                    on_press(event['key'])
+                elif kind == 'release':
+                    on_release(event['key'])
+        except OSError as e:
+            if self._sock is not None:
+                self.logger.debug(f'Event stream read error: {e}')
+        finally:
+            if self._sock is not None:
+                self.logger.info('Launcher event stream closed')
+
+    def stop(self) -> None:
+        """Disconnect from the launcher, unblocking start()."""
+        sock = self._sock
+        self._sock = None
+        if sock is not None:
+            with suppress(OSError):
+                sock.shutdown(socket.SHUT_RDWR)
+            with suppress(OSError):
+                sock.close()
+
+    def get_backend_name(self) -> str:
+        """Return backend name."""
+        return f'tap-launcher event stream (pid {self.launcher_pid})'
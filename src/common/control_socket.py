@@ -0,0 +1,248 @@
+"""Local Unix-socket control API for the tap-launcher daemon.
+
+The daemon serves newline-delimited JSON on a Unix stream socket in the
+runtime directory. A client sends one request object per line::
+
+    {"cmd": "status"}
+
+and receives one response object per line::
+
+    {"ok": true, ...}
+    {"ok": false, "error": "unknown command: foo"}
+
+Every connection is served by its own thread, so slow clients never block
+the keyboard event thread or each other. The socket file is created with
+0600 permissions; only the daemon owner can talk to it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+
+from common.logging_utils import get_logger
+from common.runtime_state import CONTROL_SOCKET
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+MAX_REQUEST_SIZE = 64 * 1024
+
+
+class ControlError(Exception):
+    """Raised when the daemon answers a control request with an error."""
+
+
+@dataclass
+class ControlRequest:
+    """A single control request being served.
+
+    Attributes:
+        cmd: Command name
+        params: Request parameters (the JSON object without 'cmd')
+        connection: Client socket (handlers may keep it for streaming)
+        after_reply: Callables executed after the response has been sent
+    """
+    cmd: str
+    params: dict[str, Any]
+    connection: socket.socket
+    after_reply: list[Callable[[], None]] = field(default_factory=list)
+
+
+# A handler returns the response payload, or None if it took over the
+# connection (streaming handlers write to request.connection themselves).
+ControlHandler = Callable[[ControlRequest], dict[str, Any] | None]
+
+
+class ControlServer:
+    """Serve control requests on a Unix stream socket.
+
+    Args:
+        handlers: Mapping of command name to handler
+        socket_path: Path of the Unix socket to create
+    """
+
+    def __init__(
+        self,
+        handlers: dict[str, ControlHandler],
+        socket_path: Path = CONTROL_SOCKET,
+    ) -> None:
+        self.handlers = handlers
+        self.socket_path = socket_path
+        self.logger = get_logger('common.control')
+        self._listener: socket.socket | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Bind the socket and start accepting connections in a background thread.
+
+        Must only be called by the process holding the daemon lock: a stale
+        socket file left by a crashed daemon is removed before binding.
+        """
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            listener.bind(str(self.socket_path))
+        finally:
+            os.umask(old_umask)
+        listener.listen(8)
+        self._listener = listener
+
+        self._thread = threading.Thread(target=self._accept_loop, daemon=True, name='control-server')
+        self._thread.start()
+        self.logger.info(f'Control socket listening on {self.socket_path}')
+
+    def stop(self) -> None:
+        """Stop accepting connections and remove the socket file."""
+        listener = self._listener
+        self._listener = None
+        if listener is not None:
+            with suppress(OSError):
+                listener.shutdown(socket.SHUT_RDWR)
+            with suppress(OSError):
+                listener.close()
+            self.socket_path.unlink(missing_ok=True)
+
+    def _accept_loop(self) -> None:
+        while self._listener is not None:
+            try:
+                conn, _addr = self._listener.accept()
+            except OSError:
+                break
+            threading.Thread(target=self._serve, args=(conn,), daemon=True, name='control-conn').start()
+
+    def _serve(self, conn: socket.socket) -> None:
+        keep_open = False
+        try:
+            reader = conn.makefile('rb')
+            while line := reader.readline(MAX_REQUEST_SIZE + 1):
+                if len(line) > MAX_REQUEST_SIZE:
+                    # The rest of the line is never buffered: refuse it and close
+                    self._send(conn, {'ok': False, 'error': 'request too large'})
+                    break
+                if not line.strip():
+                    continue
+                request = self._parse(line, conn)
+                if request is None:
+                    self._send(conn, {'ok': False, 'error': 'invalid request'})
+                    continue
+                response = self._dispatch(request)
+                if response is None:
+                    keep_open = True
+                    break
+                self._send(conn, response)
+                for callback in request.after_reply:
+                    callback()
+        except OSError as e:
+            self.logger.debug(f'Control connection error: {e}')
+        finally:
+            if not keep_open:
+                with suppress(OSError):
+                    conn.close()
+
+    @staticmethod
+    def _parse(line: bytes, conn: socket.socket) -> ControlRequest | None:
+        try:
+            data = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get('cmd'), str):
+            return None
+        cmd = data.pop('cmd')
+        return ControlRequest(cmd=cmd, params=data, connection=conn)
+
+    def _dispatch(self, request: ControlRequest) -> dict[str, Any] | None:
+        handler = self.handlers.get(request.cmd)
+        if handler is None:
+            return {'ok': False, 'error': f'unknown command: {request.cmd}'}
+        try:
+            response = handler(request)
+        except Exception as e:
+            self.logger.exception(f'Control command {request.cmd!r} failed')
+            return {'ok': False, 'error': str(e)}
+        if response is None:
+            return None
+        return {'ok': True, **response}
+
+    @staticmethod
+    def _send(conn: socket.socket, payload: dict[str, Any]) -> None:
+        write_message(conn, payload)
+
+
+def write_message(conn: socket.socket, payload: dict[str, Any]) -> None:
+    """Write a single JSON line to a control connection."""
+    conn.sendall(json.dumps(payload, separators=(',', ':')).encode() + b'\n')
+
+
+def connect_control(socket_path: Path = CONTROL_SOCKET, timeout: float = 1.0) -> socket.socket | None:
+    """Connect to the daemon control socket.
+
+    Args:
+        socket_path: Path of the control socket
+        timeout: Socket timeout in seconds
+
+    Returns:
+        socket.socket: Connected socket, or None if no daemon is listening
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def send_control_request(
+    cmd: str,
+    socket_path: Path = CONTROL_SOCKET,
+    timeout: float = 1.0,
+    **params: Any,
+) -> dict[str, Any] | None:
+    """Send a single control request and return the response.
+
+    Args:
+        cmd: Command name (e.g., 'status', 'stats', 'stop')
+        socket_path: Path of the control socket
+        timeout: Socket timeout in seconds
+        **params: Additional request parameters
+
+    Returns:
+        dict: Response payload, or None if the control socket is unavailable
+            (daemon not running, or running a version without control socket)
+
+    Raises:
+        ControlError: If the daemon reported an error for this request
+    """
+    sock = connect_control(socket_path, timeout)
+    if sock is None:
+        return None
+    try:
+        with sock:
+            sock.sendall(json.dumps({'cmd': cmd, **params}).encode() + b'\n')
+            line = sock.makefile('rb').readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    try:
+        response = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(response, dict):
+        return None
+    if not response.pop('ok', False):
+        raise ControlError(response.get('error', 'unknown error'))
+    return response
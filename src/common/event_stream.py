@@ -0,0 +1,154 @@
+"""Key/tap event stream published by the tap-launcher daemon.
+
+Clients subscribe through the control socket (``{"cmd": "subscribe"}``) and
+then receive one JSON object per line::
+
+    {"event": "press", "key": "ctrl_l"}
+    {"event": "release", "key": "ctrl_l"}
+    {"event": "tap", "keys": ["ctrl_l", "shift_l"], "duration": 0.08, "hotkey": "Switch layout"}
+
+The event thread only appends to bounded per-subscriber queues; encoding
+and socket writes happen on one writer thread per subscriber. A slow
+subscriber loses events (counted in ``dropped``) instead of delaying
+keyboard handling. When nobody is subscribed, the publisher asks the
+owner to unhook it from the event path entirely.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+from contextlib import suppress
+from typing import TYPE_CHECKING
+from typing import Any
+
+from common.logging_utils import get_logger
+
+if TYPE_CHECKING:
+    import socket
+    from collections.abc import Callable
+
+SUBSCRIBER_QUEUE_SIZE = 1024
+
+# value (1=press, 0=release) → event name
+_KEY_EVENT_NAMES = {1: 'press', 0: 'release'}
+
+
+class _Subscriber:
+    """A connected stream client with its own bounded queue and writer thread."""
+
+    def __init__(self, conn: socket.socket, on_closed: Callable[[_Subscriber], None]) -> None:
+        self.conn = conn
+        self.queue: queue.Queue[tuple[Any, ...] | None] = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.dropped = 0
+        self._on_closed = on_closed
+        self._thread = threading.Thread(target=self._write_loop, daemon=True, name='event-stream')
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def offer(self, item: tuple[Any, ...]) -> None:
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        with suppress(queue.Full):
+            self.queue.put_nowait(None)
+
+    def _write_loop(self) -> None:
+        try:
+            while (item := self.queue.get()) is not None:
+                self.conn.sendall(self._encode(item))
+        except OSError:
+            pass
+        finally:
+            with suppress(OSError):
+                self.conn.close()
+            self._on_closed(self)
+
+    @staticmethod
+    def _encode(item: tuple[Any, ...]) -> bytes:
+        if item[0] == 'key':
+            payload: dict[str, Any] = {'event': _KEY_EVENT_NAMES[item[1]], 'key': item[2]}
+        else:
+            _kind, keys, duration, hotkey = item
+            payload = {'event': 'tap', 'keys': sorted(keys), 'duration': round(duration, 6), 'hotkey': hotkey}
+        return json.dumps(payload, separators=(',', ':')).encode() + b'\n'
+
+
+class KeyEventPublisher:
+    """Fan out key and tap events to stream subscribers.
+
+    Args:
+        on_active_change: Called with True when the first client subscribes and
+            with False when the last one leaves. The owner uses it to hook the
+            publisher into (or out of) the event path, so an idle publisher
+            costs nothing per event.
+    """
+
+    def __init__(self, on_active_change: Callable[[bool], None]) -> None:
+        self.logger = get_logger('common.event_stream')
+        self._on_active_change = on_active_change
+        self._lock = threading.Lock()
+        # Replaced as a whole under the lock; the event thread reads it lock-free
+        self._subscribers: tuple[_Subscriber, ...] = ()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected subscribers."""
+        return len(self._subscribers)
+
+    def subscribe(self, conn: socket.socket) -> None:
+        """Attach a connected client and serve it until it disconnects.
+
+        Blocks the calling (control connection) thread, watching the client
+        side for EOF so a departed subscriber is unhooked right away rather
+        than on the next event written to it.
+        """
+        conn.settimeout(None)
+        subscriber = _Subscriber(conn, self._remove)
+        with self._lock:
+            self._subscribers = (*self._subscribers, subscriber)
+            first = len(self._subscribers) == 1
+        subscriber.start()
+        self.logger.info(f'Event stream subscriber connected ({len(self._subscribers)} total)')
+        if first:
+            self._on_active_change(True)
+
+        try:
+            while conn.recv(1024):
+                pass
+        except OSError:
+            pass
+        subscriber.close()
+
+    def _remove(self, subscriber: _Subscriber) -> None:
+        with self._lock:
+            if subscriber not in self._subscribers:
+                return
+            self._subscribers = tuple(s for s in self._subscribers if s is not subscriber)
+            last = not self._subscribers
+        self.logger.info(f'Event stream subscriber disconnected (dropped events: {subscriber.dropped})')
+        if last:
+            self._on_active_change(False)
+
+    def publish_key(self, value: int, key_name: str) -> None:
+        """Publish a key press (value=1) or release (value=0). Called on the event thread."""
+        for subscriber in self._subscribers:
+            subscriber.offer(('key', value, key_name))
+
+    def publish_tap(self, keys: set[Any], duration: float, hotkey: str | None) -> None:
+        """Publish a completed tap and the matched hotkey, if any. Called on the event thread.
+
+        ``keys`` is only valid during the call, so subscribers get a frozen copy.
+        """
+        for subscriber in self._subscribers:
+            subscriber.offer(('tap', frozenset(keys), duration, hotkey))
+
+    def close(self) -> None:
+        """Disconnect all subscribers."""
+        for subscriber in self._subscribers:
+            subscriber.close()
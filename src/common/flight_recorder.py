@@ -0,0 +1,228 @@
+"""In-memory flight recorder for key handling.
+
+Tracing through the logger formats text for every key, which is too slow
+to leave on while typing. The flight recorder instead packs each step of
+key handling into a fixed-size binary record (timestamp, stage, key code,
+flags) in a preallocated ring buffer. Recording costs one ``pack_into``;
+nothing is formatted until the buffer is dumped, so it can stay enabled
+all the time and a misfire can be investigated after it happened.
+
+Records are written by the event thread only. A dump copies the buffer
+first, so it can be taken from any thread (or a signal handler).
+"""
+
+from __future__ import annotations
+
+import struct
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Sequence
+    from pathlib import Path
+
+# Record layout: perf_counter timestamp, stage, key code, flags
+_RECORD = struct.Struct('<dHHI')
+RECORD_SIZE = _RECORD.size
+DEFAULT_CAPACITY = 4096
+
+# Stages of input events (code: evdev key code; flags: FLAG_*)
+KEY_PRESS = 1
+KEY_RELEASE = 2
+KEY_REPEAT = 3
+# Stages of tap detection (flags: elapsed time in microseconds)
+TAP_STARTED = 10
+TAP_TIMER_DELAYED = 11
+TAP_TIMER_STARTED = 12
+TAP_RESTARTED = 13
+TAP_VALID = 14
+TAP_TIMEOUT = 15
+TAP_INSUFFICIENT_KEYS = 16
+TAP_PRUNED = 17
+# Stages of hotkey handling (code: index of the hotkey in the configuration)
+HOTKEY_MATCHED = 20
+HOTKEY_UNMATCHED = 21
+LAUNCH_OK = 22
+LAUNCH_FAILED = 23
+
+# Flags of input events
+FLAG_SUPPRESSED = 1
+FLAG_UNKNOWN_KEY = 2
+
+_STAGE_NAMES = {
+    KEY_PRESS: 'press',
+    KEY_RELEASE: 'release',
+    KEY_REPEAT: 'repeat',
+    TAP_STARTED: 'tap started',
+    TAP_TIMER_DELAYED: 'tap started, timer delayed',
+    TAP_TIMER_STARTED: 'timer started',
+    TAP_RESTARTED: 'timeout exceeded, tap restarted',
+    TAP_VALID: 'tap valid',
+    TAP_TIMEOUT: 'tap invalid: timeout exceeded',
+    TAP_INSUFFICIENT_KEYS: 'tap invalid: insufficient keys',
+    TAP_PRUNED: 'tap dropped: no hotkey contains these keys',
+    HOTKEY_MATCHED: 'hotkey matched',
+    HOTKEY_UNMATCHED: 'no matching hotkey',
+    LAUNCH_OK: 'launched',
+    LAUNCH_FAILED: 'launch failed',
+}
+_KEY_STAGES = (KEY_PRESS, KEY_RELEASE, KEY_REPEAT)
+_HOTKEY_STAGES = (HOTKEY_MATCHED, LAUNCH_OK, LAUNCH_FAILED)
+_TIMED_STAGES = (TAP_RESTARTED, TAP_VALID, TAP_TIMEOUT)
+_MAX_FLAGS = 0xFFFFFFFF
+
+
+def micros(seconds: float) -> int:
+    """Convert a duration to the microseconds stored in the flags field."""
+    return min(max(int(seconds * 1_000_000), 0), _MAX_FLAGS)
+
+
+@dataclass(frozen=True)
+class TraceSnapshot:
+    """Copy of the ring buffer taken at one moment.
+
+    Attributes:
+        buffer: Raw records
+        count: Number of records ever written
+        capacity: Ring buffer capacity in records
+        taken_perf: ``perf_counter()`` when the copy was taken
+        taken_wall: ``time.time()`` when the copy was taken
+    """
+    buffer: bytes
+    count: int
+    capacity: int
+    taken_perf: float
+    taken_wall: float
+
+    def records(self) -> list[tuple[float, int, int, int]]:
+        """Return the retained records, oldest first."""
+        if not self.capacity:
+            return []
+        retained = min(self.count, self.capacity)
+        first = self.count - retained
+        return [
+            _RECORD.unpack_from(self.buffer, (index % self.capacity) * RECORD_SIZE)
+            for index in range(first, self.count)
+        ]
+
+
+class FlightRecorder:
+    """Ring buffer of binary trace records.
+
+    Args:
+        capacity: Number of records kept (0 disables recording)
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self._capacity = 0
+        self._buffer = bytearray()
+        self._count = 0
+        self.resize(capacity)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def resize(self, capacity: int) -> None:
+        """Reallocate the buffer (drops existing records unless the size is unchanged)."""
+        if capacity < 0:
+            raise ValueError(f'capacity must not be negative, got {capacity}')  # noqa: TRY003
+        if capacity == self._capacity:
+            return
+        self._buffer = bytearray(capacity * RECORD_SIZE)
+        self._count = 0
+        self._capacity = capacity
+
+    def record(self, stage: int, code: int = 0, flags: int = 0) -> None:
+        """Append a record, overwriting the oldest one when the buffer is full."""
+        capacity = self._capacity
+        if capacity:
+            count = self._count
+            _RECORD.pack_into(self._buffer, (count % capacity) * RECORD_SIZE, perf_counter(), stage, code, flags)
+            self._count = count + 1
+
+    def snapshot(self) -> TraceSnapshot:
+        """Copy the current contents."""
+        count = self._count
+        return TraceSnapshot(bytes(self._buffer), count, self._capacity, perf_counter(), time.time())
+
+
+def format_snapshot(
+    snapshot: TraceSnapshot,
+    key_name: Callable[[int], str] = str,
+    hotkey_labels: Sequence[str] = (),
+) -> str:
+    """Render a snapshot as text, one record per line.
+
+    Args:
+        snapshot: Snapshot to render
+        key_name: Translates an evdev key code to a name
+        hotkey_labels: Labels of the configured hotkeys, by index
+
+    Returns:
+        str: Trace text
+    """
+    records = snapshot.records()
+    taken = datetime.fromtimestamp(snapshot.taken_wall).isoformat(timespec='seconds')
+    lines = [
+        f'# tap-launcher flight recorder: {len(records)} of {snapshot.count} records '
+        f'(capacity {snapshot.capacity}), dumped {taken}'
+    ]
+    for timestamp, stage, code, flags in records:
+        wall = datetime.fromtimestamp(snapshot.taken_wall - (snapshot.taken_perf - timestamp))
+        name = _STAGE_NAMES.get(stage, f'stage {stage}')
+        if stage in _KEY_STAGES:
+            detail = f'{name:<8} {key_name(code)} ({code})'
+            if flags & FLAG_SUPPRESSED:
+                detail += ' suppressed'
+            if flags & FLAG_UNKNOWN_KEY:
+                detail += ' unknown key'
+        elif stage in _HOTKEY_STAGES:
+            label = hotkey_labels[code] if code < len(hotkey_labels) else f'#{code}'
+            detail = f'{name}: {label}'
+        elif stage in _TIMED_STAGES:
+            detail = f'{name} ({flags / 1000:.3f} ms)'
+        else:
+            detail = name
+        lines.append(f'{wall.isoformat(timespec="microseconds")}  {detail}')
+    return '\n'.join(lines) + '\n'
+
+
+def evdev_key_name(code: int) -> str:
+    """Return the canonical name of an evdev key code (the code itself if unknown)."""
+    try:
+        from evdev import ecodes  # noqa: PLC0415
+    except ImportError:
+        return str(code)
+    from common.backends.key_mapping import evdev_to_key_name  # noqa: PLC0415
+
+    evdev_name = ecodes.KEY.get(code) or ecodes.BTN.get(code)
+    if evdev_name is None:
+        return str(code)
+    try:
+        return evdev_to_key_name(evdev_name)
+    except KeyError:
+        return evdev_name if isinstance(evdev_name, str) else evdev_name[0]
+
+
+def write_trace(
+    snapshot: TraceSnapshot,
+    path: Path,
+    hotkey_labels: Sequence[str] = (),
+) -> int:
+    """Format a snapshot and write it to a file.
+
+    Returns:
+        int: Number of records written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(format_snapshot(snapshot, evdev_key_name, hotkey_labels))
+    return min(snapshot.count, snapshot.capacity)
+
+
+# Process-wide recorder shared by the backend, the tap monitor and the launcher
+RECORDER = FlightRecorder()
@@ -1,14 +1,33 @@
 """Logging utilities for consistent logger creation across the project.
 
 This module provides a helper function for creating loggers with consistent
-naming conventions based on module paths.
+naming conventions based on module paths, and the logging pipeline of the
+launcher and detector.
+
+Loggers configured by ``setup_logging_handler`` only enqueue records: a
+``QueueListener`` thread formats them and writes them to the console or the
+log file, so a slow terminal or disk never blocks the keyboard event thread.
 """
 
+import atexit
+import gzip
 import logging
+import os
+import queue
+import shutil
 import sys
-from datetime import datetime
+import threading
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
+# Listener of each configured logger, stopped (and drained) at exit
+_listeners: dict[str, QueueListener] = {}
+
 
 def get_logger(name: str | None = None) -> logging.Logger:
     """Create or retrieve a logger with consistent naming.
@@ -48,15 +67,132 @@ class ISOFormatter(logging.Formatter):
 
     Formats log messages as:
         <ISO-datetime-with-ms> <log-level> [<module>:<lineno>]: <message>
+
+    The ``YYYY-MM-DDTHH:MM:SS`` part only changes once per second, so it is
+    computed once and reused for all records of the same second.
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        # (second, formatted prefix); replaced as a whole so it stays consistent
+        self._second_prefix: tuple[int, str] = (-1, '')
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with ISO timestamp."""
-        # Generate ISO timestamp with milliseconds
-        timestamp = datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds')
-        
+        second = int(record.created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+            self._second_prefix = (second, prefix)
+
         # Format: <timestamp> <level> [<module>:<lineno>]: <message>
-        return f'{timestamp} {record.levelname} [{record.module}:{record.lineno}]: {record.getMessage()}'
+        return (
+            f'{prefix}.{int(record.msecs):03d} {record.levelname} '
+            f'[{record.module}:{record.lineno}]: {record.getMessage()}'
+        )
+
+
+@dataclass(frozen=True)
+class LogRotation:
+    """Size-based log file rotation settings.
+
+    Attributes:
+        max_bytes: Rotate once the log file reaches this size (0 disables rotation)
+        backup_count: Number of compressed rotated files to keep
+    """
+    max_bytes: int
+    backup_count: int
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.backup_count > 0
+
+
+class InProcessQueueHandler(QueueHandler):
+    """Queue handler that leaves all formatting to the listener thread.
+
+    The stock ``QueueHandler.prepare`` formats and copies every record so it
+    can be pickled; the listener here runs in the same process, so records
+    are enqueued untouched and the calling thread only pays for creating the
+    record and ``put``. Logging arguments must therefore not be mutated after
+    the call (all loggers in this project pass strings and numbers).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """Size-based rotating file handler that gzips rotated files in the background.
+
+    ``tap-launcher.log`` is rotated to ``tap-launcher.log.1.gz``, older
+    backups shift to ``.2.gz`` and so on. Rotation itself is a rename; the
+    compression runs in a separate thread so writing continues immediately.
+
+    Args:
+        filename: Log file path
+        max_bytes: Rotate once the file would exceed this size
+        backup_count: Number of compressed backups to keep
+    """
+
+    def __init__(self, filename: Path, max_bytes: int, backup_count: int) -> None:
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+        self.namer = self._gz_name
+        self.rotator = self._rotate
+        self._compressor: threading.Thread | None = None
+
+    @staticmethod
+    def _gz_name(name: str) -> str:
+        return f'{name}.gz'
+
+    def doRollover(self) -> None:  # noqa: N802
+        # Backups are renamed during rollover; the previous one must be complete
+        self.wait_for_compression()
+        super().doRollover()
+
+    def wait_for_compression(self) -> None:
+        """Block until the last rotated file has been compressed."""
+        if self._compressor is not None:
+            self._compressor.join()
+            self._compressor = None
+
+    def close(self) -> None:
+        self.wait_for_compression()
+        super().close()
+
+    def _rotate(self, source: str, dest: str) -> None:
+        plain = dest.removesuffix('.gz')
+        os.replace(source, plain)  # noqa: PTH105
+        self._compressor = threading.Thread(
+            target=_gzip_file, args=(plain, dest), daemon=True, name='log-compress'
+        )
+        self._compressor.start()
+
+
+def _gzip_file(source: str, dest: str) -> None:
+    """Compress ``source`` into ``dest`` atomically and remove ``source``."""
+    tmp = f'{dest}.tmp'
+    try:
+        with open(source, 'rb') as src, gzip.open(tmp, 'wb') as dst:  # noqa: PTH123
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(tmp, dest)  # noqa: PTH105
+        os.unlink(source)  # noqa: PTH108
+    except OSError as e:
+        with suppress(OSError):
+            os.unlink(tmp)  # noqa: PTH108
+        sys.stderr.write(f'tap-launcher: failed to compress {source}: {e}\n')
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and close the handlers of all configured loggers."""
+    while _listeners:
+        _name, listener = _listeners.popitem()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown_logging)
 
 
 def setup_logging_handler(
@@ -64,35 +200,53 @@ def setup_logging_handler(
     log_level: str = 'INFO',
     foreground: bool = True,
     log_file: Path | None = None,
+    rotation: LogRotation | None = None,
 ) -> None:
     """Set up logging handler based on foreground/background mode.
 
+    The logger gets a queue handler; the console or file handler runs on a
+    background listener thread that is drained at interpreter exit.
+
     Args:
         logger: Logger instance to configure
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         foreground: If True, log to console. If False, log to file (if log_file provided)
         log_file: Path to log file (used only when foreground=False)
+        rotation: Size-based rotation of the log file (None: grow without limit)
     """
     logger.setLevel(getattr(logging, log_level.upper()))
     
     # Clear any existing handlers
     logger.handlers.clear()
+    previous = _listeners.pop(logger.name, None)
+    if previous is not None:
+        previous.stop()
+        for old_handler in previous.handlers:
+            old_handler.close()
     
     # Create formatter with ISO timestamp
     formatter = ISOFormatter()
     
+    handler: logging.Handler
     if foreground:
         # Console handler for foreground mode
-        console_handler = logging.StreamHandler(sys.stderr)
-        console_handler.setLevel(getattr(logging, log_level.upper()))
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handler = logging.StreamHandler(sys.stderr)
     elif log_file:
         # File handler for background mode
         # Create parent directory if needed
         log_file.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, log_level.upper()))
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        if rotation is not None and rotation.enabled:
+            handler = CompressingRotatingFileHandler(log_file, rotation.max_bytes, rotation.backup_count)
+        else:
+            handler = logging.FileHandler(log_file)
+    else:
+        return
+    handler.setLevel(getattr(logging, log_level.upper()))
+    handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logger.addHandler(InProcessQueueHandler(log_queue))
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    _listeners[logger.name] = listener
@@ -0,0 +1,303 @@
+"""Lock-free metrics registry with Prometheus text exposition.
+
+Hot-path code increments plain list slots in a per-thread shard::
+
+    counts = REGISTRY.shard().values          # once per thread
+    slot = KEY_EVENTS.slot('suppressed')      # once per label combination
+    counts[slot] += 1                          # per event: no lock, no lookup
+
+Each thread writes only its own shard, so increments need no locks. Shards
+are summed, and histogram buckets made cumulative, only when metrics are
+rendered — off the hot path. Allocating a new label combination takes a
+lock and extends every shard; this happens once per combination.
+
+Off the hot path, ``Counter.inc`` and ``Histogram.observe`` look up the
+calling thread's shard themselves.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterable
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from common.logging_utils import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+# Upper bounds in seconds (the +Inf bucket is implicit)
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.00025, 0.0005, 0.001, 0.002, 0.004, 0.008, 0.016, 0.032, 0.064, 0.128, 0.256, 0.512, 1.024,
+)
+
+GaugeSamples = Iterable[tuple[tuple[str, ...], float]]
+
+
+class MetricsShard:
+    """Metric slots written by a single thread."""
+
+    __slots__ = ('values',)
+
+    def __init__(self, size: int) -> None:
+        self.values: list[float] = [0] * size
+
+
+class _Family:
+    """A named metric with labels; label combinations map to slot ranges."""
+
+    kind = ''
+    width = 1
+
+    def __init__(self, registry: MetricsRegistry, name: str, documentation: str, labelnames: tuple[str, ...]) -> None:
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._slots: dict[tuple[str, ...], int] = {}
+
+    def slot(self, *labelvalues: str) -> int:
+        """Return the (first) slot of a label combination, allocating it on first use."""
+        slot = self._slots.get(labelvalues)
+        if slot is None:
+            if len(labelvalues) != len(self.labelnames):
+                raise ValueError(f'{self.name} expects labels {self.labelnames}, got {labelvalues}')  # noqa: TRY003
+            slot = self._slots[labelvalues] = self.registry._allocate(self.width)
+        return slot
+
+    def children(self) -> list[tuple[tuple[str, ...], int]]:
+        return list(self._slots.items())
+
+
+class Counter(_Family):
+    """Monotonic counter."""
+
+    kind = 'counter'
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        """Increment from any thread (looks up the thread's shard)."""
+        self.registry.shard().values[self.slot(*labelvalues)] += amount
+
+
+class Histogram(_Family):
+    """Fixed-bucket histogram: one slot per bucket, one for +Inf, one for the sum."""
+
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...],
+    ) -> None:
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = buckets
+        self.width = len(buckets) + 2
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Record an observation from any thread."""
+        self.observe_into(self.registry.shard().values, self.slot(*labelvalues), value)
+
+    def observe_into(self, values: list[float], slot: int, value: float) -> None:
+        """Record an observation into a known shard and slot (hot-path form)."""
+        values[slot + bisect_left(self.buckets, value)] += 1
+        values[slot + len(self.buckets) + 1] += value
+
+
+class MetricsRegistry:
+    """Registry of metric families and per-thread shards."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._families: dict[str, _Family] = {}
+        self._gauges: dict[str, tuple[str, tuple[str, ...], Callable[[], GaugeSamples]]] = {}
+        self._shards: list[MetricsShard] = []
+        self._size = 0
+
+    # -------------------- definition --------------------
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Return the counter with this name, creating it if needed."""
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = Counter(self, name, documentation, labelnames)
+        if not isinstance(family, Counter):
+            raise TypeError(f'{name} is already registered as a {family.kind}')  # noqa: TRY003
+        return family
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram with this name, creating it if needed."""
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = Histogram(self, name, documentation, labelnames, buckets)
+        if not isinstance(family, Histogram):
+            raise TypeError(f'{name} is already registered as a {family.kind}')  # noqa: TRY003
+        return family
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], GaugeSamples],
+        labelnames: tuple[str, ...] = (),
+    ) -> None:
+        """Register (or replace) a gauge whose samples are read at render time.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            collect: Returns ``(labelvalues, value)`` pairs; called off the hot path
+            labelnames: Label names
+        """
+        with self._lock:
+            self._gauges[name] = (documentation, labelnames, collect)
+
+    # -------------------- shards --------------------
+    def shard(self) -> MetricsShard:
+        """Return the calling thread's shard."""
+        shard: MetricsShard | None = getattr(self._local, 'shard', None)
+        if shard is None:
+            with self._lock:
+                shard = MetricsShard(self._size)
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _allocate(self, width: int) -> int:
+        with self._lock:
+            first = self._size
+            self._size += width
+            for shard in self._shards:
+                shard.values.extend([0] * width)
+        return first
+
+    def _total(self, slot: int) -> float:
+        return sum(shard.values[slot] for shard in self._shards)
+
+    # -------------------- exposition --------------------
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            families = list(self._families.values())
+            gauges = list(self._gauges.items())
+        lines: list[str] = []
+        for family in families:
+            lines.append(f'# HELP {family.name} {_escape_help(family.documentation)}')
+            lines.append(f'# TYPE {family.name} {family.kind}')
+            for labelvalues, slot in sorted(family.children()):
+                labels = list(zip(family.labelnames, labelvalues, strict=True))
+                if isinstance(family, Histogram):
+                    lines.extend(self._render_histogram(family, labels, slot))
+                else:
+                    lines.append(f'{family.name}{_labels(labels)} {_number(self._total(slot))}')
+        for name, (documentation, labelnames, collect) in gauges:
+            lines.append(f'# HELP {name} {_escape_help(documentation)}')
+            lines.append(f'# TYPE {name} gauge')
+            try:
+                samples = list(collect())
+            except Exception as e:  # noqa: BLE001
+                get_logger('common.metrics').debug(f'Gauge {name} failed: {e}')
+                continue
+            for labelvalues, value in samples:
+                lines.append(f'{name}{_labels(list(zip(labelnames, labelvalues, strict=True)))} {_number(value)}')
+        return '\n'.join(lines) + '\n'
+
+    def _render_histogram(self, family: Histogram, labels: list[tuple[str, str]], slot: int) -> list[str]:
+        lines = []
+        cumulative = 0.0
+        for idx, bound in enumerate((*family.buckets, float('inf'))):
+            cumulative += self._total(slot + idx)
+            le = '+Inf' if bound == float('inf') else _number(bound)
+            lines.append(f'{family.name}_bucket{_labels([*labels, ("le", le)])} {_number(cumulative)}')
+        lines.append(f'{family.name}_sum{_labels(labels)} {_number(self._total(slot + len(family.buckets) + 1))}')
+        lines.append(f'{family.name}_count{_labels(labels)} {_number(cumulative)}')
+        return lines
+
+
+def _escape_help(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels: list[tuple[str, str]]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in labels) + '}'
+
+
+def _number(value: float) -> str:
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class TextfileExporter:
+    """Periodically write metrics to a file (e.g., for node_exporter's textfile collector).
+
+    The file is replaced atomically, so readers never see partial content.
+
+    Args:
+        registry: Registry to render
+        path: Target file (should end in ``.prom``)
+        interval: Seconds between writes
+    """
+
+    def __init__(self, registry: MetricsRegistry, path: Path, interval: float) -> None:
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self.logger = get_logger('common.metrics')
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name='metrics-textfile')
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the writer and write the final values."""
+        self._stopped.set()
+        self.write()
+
+    def write(self) -> None:
+        tmp_path = self.path.with_name(f'.{self.path.name}.{os.getpid()}.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(self.registry.render())
+            tmp_path.replace(self.path)
+        except OSError as e:
+            self.logger.warning(f'Failed to write metrics to {self.path}: {e}')
+            with suppress(OSError):
+                tmp_path.unlink()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.write()
+
+
+# Process-wide registry used by the launcher
+REGISTRY = MetricsRegistry()
+PROCESS_START_TIME = time.time()
+
+REGISTRY.gauge(
+    'tap_launcher_start_time_seconds',
+    'Start time of the process since unix epoch in seconds',
+    lambda: [((), PROCESS_START_TIME)],
+)
@@ -10,6 +10,9 @@ from typing import Any
 RUNTIME_DIR = Path.home() / '.local/share/tap-launcher'
 PID_FILE = RUNTIME_DIR / 'tap-launcher.pid'
 STATE_FILE = RUNTIME_DIR / 'tap-launcher.state.json'
+CONTROL_SOCKET = RUNTIME_DIR / 'tap-launcher.sock'
+CONFIG_CACHE_FILE = RUNTIME_DIR / 'tap-launcher.config-cache.pickle'
+TRACE_FILE = RUNTIME_DIR / 'tap-launcher.trace'
 STATE_VERSION = 1
 
 
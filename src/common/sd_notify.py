@@ -0,0 +1,274 @@
+"""Minimal systemd notification protocol (``sd_notify``) without libsystemd.
+
+The service manager passes a datagram socket path in ``$NOTIFY_SOCKET``
+(a leading ``@`` denotes the Linux abstract namespace). A service reports
+its state by sending newline-separated ``KEY=VALUE`` assignments to it:
+
+- ``READY=1``: startup finished (``Type=notify`` units become active)
+- ``WATCHDOG=1``: keep-alive ping, required every ``$WATCHDOG_USEC``
+- ``STATUS=...``: free-form status text
+- ``STOPPING=1``: shutdown started
+- ``MAINPID=...``: PID of the main process
+
+``NotifyListener`` implements the receiving side. ``launch start`` uses it
+to wait until the background daemon reports readiness, and tests can use
+it as a local stand-in for systemd.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import socket
+import threading
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Mapping
+
+
+def _socket_address(address: str) -> str:
+    """Translate ``@name`` notation to an abstract socket address."""
+    if address.startswith('@'):
+        return '\0' + address[1:]
+    return address
+
+
+class SdNotifier:
+    """Send state notifications to the service manager.
+
+    All methods are no-ops when no notification socket is configured, so
+    callers never need to check whether they run under systemd.
+
+    Args:
+        address: Notification socket path (``@`` prefix for abstract
+            namespace), or None to disable notifications
+    """
+
+    def __init__(self, address: str | None) -> None:
+        self.address = address
+        self._sock: socket.socket | None = None
+        if address:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM | socket.SOCK_CLOEXEC)
+            sock.setblocking(False)
+            self._sock = sock
+
+    @classmethod
+    def from_env(cls, unset_environment: bool = True) -> SdNotifier:
+        """Create a notifier from ``$NOTIFY_SOCKET``.
+
+        Args:
+            unset_environment: Remove the variable so processes launched by
+                the daemon do not inherit (and misuse) the socket
+
+        Returns:
+            SdNotifier: Notifier (disabled if the variable is not set)
+        """
+        address = os.environ.get('NOTIFY_SOCKET')
+        if unset_environment:
+            os.environ.pop('NOTIFY_SOCKET', None)
+        return cls(address)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether notifications are sent anywhere."""
+        return self._sock is not None
+
+    def notify(self, *assignments: str) -> bool:
+        """Send ``KEY=VALUE`` assignments in a single datagram.
+
+        Returns:
+            bool: True if the datagram was sent
+        """
+        if self._sock is None or self.address is None:
+            return False
+        try:
+            self._sock.sendto('\n'.join(assignments).encode(), _socket_address(self.address))
+        except OSError:
+            return False
+        return True
+
+    def ready(self, status: str | None = None) -> bool:
+        """Report that startup has finished."""
+        return self.notify('READY=1', *([f'STATUS={status}'] if status else []))
+
+    def status(self, status: str) -> bool:
+        """Report free-form status text."""
+        return self.notify(f'STATUS={status}')
+
+    def stopping(self) -> bool:
+        """Report that shutdown has started."""
+        return self.notify('STOPPING=1')
+
+    def watchdog(self) -> bool:
+        """Send a watchdog keep-alive ping."""
+        return self.notify('WATCHDOG=1')
+
+    def close(self) -> None:
+        if self._sock is not None:
+            with suppress(OSError):
+                self._sock.close()
+            self._sock = None
+
+
+def watchdog_interval(env: Mapping[str, str] | None = None) -> float | None:
+    """Return the interval for watchdog pings, or None if the watchdog is off.
+
+    Pings are sent at half of ``$WATCHDOG_USEC`` as recommended by systemd.
+    ``$WATCHDOG_PID``, when set, must name this process.
+    """
+    env = os.environ if env is None else env
+    try:
+        usec = int(env.get('WATCHDOG_USEC', ''))
+    except ValueError:
+        return None
+    pid = env.get('WATCHDOG_PID')
+    if usec <= 0 or (pid and pid != str(os.getpid())):
+        return None
+    return usec / 1_000_000 / 2
+
+
+class EventLoopWatchdog:
+    """Send ``WATCHDOG=1`` from an event loop.
+
+    A helper thread does not ping by itself: every ``interval`` seconds it
+    posts the ping into the event loop through ``call_soon``. A loop that
+    stops processing its queue therefore stops pinging, and the service
+    manager restarts the service.
+
+    Args:
+        notifier: Notifier used to send the pings
+        interval: Seconds between pings
+        call_soon: Schedules a callable on the event loop thread
+    """
+
+    def __init__(
+        self,
+        notifier: SdNotifier,
+        interval: float,
+        call_soon: Callable[[Callable[[], None]], None],
+    ) -> None:
+        self.notifier = notifier
+        self.interval = interval
+        self._call_soon = call_soon
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name='sd-watchdog')
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            # A full queue means the loop is not keeping up; skip this ping
+            with suppress(Exception):
+                self._call_soon(self._ping)
+
+    def _ping(self) -> None:
+        self.notifier.watchdog()
+
+
+@dataclass
+class Readiness:
+    """Outcome of waiting for a service to report readiness.
+
+    Attributes:
+        ready: True if ``READY=1`` was received
+        pid: Main PID reported by the service (``MAINPID=``)
+        status: Last ``STATUS=`` text received
+        exited: True if the service process exited before becoming ready
+    """
+    ready: bool
+    pid: int | None = None
+    status: str | None = None
+    exited: bool = False
+
+
+class NotifyListener:
+    """Receive notifications like the service manager does.
+
+    Binds a datagram socket in the abstract namespace; pass ``address``
+    to the service as ``$NOTIFY_SOCKET``.
+    """
+
+    def __init__(self) -> None:
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM | socket.SOCK_CLOEXEC)
+        self._sock.bind(f'\0tap-launcher-notify-{os.getpid()}-{os.urandom(4).hex()}')
+        self.address = '@' + self._sock.getsockname()[1:].decode()
+
+    def receive(self, timeout: float | None = None) -> dict[str, str] | None:
+        """Receive one notification.
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            dict: Assignments of the datagram, or None on timeout
+        """
+        self._sock.settimeout(timeout)
+        try:
+            data = self._sock.recv(4096)
+        except (TimeoutError, BlockingIOError):
+            return None
+        return dict(
+            line.split('=', 1) for line in data.decode(errors='replace').splitlines() if '=' in line
+        )
+
+    def wait_ready(self, timeout: float) -> Readiness:
+        """Wait for ``READY=1``, the service's exit, or the timeout.
+
+        Once the service reports ``MAINPID=``, its exit is detected through a
+        pidfd, so a service that dies during startup is reported immediately.
+        """
+        result = Readiness(ready=False)
+        deadline = time.monotonic() + timeout
+        pidfd: int | None = None
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                fds = [self._sock.fileno()] + ([pidfd] if pidfd is not None else [])
+                readable, _, _ = select.select(fds, [], [], remaining)
+                if pidfd is not None and pidfd in readable:
+                    return self._finish_exited(result)
+                message = self.receive(0) if readable else None
+                if message is None:
+                    continue
+                self._apply(message, result)
+                if result.ready:
+                    return result
+                if result.pid is not None and pidfd is None:
+                    try:
+                        pidfd = os.pidfd_open(result.pid)
+                    except ProcessLookupError:
+                        return self._finish_exited(result)
+                    except OSError:
+                        # No pidfd support: rely on the timeout
+                        result.pid = None
+            return result
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
+
+    @staticmethod
+    def _apply(message: dict[str, str], result: Readiness) -> None:
+        result.status = message.get('STATUS', result.status)
+        result.ready = result.ready or message.get('READY') == '1'
+        if 'MAINPID' in message and result.pid is None:
+            with suppress(ValueError):
+                result.pid = int(message['MAINPID'])
+
+    def _finish_exited(self, result: Readiness) -> Readiness:
+        """Collect notifications sent right before the service exited."""
+        while (message := self.receive(0)) is not None:
+            self._apply(message, result)
+        result.exited = not result.ready
+        return result
+
+    def close(self) -> None:
+        with suppress(OSError):
+            self._sock.close()
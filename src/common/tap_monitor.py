@@ -4,12 +4,15 @@ This module implements the core tap detection logic using keyboard backend abstr
 Uses evdev backend which works on both X11 and Wayland.
 """
 
+import logging
 from collections.abc import Callable
 from dataclasses import dataclass
 from dataclasses import field
 from time import perf_counter
 from typing import Any
+from typing import Protocol
 
+from common import flight_recorder as fr
 from common.backends import KeyboardBackend, create_backend
 from common.key_normalizer import is_modifier_key, normalize_key
 from common.logging_utils import get_logger
@@ -21,6 +24,66 @@ from common.verbose_formatter import (
 )
 
 
+class TapCandidates(Protocol):
+    """Index of the key sets a tap can still grow into (``HotkeyMatcher`` implements it)."""
+
+    def key_bit(self, key: Any) -> int:
+        """Return the bit of a key in tap masks (0 if no hotkey uses the key)."""
+        ...
+
+    def max_tap_timeout(self, mask: int) -> float | None:
+        """Return the longest timeout of the hotkeys containing ``mask`` (None if there are none)."""
+        ...
+
+    def delays_timer(self, mask: int) -> bool:
+        """Return True if a hotkey containing ``mask`` starts its timer from the second key."""
+        ...
+
+
+class TapHolds(Protocol):
+    """Hold hotkeys watched while their keys are held (``HoldTracker`` implements it).
+
+    Attributes:
+        mask: Bits (``TapCandidates.key_bit``) of every key of a hold hotkey
+        armed: True while a hold is waiting for its deadline
+    """
+
+    mask: int
+    armed: bool
+
+    def on_combination(self, mask: int, key: Any, device: Any) -> None:
+        """Report that ``key`` was added to a tap on ``device`` whose keys are now ``mask``."""
+        ...
+
+    def interrupt(self, key: Any, pressed: bool, device: Any) -> None:
+        """Report a press or release on ``device`` while a hold is armed."""
+        ...
+
+
+class TapBuffer(Protocol):
+    """Held-back presses of a tap that may become a modifier-only hotkey (``PressBuffer`` implements it).
+
+    Attributes:
+        mask: Bits (``TapCandidates.key_bit``) of every key whose press can be held back
+        active: True while presses are held back
+    """
+
+    mask: int
+    active: bool
+
+    def on_combination(self, mask: int, key: Any, device: Any) -> None:
+        """Report that ``key`` was added to a tap on ``device`` whose keys are now ``mask``."""
+        ...
+
+    def interrupt(self, key: Any, device: Any) -> None:
+        """Report a press on ``device`` while presses are held back."""
+        ...
+
+    def flush(self) -> None:
+        """Emit the held-back presses in their original order."""
+        ...
+
+
 @dataclass
 class TapState:
     """State of the current tap being monitored.
@@ -31,20 +94,47 @@ class TapState:
         start_time: Timestamp when the tap timer started (None if not started yet)
         is_active: Whether a tap is currently in progress
         timer_delayed: True if timer start is delayed until second key press
+        delayed_since: Timestamp of the first key of a delayed tap; the timer
+            starts from it if the second key rules out every hotkey that
+            delays its timer
+        timeout: Longest duration the tap may still reach and be valid; shrinks
+            as keys are added (None until the first key is processed)
+        mask: Bits (``TapCandidates.key_bit``) of the keys in ``tap_combination``
+        pruned: True while the keys of a tap that cannot match any hotkey are
+            held; only ``pressed_keys`` is tracked until all are released
+        expiry: Timer that expires the tap once its timeout passes
+        expiry_deadline: Deadline ``expiry`` is armed for
+        device: Input device whose keys this state tracks (None when taps
+            are not tracked per device); kept across resets
     """
     pressed_keys: set[Any] = field(default_factory=set)
     tap_combination: set[Any] = field(default_factory=set)
     start_time: float | None = None
     is_active: bool = False
     timer_delayed: bool = False
+    delayed_since: float | None = None
+    timeout: float | None = None
+    mask: int = 0
+    pruned: bool = False
+    expiry: Any = None
+    expiry_deadline: float | None = None
+    device: Any = None
 
     def reset(self) -> None:
-        """Reset the tap state to initial values."""
+        """Reset the tap state to initial values (disarming its expiry timer)."""
+        if self.expiry is not None:
+            self.expiry.cancel()
+            self.expiry = None
+            self.expiry_deadline = None
         self.pressed_keys.clear()
         self.tap_combination.clear()
         self.start_time = None
         self.is_active = False
         self.timer_delayed = False
+        self.delayed_since = None
+        self.timeout = None
+        self.mask = 0
+        self.pruned = False
 
 
 class TapMonitor:
@@ -68,9 +158,15 @@ class TapMonitor:
         verbose: Whether to output verbose debug information
         on_keys_detected: Callback when keys are detected
             (keys, duration, trigger_key, has_non_modifier)
-        on_tap_invalid: Callback when an invalid tap is detected (reason, keys, duration)
+        on_tap_invalid: Callback when an invalid tap is detected (reason, keys, duration).
+            Both callbacks get the tap's own key set, which is cleared after
+            they return: copy it to keep it.
         check_timer_delay: Optional callback to check if timer should be delayed for a key.
             Takes normalized key name (str), returns True to delay timer start.
+        candidates: Optional index of the configured key sets. A tap is
+            dropped as soon as its keys are no subset of any of them, and
+            expires after the longest timeout among those that remain;
+            without it every tap is checked against ``timeout``.
         backend: Optional keyboard backend to use (auto-detects X11/Wayland if None)
     """
 
@@ -82,30 +178,111 @@ class TapMonitor:
         on_tap_invalid: Callable[[str, set[Any], float], None] | None = None,
         check_timer_delay: Callable[[str], bool] | None = None,
         backend: KeyboardBackend | None = None,
+        candidates: TapCandidates | None = None,
     ) -> None:
         self.timeout = timeout
         self.validate_timeout = timeout is not None
-        self.verbose = verbose
+        self._verbose = verbose
+        # State of the device whose event is being handled; with several
+        # devices bound, each has its own and this points to the current one
         self.state = TapState()
+        self._states = [self.state]
         self.on_keys_detected = on_keys_detected
         self.on_tap_invalid = on_tap_invalid
         self.check_timer_delay = check_timer_delay
+        self.candidates = candidates
+        # Whether taps that no candidate contains are dropped early (set to
+        # False while every tap must be reported)
+        self.prune = True
+        # Hold hotkeys (None if none are configured): keys outside
+        # ``holds.mask`` only pay an attribute check
+        self.holds: TapHolds | None = None
+        # Press buffering (None unless enabled): keys outside ``buffer.mask``
+        # only pay an attribute check
+        self.buffer: TapBuffer | None = None
+        # Called as ``on_tap_start(bit, device)`` with the first key of each
+        # tap that can get a second key, i.e. a modifier (a non-modifier
+        # completes its tap on the same press); None when nobody listens
+        self.on_tap_start: Callable[[int, Any], None] | None = None
         self.logger = get_logger('common.tap_monitor')
+        self._trace = fr.RECORDER.record
         
         # Create or use provided backend (auto-detects X11 vs Wayland)
         self.backend = backend or create_backend()
 
+        # Backends with an event loop timer (evdev) expire a tap as soon as
+        # its timeout passes; others only notice on the next key event
+        self._call_later: Callable[[float, Callable[[], None]], Any] | None = getattr(
+            self.backend, 'call_later', None
+        )
+
+    @property
+    def verbose(self) -> bool:
+        """Whether verbose trace messages are actually emitted.
+
+        Checked before any message is formatted, so verbose mode costs
+        nothing while the logger would discard debug messages anyway.
+        """
+        return self._verbose and self.logger.isEnabledFor(logging.DEBUG)
+
+    @verbose.setter
+    def verbose(self, value: bool) -> None:
+        self._verbose = value
+
     def start(self) -> None:
         """Start monitoring keyboard events.
 
         This method blocks and listens for keyboard events until interrupted.
         Uses the configured evdev backend (works on both X11 and Wayland).
         """
+        if hasattr(self.backend, 'device_binder'):
+            self.backend.device_binder = self.bind_devices
         self.backend.start(
             on_press=self._on_press,
             on_release=self._on_release
         )
 
+    def bind_devices(self, devices: list[Any]) -> list[tuple[Callable[[Any], None], Callable[[Any], None]]]:
+        """Give each input device its own tap state and return its callbacks.
+
+        Called by the backend once its devices are known. Taps on one
+        keyboard then cannot be broken or completed by keys of another. A
+        single device keeps the plain callbacks, so it pays nothing per event.
+
+        Args:
+            devices: Device descriptions (e.g., ``DeviceInfo``), one per device
+
+        Returns:
+            list[tuple]: ``(on_press, on_release)`` for each device, in order
+        """
+        self.reset()
+        if len(devices) <= 1:
+            self.state.device = devices[0] if devices else None
+            self._states = [self.state]
+            return [(self._on_press, self._on_release)] * len(devices)
+        self._states = [TapState(device=device) for device in devices]
+        self.state = self._states[0]
+        return [self._bind_state(state) for state in self._states]
+
+    def _bind_state(self, state: TapState) -> tuple[Callable[[Any], None], Callable[[Any], None]]:
+        on_press = self._on_press
+        on_release = self._on_release
+
+        def press(key: Any) -> None:
+            self.state = state
+            on_press(key)
+
+        def release(key: Any) -> None:
+            self.state = state
+            on_release(key)
+
+        return press, release
+
+    def reset(self) -> None:
+        """Reset the tap state of every device."""
+        for state in self._states:
+            state.reset()
+
     def stop(self) -> None:
         """Stop monitoring keyboard events.
 
@@ -114,23 +291,186 @@ class TapMonitor:
         """
         self.backend.stop()
 
+    def _reset_tap(self) -> None:
+        """End the current tap: disarm its expiry timer and reset the state."""
+        self.state.reset()
+
+    def drop_tap(self, device: Any = None) -> None:
+        """Forget the current tap; its held keys are ignored until released.
+
+        Called after a hold hotkey fired, so releasing its keys does not
+        complete a tap as well.
+
+        Args:
+            device: Device whose tap to drop (None: the current one)
+        """
+        state = next((st for st in self._states if st.device == device), self.state) if device else self.state
+        held = state.pressed_keys.copy()
+        state.reset()
+        if held:
+            state.pressed_keys = held
+            state.pruned = True
+
+    def _candidate_bit(self, key: Any) -> int | None:
+        """Return the mask bit of a pressed key, or None if the press pruned the tap."""
+        candidates = self.candidates
+        if candidates is None or not self.validate_timeout:
+            return 0
+        bit = candidates.key_bit(key)
+        if self.prune and (not bit or candidates.max_tap_timeout(self.state.mask | bit) is None):
+            self._prune(key)
+            return None
+        return bit
+
+    def _restart_expired_tap(self) -> None:
+        """End a tap whose timeout passed, so the key being pressed starts a new one.
+
+        Called before the key's candidate bit is computed, so the new tap is
+        pruned against its own keys only, and starts like any other tap.
+        """
+        state = self.state
+        if not self.validate_timeout or state.start_time is None or state.timeout is None:
+            return
+        elapsed = perf_counter() - state.start_time
+        if elapsed <= state.timeout:
+            return
+        self._trace(fr.TAP_RESTARTED, 0, fr.micros(elapsed))
+        if self.verbose:
+            self.logger.debug('Timeout exceeded during tap: %.3fs > %.3fs', elapsed, state.timeout)
+        self._reset_tap()
+
+    def _release_pruned(self, key: Any) -> None:
+        """Track a release while idle; the next tap can start once no key is held."""
+        self.state.pressed_keys.discard(key)
+        if not self.state.pressed_keys:
+            self.state.pruned = False
+
+    def _prune(self, key: Any) -> None:
+        """Drop a tap that can no longer match any hotkey.
+
+        A non-modifier press would complete the tap right away, so the state
+        is just reset. Otherwise the monitor stays idle until every held key
+        is released: no tap bookkeeping, tracing or callbacks meanwhile.
+        """
+        self._trace(fr.TAP_PRUNED)
+        if self.verbose:
+            self.logger.debug('%s pressed → no hotkey contains these keys, ignoring until released', normalize_key(key))
+        if not is_modifier_key(key):
+            self._reset_tap()
+            return
+        held = self.state.pressed_keys.copy()
+        self._reset_tap()
+        held.add(key)
+        self.state.pressed_keys = held
+        self.state.pruned = True
+
+    def _keeps_timer_delayed(self, bit: int) -> bool:
+        """Check on the second key of a delayed tap whether the delay still applies.
+
+        Args:
+            bit: Mask bit of the second key (0 without a candidate index)
+        """
+        if self.candidates is None:
+            return True
+        return self.candidates.delays_timer(self.state.mask | bit)
+
+    def _update_deadline(self, bit: int) -> None:
+        """Recompute the tap's timeout after a key was added; (re)arm its expiry.
+
+        The timeout is the longest one among the hotkeys that still contain
+        every key of the tap, so it only shrinks as keys are added.
+
+        Args:
+            bit: Mask bit of the added key (0 without a candidate index)
+        """
+        state = self.state
+        state.mask |= bit
+        timeout = self.timeout
+        if self.candidates is not None:
+            candidate_timeout = self.candidates.max_tap_timeout(state.mask)
+            if candidate_timeout is not None:
+                timeout = candidate_timeout
+        state.timeout = timeout
+        if self._call_later is None or state.start_time is None or timeout is None:
+            return
+        deadline = state.start_time + timeout
+        if deadline == state.expiry_deadline:
+            return
+        if state.expiry is not None:
+            state.expiry.cancel()
+        state.expiry = self._call_later(max(deadline - perf_counter(), 0.0), lambda: self._on_tap_expired(state))
+        state.expiry_deadline = deadline
+
+    def _on_tap_expired(self, state: TapState) -> None:
+        """Invalidate a tap whose timeout passed while its keys are still held.
+
+        Runs on the event thread from the backend's timer. The held keys are
+        forgotten like on a restart: their releases are ignored and the next
+        press starts a new tap.
+
+        Args:
+            state: Tap state the timer was armed for
+        """
+        state.expiry = None
+        state.expiry_deadline = None
+        start_time = state.start_time
+        timeout = state.timeout
+        if not state.is_active or start_time is None or timeout is None:
+            return
+        # Callbacks see the device of the expired tap
+        self.state = state
+        elapsed = perf_counter() - start_time
+        if elapsed <= timeout:
+            # The tap was restarted without re-arming (external reset)
+            return
+        self._trace(fr.TAP_TIMEOUT, 0, fr.micros(elapsed))
+        if self.verbose:
+            self.logger.debug('Tap expired while keys are held: %.3fs > %.3fs', elapsed, timeout)
+        if self.on_tap_invalid:
+            self.on_tap_invalid('timeout exceeded', self.state.tap_combination, elapsed)
+        self.state.reset()
+        if self.verbose:
+            self.logger.debug(format_verbose_waiting())
+
     def _on_press(self, key: Any) -> None:
         """Handle key press event.
 
         Args:
             key: Canonical key name (str) like 'ctrl_l', 'a', 'delete'
         """
+        holds = self.holds
+        if holds is not None and holds.armed:
+            holds.interrupt(key, True, self.state.device)
+        buffer = self.buffer
+        if buffer is not None and buffer.active:
+            buffer.interrupt(key, self.state.device)
+
+        if self.state.pruned:
+            self.state.pressed_keys.add(key)
+            return
+
         # Ignore auto-repeat (key already pressed)
         if key in self.state.pressed_keys:
             if self.verbose:
                 self.logger.debug(f'{normalize_key(key)} already pressed (autorepeat), ignoring')
             return
 
+        self._restart_expired_tap()
+
+        # Drop the tap as soon as no hotkey contains all of its keys
+        bit = self._candidate_bit(key)
+        if bit is None:
+            return
+
         current_time = perf_counter()
         normalized_key = normalize_key(key)
 
         # If this is the first key, check if we should delay timer start
         if not self.state.is_active:
+            on_tap_start = self.on_tap_start
+            if on_tap_start is not None and is_modifier_key(key):
+                on_tap_start(bit, self.state.device)
+
             # Check if timer should be delayed (only in validation mode)
             should_delay = (self.validate_timeout and 
                           self.check_timer_delay and 
@@ -141,6 +481,8 @@ class TapMonitor:
                 self.state.is_active = True
                 self.state.timer_delayed = True
                 self.state.start_time = None
+                self.state.delayed_since = current_time
+                self._trace(fr.TAP_TIMER_DELAYED)
 
                 if self.verbose:
                     self.logger.debug('0.000s: %s pressed → Tap started, timer delayed until second key', normalized_key)
@@ -148,6 +490,7 @@ class TapMonitor:
                 # Start timer immediately (or no timer in display mode)
                 self.state.start_time = current_time if self.validate_timeout else None
                 self.state.is_active = True
+                self._trace(fr.TAP_STARTED)
 
                 if self.verbose:
                     if self.validate_timeout:
@@ -161,29 +504,28 @@ class TapMonitor:
             if (self.validate_timeout and 
                 self.state.timer_delayed and 
                 self.state.start_time is None):
-                self.state.start_time = current_time
                 self.state.timer_delayed = False
+                if self._keeps_timer_delayed(bit):
+                    self.state.start_time = current_time
+                    self._trace(fr.TAP_TIMER_STARTED)
 
-                if self.verbose:
-                    self.logger.debug('0.000s: %s pressed → Timer started NOW (second key)', normalized_key)
-
-            # Timer is already running (validation mode)
-            elif self.validate_timeout and self.state.start_time is not None:
-                elapsed = current_time - self.state.start_time
-
-                # Check if timeout already exceeded
-                if elapsed > self.timeout:
                     if self.verbose:
-                        self.logger.debug('Timeout exceeded during tap: %.3fs > %.3fs', elapsed, self.timeout)
-
-                    # Reset state and start a new tap
-                    self.state.reset()
-                    self.state.start_time = current_time
-                    self.state.is_active = True
+                        self.logger.debug('0.000s: %s pressed → Timer started NOW (second key)', normalized_key)
+                else:
+                    # No remaining candidate delays its timer: count from the first key
+                    self.state.start_time = self.state.delayed_since
+                    elapsed = current_time - self.state.start_time if self.state.start_time else 0.0
+                    self._trace(fr.TAP_TIMER_STARTED)
 
                     if self.verbose:
-                        self.logger.debug(format_verbose_press(normalized_key, 0.0, is_first=True))
-                elif self.verbose:
+                        self.logger.debug(
+                            '%.3fs: %s pressed → Timer counted from the first key', elapsed, normalized_key
+                        )
+
+            # Timer is already running (validation mode); an expired tap was restarted above
+            elif self.validate_timeout and self.state.start_time is not None:
+                if self.verbose:
+                    elapsed = current_time - self.state.start_time
                     self.logger.debug(format_verbose_press(normalized_key, elapsed, is_first=False))
 
             # Display mode - just log the key
@@ -193,6 +535,12 @@ class TapMonitor:
         # Add key to pressed and combination sets
         self.state.pressed_keys.add(key)
         self.state.tap_combination.add(key)
+        if self.validate_timeout:
+            self._update_deadline(bit)
+            if holds is not None and bit & holds.mask:
+                holds.on_combination(self.state.mask, key, self.state.device)
+            if buffer is not None and bit & buffer.mask:
+                buffer.on_combination(self.state.mask, key, self.state.device)
 
         # NEW SEMANTIC: If non-modifier key, complete tap immediately
         if not is_modifier_key(key) and self.state.is_active:
@@ -207,46 +555,50 @@ class TapMonitor:
             if self.validate_timeout:
                 # If timer never started (only one key with delayed timer)
                 if self.state.start_time is None:
+                    self._trace(fr.TAP_INSUFFICIENT_KEYS)
                     if self.verbose:
                         self.logger.debug('Tap invalid: timer never started (insufficient keys)')
 
                     if self.on_tap_invalid:
-                        self.on_tap_invalid('insufficient keys', self.state.tap_combination.copy(), 0.0)
+                        self.on_tap_invalid('insufficient keys', self.state.tap_combination, 0.0)
 
-                    self.state.reset()
+                    self._reset_tap()
                     if self.verbose:
                         self.logger.debug(format_verbose_waiting())
                     return
 
-                is_valid = duration <= self.timeout
+                is_valid = duration <= self.state.timeout
+                self._trace(fr.TAP_VALID if is_valid else fr.TAP_TIMEOUT, 0, fr.micros(duration))
 
                 if self.verbose:
-                    self.logger.debug(format_verbose_tap_result(is_valid, duration, self.timeout, self.state.tap_combination))
+                    self.logger.debug(
+                        format_verbose_tap_result(is_valid, duration, self.state.timeout, self.state.tap_combination)
+                    )
 
                 if is_valid:
                     # Valid tap detected!
                     if self.on_keys_detected:
                         self.on_keys_detected(
-                            self.state.tap_combination.copy(),
+                            self.state.tap_combination,
                             duration,
                             key,  # trigger_key
                             True  # has_non_modifier
                         )
                 elif self.on_tap_invalid:
-                    self.on_tap_invalid('timeout exceeded', self.state.tap_combination.copy(), duration)
+                    self.on_tap_invalid('timeout exceeded', self.state.tap_combination, duration)
 
             # Display mode: always show combination
             else:
                 if self.on_keys_detected:
                     self.on_keys_detected(
-                        self.state.tap_combination.copy(),
+                        self.state.tap_combination,
                         duration,
                         key,  # trigger_key
                         True  # has_non_modifier
                     )
 
             # Reset state
-            self.state.reset()
+            self._reset_tap()
 
             if self.verbose:
                 self.logger.debug(format_verbose_waiting())
@@ -257,6 +609,29 @@ class TapMonitor:
         Args:
             key: Canonical key name (str) like 'ctrl_l', 'a', 'delete'
         """
+        holds = self.holds
+        if holds is not None and holds.armed:
+            holds.interrupt(key, False, self.state.device)
+
+        buffer = self.buffer
+        if buffer is not None and buffer.active:
+            # The tap resolves first: a matching hotkey drops the held-back
+            # presses, otherwise they are emitted before this release
+            self._process_release(key)
+            buffer.flush()
+            return
+        self._process_release(key)
+
+    def _process_release(self, key: Any) -> None:
+        """Track a release and complete the tap on the first release of its keys.
+
+        Args:
+            key: Canonical key name (str) like 'ctrl_l', 'a', 'delete'
+        """
+        if self.state.pruned:
+            self._release_pruned(key)
+            return
+
         # NEW SEMANTIC: Check if this is a release during an active tap
         # Tap completes on FIRST key release, not when all keys are released
         should_process_tap = (key in self.state.pressed_keys and self.state.is_active)
@@ -275,15 +650,16 @@ class TapMonitor:
         if should_process_tap:
             # If timer was never started (only one key pressed with delayed timer)
             if self.validate_timeout and self.state.start_time is None:
+                self._trace(fr.TAP_INSUFFICIENT_KEYS)
                 if self.verbose:
                     self.logger.debug('Tap invalid: timer never started (insufficient keys)')
 
                 # This is an invalid tap - combination requires at least 2 keys
                 if self.on_tap_invalid:
-                    self.on_tap_invalid('insufficient keys', self.state.tap_combination.copy(), 0.0)
+                    self.on_tap_invalid('insufficient keys', self.state.tap_combination, 0.0)
 
                 # Reset state
-                self.state.reset()
+                self._reset_tap()
 
                 if self.verbose:
                     self.logger.debug(format_verbose_waiting())
@@ -298,36 +674,39 @@ class TapMonitor:
 
             # Validation mode: check timeout
             if self.validate_timeout:
-                is_valid = duration <= self.timeout
+                is_valid = duration <= self.state.timeout
+                self._trace(fr.TAP_VALID if is_valid else fr.TAP_TIMEOUT, 0, fr.micros(duration))
 
                 if self.verbose:
-                    self.logger.debug(format_verbose_tap_result(is_valid, duration, self.timeout, self.state.tap_combination))
+                    self.logger.debug(
+                        format_verbose_tap_result(is_valid, duration, self.state.timeout, self.state.tap_combination)
+                    )
 
                 if is_valid:
                     # Valid tap detected (modifier-only)!
                     if self.on_keys_detected:
                         self.on_keys_detected(
-                            self.state.tap_combination.copy(),
+                            self.state.tap_combination,
                             duration,
                             key,  # trigger_key (released key)
                             False  # has_non_modifier (modifier-only tap)
                         )
                 # Invalid tap (timeout exceeded)
                 elif self.on_tap_invalid:
-                    self.on_tap_invalid('timeout exceeded', self.state.tap_combination.copy(), duration)
+                    self.on_tap_invalid('timeout exceeded', self.state.tap_combination, duration)
 
             # Display mode: always show the combination
             else:
                 if self.on_keys_detected:
                     self.on_keys_detected(
-                        self.state.tap_combination.copy(),
+                        self.state.tap_combination,
                         duration,
                         key,  # trigger_key (released key)
                         False  # has_non_modifier (modifier-only tap)
                     )
 
             # Reset state
-            self.state.reset()
+            self._reset_tap()
 
             if self.verbose:
                 self.logger.debug(format_verbose_waiting())
\ No newline at end of file
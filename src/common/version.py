@@ -1,12 +1,16 @@
 """Version information for tap-launcher.
 
-This module provides functionality to read version information from pyproject.toml.
+This module provides functionality to read version information from pyproject.toml
+(source checkout) or from installed package metadata. The result is resolved once
+per process and cached; nothing is read at import time.
 """
 
-import tomllib
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
+DISTRIBUTION_NAME = 'tap-launcher'
+
 
 def _find_pyproject_toml() -> Path | None:
     """Find pyproject.toml file in the project root.
@@ -56,43 +60,69 @@ class VersionInfo:
         return f'v{self.version}'
 
 
+@cache
 def get_version_info() -> VersionInfo:
-    """Get version information from pyproject.toml.
-    
+    """Get version information (resolved once per process).
+
+    pyproject.toml of a source checkout is preferred because it also carries
+    the release date; installed packages fall back to package metadata.
+
     Returns:
-        VersionInfo instance with version and release_date from pyproject.toml.
+        VersionInfo instance with version and release_date.
         If version is not found, returns VersionInfo with version='unknown'.
     """
     pyproject_path = _find_pyproject_toml()
-    if pyproject_path is None:
-        return VersionInfo(version='unknown')
-    
+    if pyproject_path is not None:
+        version_info = _read_pyproject(pyproject_path)
+        if version_info is not None:
+            return version_info
+    return _read_package_metadata()
+
+
+def _read_pyproject(pyproject_path: Path) -> VersionInfo | None:
+    """Read version information from pyproject.toml.
+
+    Returns:
+        VersionInfo, or None if the file cannot be parsed or has no version.
+    """
+    import tomllib  # noqa: PLC0415
+
     try:
         with pyproject_path.open('rb') as f:
             data = tomllib.load(f)
-        
-        project_data = data.get('project', {})
-        version = project_data.get('version')
-        release_date = project_data.get('release_date')
-        
-        version_str = str(version) if version else 'unknown'
-        release_date_str = str(release_date) if release_date else None
-        
-        return VersionInfo(version=version_str, release_date=release_date_str)
     except Exception:  # noqa: BLE001
-        # If anything goes wrong, return unknown version
+        return None
+
+    project_data = data.get('project', {})
+    version = project_data.get('version')
+    if not version:
+        return None
+    release_date = project_data.get('release_date')
+    return VersionInfo(version=str(version), release_date=str(release_date) if release_date else None)
+
+
+def _read_package_metadata() -> VersionInfo:
+    """Read version from installed package metadata (no release date there)."""
+    from importlib import metadata  # noqa: PLC0415
+
+    try:
+        return VersionInfo(version=metadata.version(DISTRIBUTION_NAME))
+    except metadata.PackageNotFoundError:
         return VersionInfo(version='unknown')
 
 
 # Export version for backward compatibility
 def get_version() -> str:
-    """Get version string from pyproject.toml (backward compatibility).
+    """Get version string (backward compatibility).
     
     Returns:
-        Version string from pyproject.toml, or 'unknown' if not found.
+        Version string, or 'unknown' if not found.
     """
     return get_version_info().version
 
 
-__version__ = get_version()
-
+def __getattr__(name: str) -> str:
+    # __version__ is resolved lazily so importing this module stays free
+    if name == '__version__':
+        return get_version()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')  # noqa: TRY003
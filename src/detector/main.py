@@ -11,6 +11,7 @@ import typer
 
 from common.backends.detector import create_backend
 from common.backends.device_listing import list_keyboard_devices
+from common.backends.stream_backend import LauncherStreamBackend
 from common.logging_utils import get_logger
 from common.logging_utils import setup_logging_handler
 from common.runtime_state import LaunchRuntimeState
@@ -90,6 +91,26 @@ def _restart_launcher_after_detection(managed_launcher: ManagedLauncher | None)
         typer.echo(f'Run manually: {manual_args}', err=True)
 
 
+def _attach_to_launcher() -> tuple[LauncherStreamBackend | None, ManagedLauncher | None]:
+    """Get keyboard access without fighting a running launcher for the grab.
+
+    Returns:
+        tuple: (stream backend, or None when detector reads keyboard devices
+            itself; launcher stopped for detection that must be restarted)
+    """
+    stream_backend = LauncherStreamBackend.attach()
+    if stream_backend is None:
+        # No launcher, or one without an event stream: stop it temporarily
+        return None, _stop_launcher_for_detection()
+    if stream_backend.suspended:
+        # A suspended launcher has released the keyboard and forwards nothing
+        stream_backend.stop()
+        typer.echo('Tap launcher is suspended; reading keyboard devices directly.')
+        return None, None
+    typer.echo('Tap launcher is running; reading keys from it (hotkeys stay active).')
+    return stream_backend, None
+
+
 def _install_detector_signal_handlers() -> None:
     """Ensure detector shutdown uses Python unwinding so launcher restoration runs."""
 
@@ -140,10 +161,10 @@ def main(
 
     # Define callback for key detection
     def on_keys_detected(keys: set[str], duration: float, _trigger_key: str, _has_non_modifier: bool) -> None:
-        """Called when keys are detected."""
+        """Called when keys are detected (``keys`` is only valid during the call)."""
         sys.stdout.write(format_keys_detected(keys, duration))
 
-    launcher_state = _stop_launcher_for_detection()
+    stream_backend, launcher_state = _attach_to_launcher()
 
     try:
         # Print header
@@ -152,8 +173,8 @@ def main(
         else:
             sys.stdout.write(format_header())
 
-        # Create backend (auto-detects all available keyboards)
-        backend = create_backend()
+        # Use the launcher's event stream, or grab keyboards directly
+        backend = stream_backend if stream_backend is not None else create_backend()
 
         # Create and start monitor (no timeout = display mode)
         monitor = TapMonitor(
@@ -7,11 +7,35 @@ import os
 import shutil
 import subprocess
 from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
 
 from common.logging_utils import get_logger
+from common.metrics import REGISTRY
 
+from .launch_stats import LaunchStats
+from .launch_stats import LaunchTiming
 from .models import HotkeyConfig
 
+if TYPE_CHECKING:
+    from .prewarm import Prewarmer
+
+SPAWN_LATENCY = REGISTRY.histogram(
+    'tap_launcher_spawn_latency_seconds',
+    'Time from fork to successful exec of launched commands',
+    ('hotkey',),
+)
+TAP_TO_EXEC_LATENCY = REGISTRY.histogram(
+    'tap_launcher_tap_to_exec_latency_seconds',
+    'Time from tap detection to successful exec of launched commands',
+    ('hotkey',),
+)
+LAUNCH_FAILURES = REGISTRY.counter(
+    'tap_launcher_launch_failures_total',
+    'Commands that could not be launched',
+    ('hotkey',),
+)
+
 
 class CommandExecutor:
     """Execute commands in non-blocking mode.
@@ -20,23 +44,42 @@ class CommandExecutor:
     hotkey combinations are detected.
     """
 
-    def __init__(self, log_commands: bool = True) -> None:
+    def __init__(self, log_commands: bool = True, stats: LaunchStats | None = None) -> None:
         """Initialize the command executor.
 
         Args:
             log_commands: Whether to log command execution
+            stats: Optional tap-to-exec latency statistics collector
         """
         self.log_commands = log_commands
+        self.stats = stats
         self.logger = get_logger('tap_launcher.executor')
-
-    def execute(self, hotkey: HotkeyConfig) -> bool:
+        # Warm shells prepared while taps are in progress (None unless
+        # ``prewarm`` is enabled); set by the monitor
+        self.prewarm: Prewarmer | None = None
+
+    def execute(
+        self,
+        hotkey: HotkeyConfig,
+        detected_at: float | None = None,
+        resolved_at: float | None = None,
+    ) -> bool:
         """Execute the command associated with a hotkey.
 
         The command is executed in a new process group and detached from
         the parent process, so it continues running even if tap-launcher exits.
 
+        When ``detected_at`` is given and statistics are enabled, the
+        tap → fork → execve latency of this launch is recorded. A launch
+        handed to a warm shell (see ``Prewarmer``) ends its spawn stage when
+        the command line is written; the shell execs it right after.
+        ``resolved_at`` marks when a sequence hotkey was resolved; the time
+        spent waiting for it is reported as a separate stage.
+
         Args:
             hotkey: Hotkey configuration containing command to execute
+            detected_at: ``perf_counter()`` timestamp of the tap detection
+            resolved_at: ``perf_counter()`` timestamp of the hotkey resolution
 
         Returns:
             bool: True if command was launched successfully, False on error
@@ -63,28 +106,46 @@ class CommandExecutor:
             else:
                 self.logger.info(f'Executing: {cmd_str}')
 
+        label = hotkey.label()
         try:
-            self._spawn_background(cmd)
+            spawn_start = perf_counter()
+            if self.prewarm is None or not self.prewarm.launch(cmd):
+                self._spawn_background(cmd)
+            exec_done = perf_counter()
         except FileNotFoundError:
             self.logger.exception(
                 f'Command not found: {hotkey.command}\n'
                 f'Make sure the command exists and is in PATH'
             )
+            self._record_failure(label)
             return False
         except PermissionError:
             self.logger.exception(
                 f'Permission denied executing: {hotkey.command}\n'
                 f'Check file permissions and executable flag'
             )
+            self._record_failure(label)
             return False
         except Exception:
             self.logger.exception(
                 f"Failed to execute command '{hotkey.command}'"
             )
+            self._record_failure(label)
             return False
         else:
+            SPAWN_LATENCY.observe(exec_done - spawn_start, label)
+            if detected_at is not None:
+                TAP_TO_EXEC_LATENCY.observe(exec_done - detected_at, label)
+                if self.stats is not None:
+                    self.stats.record(label, LaunchTiming(detected_at, spawn_start, exec_done, resolved_at))
             return True
 
+    def _record_failure(self, label: str) -> None:
+        """Count a failed launch in metrics and statistics."""
+        LAUNCH_FAILURES.inc(label)
+        if self.stats is not None:
+            self.stats.record_failure(label)
+
     def check_command_exists(self, command: str) -> bool:
         """Check if a command exists and is executable.
 
@@ -121,6 +182,11 @@ class CommandExecutor:
 
         - stdout/stderr redirected to DEVNULL to avoid blocking
         - start_new_session=True detaches from parent process
+
+        ``Popen`` returns only after the child has successfully called
+        ``execve``: CPython's ``_posixsubprocess`` waits on a close-on-exec
+        error pipe and raises the child's errno if exec fails. The time spent
+        here is therefore exactly fork → successful exec.
         """
         subprocess.Popen(  # noqa: S603
             cmd,
@@ -0,0 +1,193 @@
+"""Compiled configuration cache for tap-launcher.
+
+Loading a configuration parses TOML, validates every hotkey, checks for
+duplicate combinations, builds the ``HotkeyMatcher`` indexes and resolves
+every command in PATH. With generated configs of thousands of hotkeys this
+is noticeable on every start and reload.
+
+The result of all these steps is stored as a compiled artifact next to the
+runtime state and loaded with a single read. The TOML file stays
+authoritative: the artifact is only used when it was compiled from exactly
+the same content (SHA-256) and none of its dependencies changed since —
+PATH, the mtimes of PATH directories and resolved executables, and the
+mtimes of the modules that define the compiled objects.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import stat
+import sys
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+from common.runtime_state import CONFIG_CACHE_FILE
+
+from .config_loader import ConfigLoader
+from .hotkey_matcher import HotkeyMatcher
+from .models import AppConfig
+
+CACHE_FORMAT = 1
+
+# Modules whose code shapes the compiled objects; editing any of them
+# invalidates the cache
+_SOURCE_MODULES = (
+    'launcher.config_cache',
+    'launcher.config_loader',
+    'launcher.hotkey_matcher',
+    'launcher.models',
+    'common.key_normalizer',
+)
+
+
+@dataclass
+class CompiledConfig:
+    """Validated configuration with everything derived from it.
+
+    Attributes:
+        config: Validated application configuration
+        config_path: Resolved path of the source TOML file
+        matcher: Hotkey matcher with its lookup indexes built
+        resolved_commands: Command → executable path (None if not found)
+        from_cache: Whether this instance was loaded from the cache
+    """
+    config: AppConfig
+    config_path: Path
+    matcher: HotkeyMatcher
+    resolved_commands: dict[str, str | None] = field(default_factory=dict)
+    from_cache: bool = False
+
+    def missing_commands(self) -> list[str]:
+        """Return configured commands that were not found."""
+        return [command for command, resolved in self.resolved_commands.items() if resolved is None]
+
+
+def load_compiled_config(
+    config_path: Path | None = None,
+    cache_file: Path | None = CONFIG_CACHE_FILE,
+) -> CompiledConfig:
+    """Load configuration, reusing the compiled cache when it is up to date.
+
+    Args:
+        config_path: Path to config file. If None, tries default paths.
+        cache_file: Compiled cache location (None disables the cache)
+
+    Returns:
+        CompiledConfig: Compiled configuration
+
+    Raises:
+        FileNotFoundError: If config file not found
+        ValueError: If configuration is invalid
+        tomllib.TOMLDecodeError: If TOML syntax is invalid
+    """
+    path = ConfigLoader.resolve_path(config_path).resolve()
+    content = path.read_bytes()
+    content_hash = hashlib.sha256(content).hexdigest()
+
+    if cache_file is not None:
+        cached = _read_cache(cache_file, path, content_hash)
+        if cached is not None:
+            return cached
+
+    config = ConfigLoader.parse_bytes(content, path)
+    compiled = CompiledConfig(
+        config=config,
+        config_path=path,
+        matcher=HotkeyMatcher(config.hotkeys, config.tap_timeout),
+        resolved_commands={hk.command: _resolve_command(hk.command) for hk in config.all_hotkeys() if hk.command},
+    )
+    if cache_file is not None:
+        _write_cache(cache_file, content_hash, compiled)
+    return compiled
+
+
+def _resolve_command(command: str) -> str | None:
+    """Resolve a command to an executable path, like CommandExecutor.check_command_exists."""
+    if Path(command).is_absolute():
+        return command if os.path.isfile(command) and os.access(command, os.X_OK) else None  # noqa: PTH113
+    return shutil.which(command)
+
+
+def _dependencies(compiled: CompiledConfig) -> dict[str, int | None]:
+    """Return path → mtime_ns of everything the compiled result depends on."""
+    paths: list[str] = []
+    for name in _SOURCE_MODULES:
+        module_file = getattr(sys.modules.get(name), '__file__', None)
+        if module_file:
+            paths.append(module_file)
+    paths.extend(d for d in os.environ.get('PATH', '').split(os.pathsep) if d)
+    paths.extend(resolved for resolved in compiled.resolved_commands.values() if resolved)
+    for command, resolved in compiled.resolved_commands.items():
+        if resolved is None and Path(command).is_absolute():
+            paths.append(command)
+    return {p: _mtime_ns(p) for p in paths}
+
+
+def _mtime_ns(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns  # noqa: PTH116
+    except OSError:
+        return None
+
+
+def _cache_key(content_hash: str, config_path: Path) -> dict[str, Any]:
+    return {
+        'format': CACHE_FORMAT,
+        'python': sys.version_info[:2],
+        'config_path': str(config_path),
+        'content_hash': content_hash,
+        'path_env': os.environ.get('PATH', ''),
+    }
+
+
+def _read_private_file(path: Path) -> bytes | None:
+    """Read a file in one go, only if it is owned by us and not writable by others."""
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW)
+    except OSError:
+        return None
+    try:
+        st = os.fstat(fd)
+        # Only trust a private file: unpickling executes code
+        if st.st_uid != os.getuid() or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            return None
+        with os.fdopen(fd, 'rb', closefd=False) as f:
+            return f.read()
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def _read_cache(cache_file: Path, config_path: Path, content_hash: str) -> CompiledConfig | None:
+    """Return the cached compiled config if it is valid for this content."""
+    data = _read_private_file(cache_file)
+    if data is None:
+        return None
+    try:
+        key, dependencies, compiled = pickle.loads(data)  # noqa: S301
+    except Exception:  # noqa: BLE001
+        return None
+    if key != _cache_key(content_hash, config_path) or not isinstance(compiled, CompiledConfig):
+        return None
+    if any(_mtime_ns(path) != mtime for path, mtime in dependencies.items()):
+        return None
+    compiled.from_cache = True
+    return compiled
+
+
+def _write_cache(cache_file: Path, content_hash: str, compiled: CompiledConfig) -> None:
+    """Store the compiled config atomically; failures only cost the next start."""
+    payload = (_cache_key(content_hash, compiled.config_path), _dependencies(compiled), compiled)
+    tmp_file = cache_file.with_suffix(f'{cache_file.suffix}.tmp')
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_file.replace(cache_file)
+    except (OSError, pickle.PicklingError):
+        tmp_file.unlink(missing_ok=True)
@@ -7,8 +7,12 @@ import tomllib
 from pathlib import Path
 from typing import ClassVar
 
+from .models import DEFAULT_LAYER_TIMEOUT
+from .models import DEFAULT_TAP_TIMEOUT
 from .models import AppConfig
 from .models import HotkeyConfig
+from .models import KeyRemap
+from .models import LayerConfig
 
 
 class ConfigLoader:
@@ -34,17 +38,32 @@ class ConfigLoader:
             ValueError: If configuration is invalid
             tomllib.TOMLDecodeError: If TOML syntax is invalid
         """
+        path = ConfigLoader.resolve_path(config_path)
+        config = ConfigLoader._load_from_path(path)
+        return (config, path.resolve())
+
+    @staticmethod
+    def resolve_path(config_path: Path | None = None) -> Path:
+        """Return the config file to load.
+
+        Args:
+            config_path: Path to config file. If None, tries default paths.
+
+        Returns:
+            Path: Existing config file
+
+        Raises:
+            FileNotFoundError: If config file not found
+        """
         if config_path:
             if not config_path.exists():
                 raise FileNotFoundError(f'Config file not found: {config_path}')  # noqa: TRY003
-            config = ConfigLoader._load_from_path(config_path)
-            return (config, config_path.resolve())
+            return config_path
 
         # Try default paths
         for path in ConfigLoader.DEFAULT_PATHS:
             if path.exists():
-                config = ConfigLoader._load_from_path(path)
-                return (config, path.resolve())
+                return path
 
         paths_str = ', '.join(str(p) for p in ConfigLoader.DEFAULT_PATHS)
         raise FileNotFoundError(  # noqa: TRY003
@@ -62,13 +81,29 @@ class ConfigLoader:
         Returns:
             AppConfig: Parsed configuration
 
+        Raises:
+            ValueError: If configuration is invalid
+            tomllib.TOMLDecodeError: If TOML syntax is invalid
+        """
+        return ConfigLoader.parse_bytes(path.read_bytes(), path)
+
+    @staticmethod
+    def parse_bytes(content: bytes, path: Path) -> AppConfig:
+        """Parse and validate configuration file content.
+
+        Args:
+            content: Raw TOML file content
+            path: Path the content was read from (for error messages)
+
+        Returns:
+            AppConfig: Parsed configuration
+
         Raises:
             ValueError: If configuration is invalid
             tomllib.TOMLDecodeError: If TOML syntax is invalid
         """
         try:
-            with path.open('rb') as f:
-                data = tomllib.load(f)
+            data = tomllib.loads(content.decode())
         except tomllib.TOMLDecodeError as e:
             raise tomllib.TOMLDecodeError(  # noqa: TRY003
                 f'Invalid TOML syntax in {path}: {e}'
@@ -92,29 +127,41 @@ class ConfigLoader:
         # Parse app section
         app_data = data.get('app', {})
 
-        tap_timeout = app_data.get('tap_timeout', 0.2)
+        tap_timeout = app_data.get('tap_timeout', DEFAULT_TAP_TIMEOUT)
         log_level = app_data.get('log_level', 'INFO').upper()
         log_file_str = app_data.get('log_file')
+        log_max_bytes = app_data.get('log_max_bytes', 10 * 1024 * 1024)
+        log_backup_count = app_data.get('log_backup_count', 5)
         debug_mode = app_data.get('debug_mode', False)
         verbose_logging = app_data.get('verbose_logging', False)
+        stats_log_interval = app_data.get('stats_log_interval', 300.0)
+        metrics_file_str = app_data.get('metrics_file')
+        metrics_interval = app_data.get('metrics_interval', 15.0)
+        trace_buffer_size = app_data.get('trace_buffer_size', 4096)
+        sequence_timeout = app_data.get('sequence_timeout', 0.4)
+        press_buffer_ms = app_data.get('press_buffer_ms', 0)
+        prewarm = app_data.get('prewarm', False)
 
         # Parse log file path
         log_file = None
         if log_file_str:
             log_file = Path(log_file_str).expanduser()
+        metrics_file = Path(metrics_file_str).expanduser() if metrics_file_str else None
 
         # Parse hotkeys
         hotkeys_data = data.get('hotkeys', [])
         if not hotkeys_data:
             raise ValueError('Configuration must have at least one [[hotkeys]] section')  # noqa: TRY003
 
-        hotkeys = []
-        for idx, hk_data in enumerate(hotkeys_data, 1):
+        hotkeys = ConfigLoader._parse_hotkeys(hotkeys_data)
+        layers = [ConfigLoader._parse_layer(layer_data) for layer_data in data.get('layers', [])]
+
+        remaps = []
+        for idx, remap_data in enumerate(data.get('remap', []), 1):
             try:
-                hotkey = ConfigLoader._parse_hotkey(hk_data)
-                hotkeys.append(hotkey)
+                remaps.append(ConfigLoader._parse_remap(remap_data))
             except ValueError as e:
-                raise ValueError(f'Error in hotkey #{idx}: {e}') from e  # noqa: TRY003
+                raise ValueError(f'Error in remap #{idx}: {e}') from e  # noqa: TRY003
 
         # Create and validate AppConfig
         try:
@@ -122,15 +169,63 @@ class ConfigLoader:
                 tap_timeout=tap_timeout,
                 log_level=log_level,
                 log_file=log_file,
+                log_max_bytes=log_max_bytes,
+                log_backup_count=log_backup_count,
                 debug_mode=debug_mode,
                 verbose_logging=verbose_logging,
+                stats_log_interval=stats_log_interval,
+                metrics_file=metrics_file,
+                metrics_interval=metrics_interval,
+                trace_buffer_size=trace_buffer_size,
+                sequence_timeout=sequence_timeout,
+                press_buffer_ms=press_buffer_ms,
+                prewarm=prewarm,
                 hotkeys=hotkeys,
+                remaps=remaps,
+                layers=layers,
             )
         except ValueError as e:
             raise ValueError(f'Invalid configuration: {e}') from e  # noqa: TRY003
 
         return config
 
+    @staticmethod
+    def _parse_hotkeys(hotkeys_data: list) -> list[HotkeyConfig]:
+        """Parse a list of ``[[hotkeys]]`` sections.
+
+        Raises:
+            ValueError: If a hotkey configuration is invalid
+        """
+        hotkeys = []
+        for idx, hk_data in enumerate(hotkeys_data, 1):
+            try:
+                hotkey = ConfigLoader._parse_hotkey(hk_data)
+                hotkeys.append(hotkey)
+            except ValueError as e:
+                raise ValueError(f'Error in hotkey #{idx}: {e}') from e  # noqa: TRY003
+        return hotkeys
+
+    @staticmethod
+    def _parse_layer(data: dict) -> LayerConfig:
+        """Parse a ``[[layers]]`` section with its ``[[layers.hotkeys]]``.
+
+        Raises:
+            TypeError: If ``name`` is not a string or ``timeout`` not a number
+            ValueError: If the layer or one of its hotkeys is invalid
+        """
+        name = data.get('name')
+        if not isinstance(name, str):
+            raise TypeError("A layer must have a 'name' string")  # noqa: TRY003
+        timeout = data.get('timeout', DEFAULT_LAYER_TIMEOUT)
+        if isinstance(timeout, bool) or not isinstance(timeout, int | float):
+            raise TypeError(f"'timeout' of layer {name!r} must be a number")  # noqa: TRY003
+        try:
+            return LayerConfig(
+                name=name, hotkeys=ConfigLoader._parse_hotkeys(data.get('hotkeys', [])), timeout=float(timeout)
+            )
+        except ValueError as e:
+            raise ValueError(f'Error in layer {name!r}: {e}') from e  # noqa: TRY003
+
     @staticmethod
     def _parse_hotkey(data: dict) -> HotkeyConfig:
         """Parse hotkey configuration from TOML data.
@@ -144,7 +239,8 @@ class ConfigLoader:
         Raises:
             ValueError: If hotkey configuration is invalid
         """
-        keys = data.get('keys')
+        sequence = ConfigLoader._parse_sequence(data)
+        keys = sequence[0] if sequence else data.get('keys')
         if not keys:
             raise ValueError("Hotkey must have 'keys' field")  # noqa: TRY003
         if not isinstance(keys, list):
@@ -152,11 +248,7 @@ class ConfigLoader:
         if not all(isinstance(k, str) for k in keys):
             raise ValueError('All keys must be strings')  # noqa: TRY003
 
-        command = data.get('command')
-        if not command:
-            raise ValueError("Hotkey must have 'command' field")  # noqa: TRY003
-        if not isinstance(command, str):
-            raise TypeError("'command' must be a string")  # noqa: TRY003
+        command, layer = ConfigLoader._parse_action(data)
 
         args = data.get('args', [])
         if not isinstance(args, list):
@@ -178,6 +270,120 @@ class ConfigLoader:
             args=args,
             description=description,
             start_timer_from_second_key=start_timer_from_second_key,
+            sequence=sequence,
+            tap_timeout=ConfigLoader._parse_tap_timeout(data),
+            **ConfigLoader._parse_trigger(data),
+            devices=ConfigLoader._parse_devices(data),
+            layer=layer,
         )
 
+    @staticmethod
+    def _parse_remap(data: dict) -> KeyRemap:
+        """Parse a ``[[remap]]`` section (``from``, ``to`` and optional ``devices``).
+
+        Raises:
+            TypeError: If ``from`` or ``to`` is not a string
+            ValueError: If the remapping is invalid
+        """
+        source = data.get('from')
+        target = data.get('to')
+        if not isinstance(source, str) or not isinstance(target, str):
+            raise TypeError("A remapping must have 'from' and 'to' key names")  # noqa: TRY003
+        return KeyRemap(source=source, target=target, devices=ConfigLoader._parse_devices(data))
+
+    @staticmethod
+    def _parse_action(data: dict) -> tuple[str, str]:
+        """Parse ``command`` and the optional ``layer`` of a hotkey (``command`` is optional with ``layer``).
+
+        Raises:
+            TypeError: If ``command`` or ``layer`` is not a string
+            ValueError: If neither is given
+        """
+        layer = data.get('layer', '')
+        if not isinstance(layer, str):
+            raise TypeError("'layer' must be a layer name")  # noqa: TRY003
+        command = data.get('command', '' if layer else None)
+        if command is None:
+            raise ValueError("Hotkey must have 'command' field")  # noqa: TRY003
+        if not isinstance(command, str):
+            raise TypeError("'command' must be a string")  # noqa: TRY003
+        return command, layer
+
+    @staticmethod
+    def _parse_tap_timeout(data: dict) -> float | None:
+        """Parse the optional per-hotkey ``tap_timeout`` (seconds).
+
+        Raises:
+            TypeError: If the value is not a number
+        """
+        tap_timeout = data.get('tap_timeout')
+        if tap_timeout is None:
+            return None
+        if isinstance(tap_timeout, bool) or not isinstance(tap_timeout, int | float):
+            raise TypeError("'tap_timeout' must be a number")  # noqa: TRY003
+        return float(tap_timeout)
+
+    @staticmethod
+    def _parse_devices(data: dict) -> list[str]:
+        """Parse the optional ``devices`` field of a hotkey or remapping.
+
+        Raises:
+            TypeError: If the value is not a list of strings
+        """
+        devices = data.get('devices', [])
+        if not isinstance(devices, list) or not all(isinstance(d, str) and d for d in devices):
+            raise TypeError("'devices' must be a list of device names or vendor:product ids")  # noqa: TRY003
+        return devices
+
+    @staticmethod
+    def _parse_trigger(data: dict) -> dict:
+        """Parse the optional ``trigger``, ``hold_ms``, ``fire_on`` and ``grace_ms`` fields of a hotkey.
+
+        Raises:
+            TypeError: If ``trigger`` or ``fire_on`` is not a string, or
+                ``hold_ms`` or ``grace_ms`` not an integer
+        """
+        fields = {'trigger': data.get('trigger', 'tap'), 'fire_on': data.get('fire_on', 'release')}
+        for name, value in fields.items():
+            if not isinstance(value, str):
+                raise TypeError(f"'{name}' must be a string")  # noqa: TRY003
+        for name in ('hold_ms', 'grace_ms'):
+            value = data.get(name)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int)):
+                raise TypeError(f"'{name}' must be an integer")  # noqa: TRY003
+            fields[name] = value
+        return fields
+
+    @staticmethod
+    def _parse_sequence(data: dict) -> list[list[str]]:
+        """Parse the ``sequence`` field of a hotkey.
+
+        Each step is a list of keys tapped together; a plain string is
+        shorthand for a single key (``["super_l", "t"]``).
+
+        Args:
+            data: Hotkey section from TOML
+
+        Returns:
+            list[list[str]]: Steps of the sequence (empty if absent)
+
+        Raises:
+            ValueError: If both ``keys`` and ``sequence`` are given
+            TypeError: If the sequence is not a list of steps
+        """
+        sequence = data.get('sequence')
+        if sequence is None:
+            return []
+        if data.get('keys'):
+            raise ValueError("Hotkey must have either 'keys' or 'sequence', not both")  # noqa: TRY003
+        if not isinstance(sequence, list):
+            raise TypeError("'sequence' must be a list")  # noqa: TRY003
+        steps = []
+        for step in sequence:
+            keys = [step] if isinstance(step, str) else step
+            if not isinstance(keys, list) or not all(isinstance(k, str) for k in keys):
+                raise TypeError("Every 'sequence' step must be a key name or a list of key names")  # noqa: TRY003
+            steps.append(keys)
+        return steps
+
 
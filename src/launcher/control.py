@@ -0,0 +1,251 @@
+"""Control socket handlers for the tap-launcher daemon.
+
+This module wires the generic ``common.control_socket.ControlServer`` to
+the running launcher: status, live counters, statistics, Prometheus
+metrics, flight recorder dumps, on-demand profiling, config reload,
+suspend/resume of keyboard grabbing, graceful shutdown and the key/tap event
+stream used by ``detect``.
+
+Handlers run on control connection threads. Anything that mutates backend
+or tap state is posted to the keyboard event thread via the backend's
+``call_soon`` so the event loop never needs locks.
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import TypeVar
+
+from common import flight_recorder as fr
+from common.control_socket import ControlHandler
+from common.control_socket import ControlRequest
+from common.control_socket import ControlServer
+from common.control_socket import write_message
+from common.event_stream import KeyEventPublisher
+from common.metrics import REGISTRY
+from common.version import get_version_info
+
+from .config_cache import load_compiled_config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .monitor import LauncherMonitor
+    from .profiler import EventThreadProfiler
+
+T = TypeVar('T')
+
+EVENT_THREAD_TIMEOUT = 2.0
+
+
+class LauncherControl:
+    """Serve the launcher control API.
+
+    Args:
+        monitor: Running launcher monitor
+        config_path: Path of the loaded configuration file
+        debug: Whether the daemon was started with --debug
+        foreground: Whether the daemon runs in foreground mode
+    """
+
+    def __init__(
+        self,
+        monitor: LauncherMonitor,
+        config_path: Path,
+        debug: bool,
+        foreground: bool,
+    ) -> None:
+        self.monitor = monitor
+        self.config_path = config_path
+        self.debug = debug
+        self.foreground = foreground
+        self.started_at = time.time()
+        self._cpu_at_start = self._cpu_seconds()
+        self.publisher = KeyEventPublisher(self._on_stream_active_change)
+        self.server = ControlServer(self.handlers())
+        # Created by the first 'profile' request
+        self._profiler: EventThreadProfiler | None = None
+
+    def handlers(self) -> dict[str, ControlHandler]:
+        """Return the command → handler mapping."""
+        return {
+            'status': self._status,
+            'stats': self._stats,
+            'metrics': self._metrics,
+            'trace': self._trace,
+            'profile': self._profile,
+            'reload': self._reload,
+            'suspend': self._suspend,
+            'resume': self._resume,
+            'stop': self._stop,
+            'subscribe': self._subscribe,
+        }
+
+    def start(self) -> None:
+        """Start serving the control socket."""
+        self.server.start()
+
+    def stop(self) -> None:
+        """Stop serving, disconnect stream subscribers and remove the control socket."""
+        self.server.stop()
+        self.publisher.close()
+
+    # -------------------- helpers --------------------
+    def _run_on_event_thread(self, fn: Callable[[], T]) -> T:
+        """Execute ``fn`` on the keyboard event thread and wait for its result."""
+        backend = self.monitor.tap_monitor.backend
+        call_soon = getattr(backend, 'call_soon', None)
+        if call_soon is None:
+            return fn()
+
+        done = threading.Event()
+        result: list[Any] = []
+        error: list[BaseException] = []
+
+        def run() -> None:
+            try:
+                result.append(fn())
+            except Exception as e:  # noqa: BLE001
+                error.append(e)
+            finally:
+                done.set()
+
+        call_soon(run)
+        if not done.wait(EVENT_THREAD_TIMEOUT):
+            raise TimeoutError('event loop did not respond')  # noqa: TRY003
+        if error:
+            raise error[0]
+        return result[0]
+
+    def _on_stream_active_change(self, active: bool) -> None:
+        """Hook the event stream into the event path only while someone listens."""
+        backend = self.monitor.tap_monitor.backend
+        publisher = self.publisher
+
+        def apply() -> None:
+            if hasattr(backend, 'set_key_observer'):
+                backend.set_key_observer(publisher.publish_key if active else None)
+            self.monitor.tap_observer = publisher.publish_tap if active else None
+
+        call_soon = getattr(backend, 'call_soon', None)
+        if call_soon is None:
+            apply()
+        else:
+            call_soon(apply)
+
+    @staticmethod
+    def _memory_rss_bytes() -> int | None:
+        """Return resident set size of this process from /proc (no sampling)."""
+        try:
+            with Path('/proc/self/statm').open() as f:
+                rss_pages = int(f.read().split()[1])
+        except (OSError, ValueError, IndexError):
+            return None
+        return rss_pages * os.sysconf('SC_PAGE_SIZE')
+
+    @staticmethod
+    def _cpu_seconds() -> float:
+        """Return user + system CPU time consumed by this process."""
+        cpu = os.times()
+        return cpu.user + cpu.system
+
+    def _counters(self) -> dict[str, Any]:
+        backend = self.monitor.tap_monitor.backend
+        backend_stats = backend.get_stats() if hasattr(backend, 'get_stats') else {}
+        return {**backend_stats, **self.monitor.counters()}
+
+    # -------------------- handlers --------------------
+    def _status(self, _request: ControlRequest) -> dict[str, Any]:
+        uptime = time.time() - self.started_at
+        cpu_seconds = self._cpu_seconds()
+        cpu_since_start = cpu_seconds - self._cpu_at_start
+        return {
+            'pid': os.getpid(),
+            'version': str(get_version_info()),
+            'uptime': round(uptime, 3),
+            'config_path': str(self.config_path),
+            'debug': self.debug,
+            'foreground': self.foreground,
+            'backend': self.monitor.tap_monitor.backend.get_backend_name(),
+            'hotkeys': len(self.monitor.config.hotkeys),
+            'tap_timeout': self.monitor.config.tap_timeout,
+            'memory_rss_bytes': self._memory_rss_bytes(),
+            'cpu_seconds': round(cpu_seconds, 3),
+            'cpu_percent_avg': round(100.0 * cpu_since_start / uptime, 3) if uptime > 0 else 0.0,
+            'counters': self._counters(),
+        }
+
+    def _stats(self, _request: ControlRequest) -> dict[str, Any]:
+        stats = self.monitor.executor.stats
+        return {
+            'counters': self._counters(),
+            'launch_latency': stats.snapshot() if stats is not None else {},
+        }
+
+    def _metrics(self, _request: ControlRequest) -> dict[str, Any]:
+        return {'text': REGISTRY.render()}
+
+    def _trace(self, _request: ControlRequest) -> dict[str, Any]:
+        snapshot = self._run_on_event_thread(fr.RECORDER.snapshot)
+        return {
+            'records': min(snapshot.count, snapshot.capacity),
+            'capacity': snapshot.capacity,
+            'text': fr.format_snapshot(snapshot, fr.evdev_key_name, self.monitor.hotkey_labels()),
+        }
+
+    def _profile(self, request: ControlRequest) -> dict[str, Any]:
+        from .profiler import FOLDED_FILE  # noqa: PLC0415
+        from .profiler import MAX_PROFILE_SECONDS  # noqa: PLC0415
+        from .profiler import PROFILE_FILE  # noqa: PLC0415
+        from .profiler import EventThreadProfiler  # noqa: PLC0415
+
+        seconds = float(request.params.get('seconds', 0))
+        if not 0 < seconds <= MAX_PROFILE_SECONDS:
+            raise ValueError(f'seconds must be in (0, {MAX_PROFILE_SECONDS:g}], got {seconds:g}')  # noqa: TRY003
+        use_cprofile = bool(request.params.get('cprofile', False))
+        output = request.params.get('output')
+        path = Path(output) if output else PROFILE_FILE if use_cprofile else FOLDED_FILE
+        if self._profiler is None:
+            self._profiler = EventThreadProfiler(self._run_on_event_thread)
+        if use_cprofile:
+            return {'mode': 'cprofile', 'path': str(path), 'functions': self._profiler.profile(seconds, path)}
+        return {'mode': 'sample', 'path': str(path), 'samples': self._profiler.sample(seconds, path)}
+
+    def _reload(self, _request: ControlRequest) -> dict[str, Any]:
+        compiled = load_compiled_config(self.config_path)
+        app_config = compiled.config
+        if self.debug:
+            app_config.log_level = 'DEBUG'
+            app_config.debug_mode = True
+            app_config.verbose_logging = True
+        self._run_on_event_thread(lambda: self.monitor.apply_config(app_config, compiled.matcher))
+        return {
+            'config_path': str(compiled.config_path),
+            'hotkeys': len(app_config.hotkeys),
+            'from_cache': compiled.from_cache,
+        }
+
+    def _suspend(self, _request: ControlRequest) -> dict[str, Any]:
+        changed = self._run_on_event_thread(self.monitor.suspend)
+        return {'suspended': True, 'changed': changed}
+
+    def _resume(self, _request: ControlRequest) -> dict[str, Any]:
+        changed = self._run_on_event_thread(self.monitor.resume)
+        return {'suspended': False, 'changed': changed}
+
+    def _subscribe(self, request: ControlRequest) -> None:
+        backend = self.monitor.tap_monitor.backend
+        suspended = bool(backend.is_suspended()) if hasattr(backend, 'is_suspended') else False
+        write_message(request.connection, {'ok': True, 'pid': os.getpid(), 'suspended': suspended})
+        self.publisher.subscribe(request.connection)
+
+    def _stop(self, request: ControlRequest) -> dict[str, Any]:
+        # Reuse the SIGTERM shutdown path once the client has its answer
+        request.after_reply.append(lambda: os.kill(os.getpid(), signal.SIGTERM))
+        return {'pid': os.getpid()}
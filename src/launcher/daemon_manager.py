@@ -7,11 +7,15 @@ for daemonization. Zero external dependencies.
 import errno
 import fcntl
 import os
+import select
 import signal
 import sys
 import time
+from collections.abc import Callable
 from pathlib import Path
 
+from common.control_socket import ControlError
+from common.control_socket import send_control_request
 from common.runtime_state import PID_FILE
 from common.runtime_state import LaunchRuntimeState
 from common.runtime_state import read_launch_runtime_state
@@ -78,7 +82,7 @@ class DaemonManager:
                 return False
             raise
 
-    def daemonize(self, foreground: bool = False) -> None:
+    def daemonize(self, foreground: bool = False, parent_exit: Callable[[], int] | None = None) -> None:
         """Daemonize the process using POSIX double-fork.
 
         For background mode: forks into background, detaches from terminal,
@@ -90,6 +94,9 @@ class DaemonManager:
 
         Args:
             foreground: If True, skip daemonization
+            parent_exit: Called in the original process after the first fork;
+                its result becomes the exit status (e.g., wait for the daemon
+                to report readiness). Without it the parent exits with 0.
 
         Raises:
             RuntimeError: If fork fails
@@ -97,10 +104,13 @@ class DaemonManager:
         if foreground:
             return
 
+        sys.stdout.flush()
+        sys.stderr.flush()
+
         try:
             pid = os.fork()
             if pid > 0:
-                os._exit(0)
+                os._exit(parent_exit() if parent_exit is not None else 0)
         except OSError as e:
             raise RuntimeError(f'First fork failed: {e}') from e  # noqa: TRY003
 
@@ -181,7 +191,8 @@ class DaemonManager:
     def stop(self) -> bool:
         """Stop the daemon process.
 
-        Sends SIGTERM and waits up to 5 seconds, then SIGKILL.
+        Asks the daemon to shut down through its control socket when it is
+        available, otherwise sends SIGTERM. Waits up to 5 seconds, then SIGKILL.
 
         Returns:
             bool: True if process was stopped, False if not running
@@ -193,23 +204,17 @@ class DaemonManager:
         try:
             pid = int(self.pid_file.read_text().strip())
 
-            os.kill(pid, signal.SIGTERM)
+            if not self._request_stop_via_control(pid):
+                os.kill(pid, signal.SIGTERM)
 
-            timeout = 5.0
-            start_time = time.time()
-
-            while time.time() - start_time < timeout:
-                try:
-                    os.kill(pid, 0)
-                    time.sleep(0.1)
-                except ProcessLookupError:
-                    self.pid_file.unlink(missing_ok=True)
-                    self.remove_runtime_state()
-                    return True
+            if self._wait_for_exit(pid, timeout=5.0):
+                self.pid_file.unlink(missing_ok=True)
+                self.remove_runtime_state()
+                return True
 
             try:
                 os.kill(pid, signal.SIGKILL)
-                time.sleep(0.5)
+                self._wait_for_exit(pid, timeout=1.0)
                 self.pid_file.unlink(missing_ok=True)
                 self.remove_runtime_state()
                 return True  # noqa: TRY300
@@ -226,6 +231,64 @@ class DaemonManager:
         except PermissionError:
             return False
 
+    @staticmethod
+    def _request_stop_via_control(pid: int) -> bool:
+        """Request graceful shutdown through the control socket.
+
+        Args:
+            pid: PID read from the PID file
+
+        Returns:
+            bool: True if the daemon with this PID acknowledged the request
+        """
+        try:
+            response = send_control_request('stop')
+        except ControlError:
+            return False
+        return response is not None and response.get('pid') == pid
+
+    @staticmethod
+    def _wait_for_exit(pid: int, timeout: float) -> bool:
+        """Wait until the process exits.
+
+        Uses a pidfd, which becomes readable the moment the process exits, so
+        the wait returns without polling latency. Falls back to probing with
+        signal 0 on kernels/Pythons without ``pidfd_open``.
+
+        Args:
+            pid: Process to wait for
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            bool: True if the process exited within the timeout
+        """
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except (AttributeError, OSError):
+            return DaemonManager._poll_for_exit(pid, timeout)
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            return bool(poller.poll(timeout * 1000))
+        finally:
+            os.close(pidfd)
+
+    @staticmethod
+    def _poll_for_exit(pid: int, timeout: float) -> bool:
+        """Wait until the process exits by probing it with signal 0."""
+        deadline = time.monotonic() + timeout
+        delay = 0.001
+        while time.monotonic() < deadline:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return True
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        return False
+
     def cleanup(self) -> None:
         """Release lock and clean up PID file.
 
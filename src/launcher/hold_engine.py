@@ -0,0 +1,146 @@
+"""Hold (long-press) hotkeys for tap-launcher.
+
+A hold hotkey fires while its keys are still held, once they have been
+held for ``hold_ms``. ``TapMonitor`` reports each key added to a tap
+whose bit is in ``mask``; when the tap's keys are exactly those of a hold
+hotkey, ``HoldTracker`` arms a deadline on the event loop timer. Any
+other press or release on the same device before the deadline cancels it.
+
+Modifier-only taps with ``fire_on = "press"`` are tracked the same way,
+with their grace window as the deadline: the tap fires once its chord has
+been down for ``grace_ms``. If a key is released first, the tap completes
+(and fires) on that release as usual; another key cancels it.
+
+While a hold is armed, a non-modifier trigger key is held back by the
+backend: if the hold fires the key is suppressed, otherwise its press is
+restored before the event that cancelled the hold, so the key is typed
+as usual and in order.
+
+All methods run on the event thread.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Protocol
+
+from common.key_normalizer import is_modifier_key
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .hotkey_matcher import HotkeyMatcher
+    from .models import HotkeyConfig
+
+
+class Cancellable(Protocol):
+    """Handle of a scheduled callback."""
+
+    def cancel(self) -> None: ...
+
+
+class HoldTracker:
+    """Fire hold hotkeys from a cancellable deadline.
+
+    Args:
+        matcher: Matcher whose hold hotkeys are watched
+        fire: Called as ``fire(hotkey, device, pressed_at, fired_at)`` when a
+            hold deadline passes with the keys still held
+        schedule: Called as ``schedule(delay, callback)`` to run a callback
+            on the event thread after ``delay`` seconds; returns a handle
+            that can be cancelled
+        backend: Keyboard backend; ``buffer_key``, ``restore_key`` and
+            ``suppress_key`` are used when it has them
+    """
+
+    def __init__(
+        self,
+        matcher: HotkeyMatcher,
+        fire: Callable[[HotkeyConfig, Any, float, float], None],
+        schedule: Callable[[float, Callable[[], None]], Cancellable],
+        backend: Any,
+    ) -> None:
+        self._hold_for = matcher.hold_for
+        self._fire = fire
+        self._schedule = schedule
+        self._backend = backend
+        self._can_buffer = hasattr(backend, 'buffer_key') and hasattr(backend, 'restore_key')
+        self.mask = matcher.hold_mask
+        self.armed = False
+        self._device: Any = None
+        self._hotkey: HotkeyConfig | None = None
+        self._keys: frozenset[Any] = frozenset()
+        self._buffered: Any = None
+        self._pressed_at = 0.0
+        self._timer: Cancellable | None = None
+        self._generation = 0
+
+    def on_combination(self, mask: int, key: Any, device: Any) -> None:
+        """Arm the hold hotkey whose keys are exactly ``mask``, if any.
+
+        Args:
+            mask: Bits of the keys of the current tap
+            key: The key just added to the tap
+            device: Device of the tap (None if taps are not tracked per device)
+        """
+        hotkey = self._hold_for(mask, device)
+        delay_ms = hotkey.held_fire_ms() if hotkey is not None else None
+        if hotkey is None or delay_ms is None:
+            return
+        self.cancel()
+        self.armed = True
+        self._device = device
+        self._hotkey = hotkey
+        self._keys = hotkey.keys_set()
+        self._pressed_at = perf_counter()
+        if self._can_buffer and not is_modifier_key(key):
+            self._backend.buffer_key(key)
+            self._buffered = key
+        self._generation += 1
+        generation = self._generation
+        self._timer = self._schedule(delay_ms / 1000, lambda: self._on_deadline(generation))
+
+    def interrupt(self, key: Any, pressed: bool, device: Any) -> None:
+        """Cancel the armed hold on any other press, or on any release, of its device.
+
+        Args:
+            key: Key of the event
+            pressed: True for a press, False for a release
+            device: Device of the event
+        """
+        if device != self._device:
+            # Another keyboard: its keys do not affect this hold
+            return
+        if pressed and key in self._keys:
+            # The same key reported again
+            return
+        self.cancel()
+
+    def cancel(self, restore: bool = True) -> None:
+        """Disarm the hold; the held-back trigger press is emitted unless ``restore`` is False."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buffered is not None:
+            if restore:
+                self._backend.restore_key(self._buffered)
+            self._buffered = None
+        self.armed = False
+        self._hotkey = None
+        self._keys = frozenset()
+
+    def _on_deadline(self, generation: int) -> None:
+        if generation != self._generation or not self.armed:
+            return
+        hotkey = self._hotkey
+        assert hotkey is not None
+        fired_at = perf_counter()
+        buffered = self._buffered
+        self._buffered = None
+        self._timer = None
+        self.cancel()
+        if buffered is not None and hasattr(self._backend, 'suppress_key'):
+            self._backend.suppress_key(buffered)
+        self._fire(hotkey, self._device, self._pressed_at, fired_at)
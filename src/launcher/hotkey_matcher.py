@@ -4,12 +4,41 @@ This module handles matching detected tap combinations against
 configured hotkey combinations.
 """
 
+from dataclasses import dataclass
+from dataclasses import field
+from functools import reduce
+from operator import or_
+from typing import TYPE_CHECKING
 from typing import Any
 
+from common.key_normalizer import is_modifier_key
 from common.key_normalizer import normalize_key
 
+from .models import DEFAULT_TAP_TIMEOUT
 from .models import HotkeyConfig
 
+if TYPE_CHECKING:
+    from common.backends.base import DeviceInfo
+
+
+@dataclass
+class SequenceNode:
+    """Node of the tap sequence trie.
+
+    The path from the root spells the taps typed so far; each edge is the
+    key set of one tap.
+
+    Attributes:
+        hotkey: Hotkey whose sequence ends at this node (None if none does)
+        children: Next taps that continue a configured sequence
+        tap_timeout: Longest tap timeout among the hotkeys through this node
+        hotkey_timeout: Tap timeout of ``hotkey``
+    """
+    hotkey: HotkeyConfig | None = None
+    tap_timeout: float = 0.0
+    hotkey_timeout: float = 0.0
+    children: dict[frozenset[str], 'SequenceNode'] = field(default_factory=dict)
+
 
 class HotkeyMatcher:
     """Match detected tap combinations against configured hotkeys.
@@ -18,33 +47,216 @@ class HotkeyMatcher:
     hotkeys and provides fast matching of detected key combinations.
     """
 
-    def __init__(self, hotkeys: list[HotkeyConfig]) -> None:
+    def __init__(self, hotkeys: list[HotkeyConfig], default_timeout: float = DEFAULT_TAP_TIMEOUT) -> None:
         """Initialize the matcher with configured hotkeys.
 
         Args:
             hotkeys: List of configured hotkey combinations
+            default_timeout: Tap timeout of hotkeys that do not set their own
         """
+        self.hotkeys = hotkeys
+        # Hold hotkeys never match a tap; they are looked up by mask instead
+        taps = [hk for hk in hotkeys if hk.trigger == 'tap']
+
         # Build a map from key sets to hotkey configs for O(1) lookup
         self._hotkey_map: dict[frozenset[str], HotkeyConfig] = {
-            hk.keys_set(): hk for hk in hotkeys
+            hk.keys_set(): hk for hk in taps if not hk.sequence and not hk.devices
+        }
+        self._tap_timeouts: dict[frozenset[str], float] = {
+            keys: self._effective_timeout(hk, default_timeout) for keys, hk in self._hotkey_map.items()
         }
 
-        # Build index for delayed timer start feature
-        # Map: first key name -> list of hotkeys with start_timer_from_second_key=True
-        self._delayed_start_map: dict[str, list[HotkeyConfig]] = {}
+        # Hotkeys limited to devices, checked first when a tap is made on a
+        # device; empty unless the configuration scopes hotkeys
+        self._default_timeout = default_timeout
+        self._scoped_map: dict[frozenset[str], list[HotkeyConfig]] = {}
+        for hk in taps:
+            if hk.devices:
+                self._scoped_map.setdefault(hk.keys_set(), []).append(hk)
+
+        # Superset index over key bitmasks: every configured key gets a bit,
+        # and every subset of a configured tap maps to the longest timeout
+        # among the taps containing it. A tap whose mask is missing can no
+        # longer match anything. Hold hotkeys are included so that their
+        # keys are not pruned while being held.
+        self._key_bits: dict[str, int] = {}
+        for hk in hotkeys:
+            for step in hk.steps():
+                for key in sorted(step):
+                    self._key_bits.setdefault(key, 1 << len(self._key_bits))
+        self._max_timeouts = self._build_timeout_index(hotkeys, default_timeout, self._key_bits)
+
+        # Hotkeys fired while their keys are held (hold hotkeys, and taps
+        # with fire_on = "press") by the mask of their keys; ``hold_mask``
+        # has the bits of all their keys, so other keys skip hold handling
+        self.hold_index, self._scoped_holds = self._build_hold_index(hotkeys, self._key_bits)
+        self.hold_mask = 0
+        for mask in (*self.hold_index, *self._scoped_holds):
+            self.hold_mask |= mask
+
+        # Trie over the taps of all hotkeys; single-tap hotkeys are children
+        # of the root. Only used when at least one sequence is configured.
+        self.sequence_root = SequenceNode()
+        self.has_sequences = any(hk.sequence for hk in taps)
+        for hk in taps:
+            if hk.devices:
+                continue
+            timeout = self._effective_timeout(hk, default_timeout)
+            node = self.sequence_root
+            for step in hk.steps():
+                node = node.children.setdefault(step, SequenceNode())
+                node.tap_timeout = max(node.tap_timeout, timeout)
+            node.hotkey = hk
+            node.hotkey_timeout = timeout
+
+        # Index for start_timer_from_second_key: first keys that delay the
+        # timer, and the masks of taps whose timer should stay delayed
+        self._delayed_first_keys, self._delayed_masks = self._build_delay_index(taps, self._key_bits)
+
+        # Index for press buffering: the masks a modifier-only tap can have
+        # on its way to a hotkey, and the bits of all their keys
+        self.buffer_masks = self._build_buffer_index(taps, self._key_bits)
+        self.buffer_mask = reduce(or_, self.buffer_masks, 0)
+
+    @staticmethod
+    def _build_buffer_index(hotkeys: list[HotkeyConfig], key_bits: dict[str, int]) -> frozenset[int]:
+        """Return every non-empty submask of the modifier-only, single-tap hotkeys with two or more keys.
+
+        While the keys of a tap are one of these masks, the tap may still
+        become such a hotkey, so their presses can be held back.
+        """
+        masks: set[int] = set()
+        for hk in hotkeys:
+            keys = hk.keys_set()
+            if hk.sequence or len(keys) < 2 or not all(is_modifier_key(key) for key in keys):  # noqa: PLR2004
+                continue
+            mask = sum(key_bits[key] for key in keys)
+            submask = mask
+            while submask:
+                masks.add(submask)
+                submask = (submask - 1) & mask
+        return frozenset(masks)
+
+    @staticmethod
+    def _build_hold_index(
+        hotkeys: list[HotkeyConfig],
+        key_bits: dict[str, int],
+    ) -> tuple[dict[int, HotkeyConfig], dict[int, list[HotkeyConfig]]]:
+        """Map the key masks of the hotkeys fired while their keys are held to the hotkeys.
+
+        A tap with ``fire_on = "press"`` is left out (and fires on release)
+        if another hotkey has a tap containing all its keys: the chord being
+        down does not tell them apart.
+
+        Returns:
+            tuple: Hotkeys for any device, and those limited to devices
+        """
+        step_masks = [(hk, sum(key_bits[key] for key in step)) for hk in hotkeys for step in hk.steps()]
+        hold_index: dict[int, HotkeyConfig] = {}
+        scoped: dict[int, list[HotkeyConfig]] = {}
+        for hk in hotkeys:
+            if hk.held_fire_ms() is None:
+                continue
+            mask = sum(key_bits[key] for key in hk.keys_set())
+            if hk.trigger == 'tap' and any(
+                other is not hk and other_mask & mask == mask for other, other_mask in step_masks
+            ):
+                continue
+            if hk.devices:
+                scoped.setdefault(mask, []).append(hk)
+            else:
+                hold_index[mask] = hk
+        return hold_index, scoped
+
+    @staticmethod
+    def _build_timeout_index(
+        hotkeys: list[HotkeyConfig],
+        default_timeout: float,
+        key_bits: dict[str, int],
+    ) -> dict[int, float]:
+        """Map every subset mask of a configured tap to the longest timeout among the taps containing it.
+
+        That is how long a tap with these keys so far may still take to
+        match some hotkey.
+        """
+        index: dict[int, float] = {}
+        for hk in hotkeys:
+            timeout = HotkeyMatcher._effective_timeout(hk, default_timeout)
+            for step in hk.steps():
+                mask = 0
+                for key in step:
+                    mask |= key_bits[key]
+                # Enumerate all non-empty submasks
+                submask = mask
+                while submask:
+                    if timeout > index.get(submask, 0.0):
+                        index[submask] = timeout
+                    submask = (submask - 1) & mask
+        return index
+
+    @staticmethod
+    def _build_delay_index(
+        hotkeys: list[HotkeyConfig],
+        key_bits: dict[str, int],
+    ) -> tuple[set[str], set[int]]:
+        """Index the taps that start their timer from the second key.
+
+        Every key is mapped to its candidates: the taps (of any hotkey or
+        sequence step) containing it. Pressed first, a key delays the timer
+        only if the delay can matter for its candidates: one of them starts
+        its timer from the second key, the key is a modifier (a non-modifier
+        completes the tap at once, so no second key follows) and the key is
+        not a tap on its own (which would become unreachable).
+
+        Once the second key narrows the candidates down, the timer stays
+        delayed only while a remaining candidate asks for it; those masks are
+        every submask with at least two keys of a delayed tap.
+
+        Returns:
+            tuple[set[str], set[int]]: Delaying first keys and delayed masks
+        """
+        candidates: dict[str, list[tuple[HotkeyConfig, frozenset[str]]]] = {}
         for hk in hotkeys:
-            if hk.start_timer_from_second_key and len(hk.keys) >= 2:
-                # Index by each key in the combination
-                for key in hk.keys:
-                    if key not in self._delayed_start_map:
-                        self._delayed_start_map[key] = []
-                    self._delayed_start_map[key].append(hk)
-
-    def match(self, detected_keys: set[Any]) -> HotkeyConfig | None:
+            for step in hk.steps():
+                for key in step:
+                    candidates.setdefault(key, []).append((hk, step))
+        single_taps = {next(iter(step)) for hk in hotkeys for step in hk.steps() if len(step) == 1}
+
+        first_keys: set[str] = set()
+        masks: set[int] = set()
+        for key, taps in candidates.items():
+            if key in single_taps or not is_modifier_key(key):
+                continue
+            for hk, step in taps:
+                if not hk.start_timer_from_second_key or len(step) < 2:  # noqa: PLR2004
+                    continue
+                first_keys.add(key)
+                mask = sum(key_bits[step_key] for step_key in step)  # distinct bits
+                submask = mask
+                while submask:
+                    if submask & (submask - 1):  # at least two keys
+                        masks.add(submask)
+                    submask = (submask - 1) & mask
+        return first_keys, masks
+
+    @staticmethod
+    def _effective_timeout(hotkey: HotkeyConfig, default_timeout: float) -> float:
+        return hotkey.tap_timeout if hotkey.tap_timeout is not None else default_timeout
+
+    def match(
+        self,
+        detected_keys: set[Any],
+        duration: float | None = None,
+        device: 'DeviceInfo | None' = None,
+    ) -> HotkeyConfig | None:
         """Match detected keys against configured hotkeys.
 
         Args:
             detected_keys: Set of pressed keys (canonical names or objects convertible by normalize_key)
+            duration: Tap duration in seconds; if given, a hotkey only matches
+                when the tap did not exceed its timeout
+            device: Device the tap was made on; hotkeys limited to it take
+                precedence (None matches only hotkeys for all devices)
 
         Returns:
             HotkeyConfig if a matching hotkey is found, None otherwise
@@ -59,28 +271,104 @@ class HotkeyMatcher:
             >>> hotkey.command
             'cmd1'
         """
-        # Normalize the detected keys to canonical names
-        normalized = self._normalize_keys(detected_keys)
+        # Canonical names as a frozen set for lookup
+        keys_frozen = self.normalize(detected_keys)
 
-        # Convert to frozen set for lookup
-        keys_frozen = frozenset(normalized)
+        if device is not None and self._scoped_map:
+            hotkey = self._match_device(keys_frozen, duration, device)
+            if hotkey is not None:
+                return hotkey
 
         # Look up in the hotkey map
-        return self._hotkey_map.get(keys_frozen)
+        hotkey = self._hotkey_map.get(keys_frozen)
+        if hotkey is not None and duration is not None and duration > self._tap_timeouts[keys_frozen]:
+            return None
+        return hotkey
+
+    @property
+    def has_device_hotkeys(self) -> bool:
+        """True if any tap hotkey is limited to devices."""
+        return bool(self._scoped_map)
+
+    def match_device(self, keys: frozenset[str], duration: float | None, device: 'DeviceInfo') -> HotkeyConfig | None:
+        """Match a tap against the hotkeys limited to devices only.
+
+        Args:
+            keys: Canonical names of the tapped keys (see ``normalize()``)
+            duration: Tap duration in seconds (None skips the timeout check)
+            device: Device the tap was made on
+
+        Returns:
+            HotkeyConfig | None: Scoped hotkey for these keys on this device
+        """
+        return self._match_device(keys, duration, device) if self._scoped_map else None
+
+    def _match_device(self, keys: frozenset[str], duration: float | None, device: 'DeviceInfo') -> HotkeyConfig | None:
+        for hotkey in self._scoped_map.get(keys, ()):
+            if hotkey.matches_device(device):
+                if duration is not None and duration > self._effective_timeout(hotkey, self._default_timeout):
+                    return None
+                return hotkey
+        return None
+
+    def hold_for(self, mask: int, device: 'DeviceInfo | None' = None) -> HotkeyConfig | None:
+        """Return the hold hotkey whose keys are exactly ``mask`` on ``device``.
+
+        Args:
+            mask: OR of ``key_bit()`` of the held keys
+            device: Device the keys are held on (None if unknown)
+        """
+        if device is not None and self._scoped_holds:
+            for hotkey in self._scoped_holds.get(mask, ()):
+                if hotkey.matches_device(device):
+                    return hotkey
+        return self.hold_index.get(mask)
+
+    def candidates(self, mask: int) -> list[HotkeyConfig]:
+        """Return the hotkeys with a tap containing every key of ``mask``.
+
+        Scans all hotkeys; meant for work off the event thread.
+        """
+        found = []
+        for hotkey in self.hotkeys:
+            for step in hotkey.steps():
+                if sum(self._key_bits[key] for key in step) & mask == mask:
+                    found.append(hotkey)
+                    break
+        return found
+
+    def fires_while_held(self, hotkey: HotkeyConfig) -> bool:
+        """Check if ``hotkey`` fires while its keys are held (a hold, or an early-firing tap).
+
+        A tap with ``fire_on = "press"`` fires on release instead when another
+        hotkey contains all its keys.
+        """
+        candidates = (*self.hold_index.values(), *(hk for hks in self._scoped_holds.values() for hk in hks))
+        return any(candidate is hotkey for candidate in candidates)
+
+    def key_bit(self, key: Any) -> int:
+        """Return the bit of a key in tap masks (0 if no hotkey uses the key)."""
+        bit = self._key_bits.get(key)
+        if bit is None:
+            bit = self._key_bits.get(normalize_key(key), 0)
+        return bit
 
-    def _normalize_keys(self, keys: set[Any]) -> list[str]:
-        """Normalize keys to canonical key names.
+    def max_tap_timeout(self, mask: int) -> float | None:
+        """Return the longest timeout any hotkey containing these keys allows.
 
-        This uses the key_normalizer to ensure consistent naming
-        (e.g., "ctrl_l" -> "ctrl_l", any string key name -> lowercase).
+        ``TapMonitor`` calls this whenever a tap gains a key. None means the
+        keys are not a subset of any configured tap, so the tap can be
+        dropped at once; otherwise it can be dropped once it is older than
+        the returned timeout.
 
         Args:
-            keys: Set of keys to normalize (typically canonical key names as strings)
+            mask: OR of ``key_bit()`` of the keys of the tap so far
 
         Returns:
-            list[str]: List of normalized key names
+            float | None: Timeout in seconds, or None if no hotkey contains
+                all of these keys
         """
-        return [normalize_key(key) for key in keys]
+        return self._max_timeouts.get(mask)
 
     def get_all_combinations(self) -> list[frozenset[str]]:
         """Get all configured key combinations.
@@ -92,15 +380,20 @@ class HotkeyMatcher:
         """
         return list(self._hotkey_map.keys())
 
+    def normalize(self, detected_keys: set[Any]) -> frozenset[str]:
+        """Return detected keys as a frozen set of canonical names (a trie edge)."""
+        return frozenset(map(normalize_key, detected_keys))
+
     def should_delay_timer_start(self, first_key_normalized: str) -> bool:
         """Check if timer start should be delayed for the given first key.
 
-        Returns True if there is at least one hotkey combination that:
-        - Starts with the given key
-        - Has start_timer_from_second_key=True
+        Returns True if at least one tap containing the key has
+        start_timer_from_second_key=True, the key is a modifier and it is
+        not a configured tap on its own.
 
         This is used by TapMonitor to determine whether to delay the
-        timer start when the first key is pressed.
+        timer start when the first key is pressed; ``delays_timer()`` decides
+        on the second key whether the delay still applies.
 
         Args:
             first_key_normalized: Normalized name of the first pressed key
@@ -121,6 +414,21 @@ class HotkeyMatcher:
             >>> matcher.should_delay_timer_start("alt_l")
             False
         """
-        return first_key_normalized in self._delayed_start_map
+        return first_key_normalized in self._delayed_first_keys
+
+    def delays_timer(self, mask: int) -> bool:
+        """Check if a tap whose timer was delayed should start it from its second key.
+
+        Called by TapMonitor when the second key arrives. If no remaining
+        candidate of the tap starts its timer from the second key, the
+        timer counts from the first key instead.
+
+        Args:
+            mask: OR of ``key_bit()`` of the first two keys
+
+        Returns:
+            bool: True if a hotkey containing these keys delays its timer
+        """
+        return mask in self._delayed_masks
 
 
@@ -0,0 +1,217 @@
+"""Tap-to-exec latency statistics for tap-launcher.
+
+This module collects per-hotkey latency histograms for launched commands.
+Every launch is split into stages:
+
+- ``wait``: tap completion → hotkey resolved (non-zero only when the tap
+  could also start a tap sequence and the launcher had to wait for the
+  next tap or the sequence timeout); for a hold hotkey, hold threshold →
+  timer callback
+- ``dispatch``: hotkey resolved → start of process spawn (matching, logging)
+- ``spawn``: fork → successful ``execve`` of the target program
+- ``total``: tap completion → successful ``execve``
+
+Histograms use fixed millisecond buckets, so recording is O(log buckets)
+and memory stays constant regardless of how many commands are launched.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from common.logging_utils import get_logger
+
+# Upper bounds of histogram buckets in milliseconds (last bucket is +Inf)
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0, 256.0, 512.0, 1024.0,
+)
+
+LAUNCH_STAGES: tuple[str, ...] = ('wait', 'dispatch', 'spawn', 'total')
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds.
+
+    Attributes:
+        counts: Observation counts per bucket (last item is the +Inf bucket)
+        count: Total number of observations
+        sum_ms: Sum of all observations
+        max_ms: Largest observation
+    """
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    count: int = 0
+    sum_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        """Record a single observation."""
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.sum_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def quantile(self, q: float) -> float:
+        """Return the bucket upper bound containing the given quantile.
+
+        Args:
+            q: Quantile in range [0, 1]
+
+        Returns:
+            float: Upper bound in ms (max observation for the +Inf bucket)
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for idx, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if idx < len(LATENCY_BUCKETS_MS):
+                    return min(LATENCY_BUCKETS_MS[idx], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        return {
+            'count': self.count,
+            'sum_ms': round(self.sum_ms, 3),
+            'max_ms': round(self.max_ms, 3),
+            'p50_ms': self.quantile(0.5),
+            'p99_ms': self.quantile(0.99),
+            'buckets': {
+                **{str(bound): cnt for bound, cnt in zip(LATENCY_BUCKETS_MS, self.counts, strict=False)},
+                '+Inf': self.counts[-1],
+            },
+        }
+
+
+@dataclass
+class LaunchTiming:
+    """Timestamps of a single launch (``perf_counter`` seconds).
+
+    Attributes:
+        detected_at: Moment the tap was reported as valid
+        spawn_start: Moment before the process was forked
+        exec_done: Moment the child reported a successful execve
+        resolved_at: Moment the hotkey was resolved (None: at ``detected_at``)
+    """
+    detected_at: float
+    spawn_start: float
+    exec_done: float
+    resolved_at: float | None = None
+
+    def stages_ms(self) -> dict[str, float]:
+        """Return stage durations in milliseconds."""
+        resolved_at = self.detected_at if self.resolved_at is None else self.resolved_at
+        return {
+            'wait': (resolved_at - self.detected_at) * 1000.0,
+            'dispatch': (self.spawn_start - resolved_at) * 1000.0,
+            'spawn': (self.exec_done - self.spawn_start) * 1000.0,
+            'total': (self.exec_done - self.detected_at) * 1000.0,
+        }
+
+
+@dataclass
+class HotkeyLaunchStats:
+    """Latency histograms and counters for a single hotkey."""
+    histograms: dict[str, LatencyHistogram] = field(
+        default_factory=lambda: {stage: LatencyHistogram() for stage in LAUNCH_STAGES}
+    )
+    failures: int = 0
+
+
+class LaunchStats:
+    """Per-hotkey tap-to-exec latency statistics.
+
+    Summaries are logged at most once per ``log_interval`` seconds: the
+    launcher calls ``maybe_log`` from an event loop timer armed for
+    ``next_log_delay()`` (so no extra thread is needed), and a launch logs a
+    summary that is due as well.
+    """
+
+    def __init__(self, log_interval: float = 300.0) -> None:
+        """Initialize statistics.
+
+        Args:
+            log_interval: Minimum interval in seconds between summary logs (0 disables)
+        """
+        self.log_interval = log_interval
+        self.logger = get_logger('tap_launcher.stats')
+        self._per_hotkey: dict[str, HotkeyLaunchStats] = {}
+        self._last_log: float | None = None
+        self._dirty = False
+
+    def _entry(self, label: str) -> HotkeyLaunchStats:
+        entry = self._per_hotkey.get(label)
+        if entry is None:
+            entry = self._per_hotkey[label] = HotkeyLaunchStats()
+        return entry
+
+    def record(self, label: str, timing: LaunchTiming) -> None:
+        """Record a successful launch.
+
+        Args:
+            label: Hotkey label (e.g., "ctrl_l+shift_l")
+            timing: Launch timestamps
+        """
+        histograms = self._entry(label).histograms
+        for stage, value_ms in timing.stages_ms().items():
+            histograms[stage].observe(value_ms)
+        self._dirty = True
+        self.maybe_log(timing.exec_done)
+
+    def record_failure(self, label: str) -> None:
+        """Record a failed launch attempt."""
+        self._entry(label).failures += 1
+        self._dirty = True
+
+    def maybe_log(self, now: float) -> None:
+        """Log a summary if the log interval has elapsed since the last one."""
+        if self.log_interval <= 0:
+            return
+        if self._last_log is None:
+            self._last_log = now
+            return
+        if now - self._last_log >= self.log_interval:
+            self._last_log = now
+            self.log_summary()
+
+    def next_log_delay(self, now: float) -> float | None:
+        """Return seconds until the next summary is due (None if logging is disabled)."""
+        if self.log_interval <= 0:
+            return None
+        if self._last_log is None:
+            return self.log_interval
+        return max(self._last_log + self.log_interval - now, 0.0)
+
+    def log_summary(self) -> None:
+        """Log per-hotkey latency summary (only if something changed)."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        for label, entry in sorted(self._per_hotkey.items()):
+            total = entry.histograms['total']
+            dispatch = entry.histograms['dispatch']
+            spawn = entry.histograms['spawn']
+            wait = entry.histograms['wait']
+            self.logger.info(
+                f'Launch latency {label}: n={total.count} failures={entry.failures} '
+                f'total p50={total.quantile(0.5):.2f}ms p99={total.quantile(0.99):.2f}ms max={total.max_ms:.2f}ms '
+                f'(wait p99={wait.quantile(0.99):.2f}ms, '
+                f'dispatch p99={dispatch.quantile(0.99):.2f}ms, spawn p99={spawn.quantile(0.99):.2f}ms)'
+            )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot of all statistics."""
+        return {
+            label: {
+                'failures': entry.failures,
+                **{stage: hist.to_dict() for stage, hist in entry.histograms.items()},
+            }
+            for label, entry in sorted(self._per_hotkey.items())
+        }
@@ -0,0 +1,45 @@
+"""Hotkey layers (modes) for tap-launcher.
+
+A hotkey with ``layer`` set switches the launcher to another set of
+hotkeys, e.g. a "window" layer where single keys move windows, until Esc
+or the layer's timeout returns to the base hotkeys.
+
+Every layer is compiled once, when the configuration is loaded, into its
+own ``HotkeyMatcher`` and the engines built on it. ``LauncherMonitor``
+keeps the active ``Layer``; a switch only re-points the monitor and the
+tap monitor to the precompiled objects, so it rebuilds nothing, and an
+inactive layer costs nothing per event.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .hold_engine import HoldTracker
+    from .hotkey_matcher import HotkeyMatcher
+    from .press_buffer import PressBuffer
+    from .sequence_engine import SequenceTracker
+
+
+@dataclass(slots=True)
+class Layer:
+    """A compiled layer: its matcher and the engines built on it.
+
+    Attributes:
+        name: Layer name (``"base"`` for the startup hotkeys)
+        matcher: Matcher of the layer's hotkeys
+        sequences: Tracker of its sequence hotkeys (None if it has none)
+        holds: Tracker of its hotkeys fired while held (None if it has none)
+        press_buffer: Press buffer of its modifier-only hotkeys (None if
+            disabled or not needed)
+        timeout: Seconds without a matching hotkey after which the layer is
+            left (None for the base layer)
+    """
+    name: str
+    matcher: HotkeyMatcher
+    sequences: SequenceTracker | None
+    holds: HoldTracker | None
+    press_buffer: PressBuffer | None
+    timeout: float | None = None
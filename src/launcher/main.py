@@ -5,21 +5,39 @@ import signal
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
 from typing import Any
 
 import typer
 
+from common.control_socket import ControlError
+from common.control_socket import send_control_request
+from common.logging_utils import LogRotation
 from common.logging_utils import get_logger
 from common.logging_utils import setup_logging_handler
 from common.runtime_state import LaunchRuntimeState
+from common.sd_notify import NotifyListener
+from common.sd_notify import SdNotifier
 from common.version import get_version_info
 
-from .command_executor import CommandExecutor
 from .config_loader import ConfigLoader
 from .daemon_manager import DaemonManager
-from .hotkey_matcher import HotkeyMatcher
 from .models import AppConfig
-from .monitor import LauncherMonitor
+from .models import HotkeyConfig
+
+if TYPE_CHECKING:
+    from .command_executor import CommandExecutor
+    from .control import LauncherControl
+    from .hotkey_matcher import HotkeyMatcher
+    from .monitor import LauncherMonitor
+
+# Modules that pull in the keyboard backend, evdev, the tap engine or
+# subprocess are imported inside the commands that need them, so quick
+# commands such as 'status' and 'stop' start fast.
+
+# How long 'start' waits for the background daemon to grab keyboards
+DAEMON_READY_TIMEOUT = 10.0
 
 app = typer.Typer(
     help='🚀 Tap Launcher - Launch commands on keyboard tap combinations',
@@ -29,10 +47,11 @@ app = typer.Typer(
 
 @dataclass(frozen=True)
 class ValidatedLaunchConfig:
-    """Validated launcher configuration and the file it was loaded from."""
+    """Validated launcher configuration, the file it was loaded from and its matcher."""
 
     config: AppConfig
     config_path: Path
+    matcher: 'HotkeyMatcher'
 
 
 def setup_logging(config: AppConfig, foreground: bool, debug: bool = False) -> None:
@@ -55,16 +74,23 @@ def setup_logging(config: AppConfig, foreground: bool, debug: bool = False) -> N
         log_level=config.log_level,
         foreground=foreground,
         log_file=config.log_file if not foreground else None,
+        rotation=LogRotation(config.log_max_bytes, config.log_backup_count),
     )
 
 
-def setup_signal_handlers(monitor: LauncherMonitor, daemon: DaemonManager, is_foreground: bool) -> None:
+def setup_signal_handlers(
+    monitor: 'LauncherMonitor',
+    daemon: DaemonManager,
+    is_foreground: bool,
+    control: 'LauncherControl | None' = None,
+) -> None:
     """Setup signal handlers for graceful shutdown.
 
     Args:
         monitor: LauncherMonitor instance to stop
         daemon: DaemonManager instance for cleanup
         is_foreground: Whether running in foreground mode
+        control: Control socket server to shut down, if running
     """
 
     def signal_handler(signum: int, _frame: Any) -> None:
@@ -72,6 +98,8 @@ def setup_signal_handlers(monitor: LauncherMonitor, daemon: DaemonManager, is_fo
         logger = get_logger('tap_launcher')
         logger.info(f'Received signal {signum}, shutting down...')
 
+        if control is not None:
+            control.stop()
         monitor.stop()
         daemon.cleanup()
 
@@ -82,12 +110,41 @@ def setup_signal_handlers(monitor: LauncherMonitor, daemon: DaemonManager, is_fo
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
+    signal.signal(signal.SIGUSR1, lambda _signum, _frame: _dump_flight_recorder(monitor))
+
+
+def _dump_flight_recorder(monitor: 'LauncherMonitor') -> None:
+    """Write the flight recorder to the trace file (SIGUSR1).
+
+    The buffer is copied right away; formatting and writing happen in a
+    separate thread so the event loop continues immediately.
+    """
+    import threading  # noqa: PLC0415
+
+    from common import flight_recorder as fr  # noqa: PLC0415
+    from common.runtime_state import TRACE_FILE  # noqa: PLC0415
+
+    snapshot = fr.RECORDER.snapshot()
+    labels = monitor.hotkey_labels()
+
+    def write() -> None:
+        logger = get_logger('tap_launcher')
+        try:
+            records = fr.write_trace(snapshot, TRACE_FILE, labels)
+        except OSError as e:
+            logger.warning(f'Failed to write flight recorder trace: {e}')
+            return
+        logger.info(f'Flight recorder: {records} record(s) written to {TRACE_FILE}')
+
+    threading.Thread(target=write, daemon=True, name='trace-dump').start()
 
 
 def _validate_config(config: Path | None, debug: bool = False) -> ValidatedLaunchConfig:
     """Validate configuration and return loaded config with its path."""
+    from .config_cache import load_compiled_config  # noqa: PLC0415
+
     try:
-        app_config, config_path = ConfigLoader.load(config)
+        compiled = load_compiled_config(config)
     except FileNotFoundError as e:
         typer.echo(f'❌ Config file not found: {e}', err=True)
         typer.echo('\n💡 Tip: Create a config file at:', err=True)
@@ -98,20 +155,20 @@ def _validate_config(config: Path | None, debug: bool = False) -> ValidatedLaunc
         typer.echo(f'❌ Failed to load config: {e}', err=True)
         raise typer.Exit(1) from e
 
+    app_config = compiled.config
     if debug:
         app_config.log_level = 'DEBUG'
         app_config.debug_mode = True
         app_config.verbose_logging = True
 
-    executor_temp = CommandExecutor(log_commands=False)
-    for hotkey in app_config.hotkeys:
-        if not executor_temp.check_command_exists(hotkey.command):
-            typer.echo(
-                f'⚠️  Warning: Command not found: {hotkey.command}',
-                err=True,
-            )
+    # Commands were resolved when the config was compiled (or cached)
+    for command in compiled.missing_commands():
+        typer.echo(
+            f'⚠️  Warning: Command not found: {command}',
+            err=True,
+        )
 
-    return ValidatedLaunchConfig(config=app_config, config_path=config_path)
+    return ValidatedLaunchConfig(config=app_config, config_path=compiled.config_path, matcher=compiled.matcher)
 
 
 def _start_daemon(
@@ -121,18 +178,13 @@ def _start_daemon(
     debug: bool = False,
 ) -> None:
     """Start the daemon process."""
+    from .command_executor import CommandExecutor  # noqa: PLC0415
+    from .control import LauncherControl  # noqa: PLC0415
+    from .launch_stats import LaunchStats  # noqa: PLC0415
+    from .monitor import LauncherMonitor  # noqa: PLC0415
+
     app_config = validated_config.config
-    if not foreground:
-        typer.echo('✓ Starting tap launcher in background...')
-        try:
-            daemon.daemonize(foreground=False)
-        except RuntimeError as e:
-            typer.echo(f'❌ Failed to start daemon: {e}', err=True)
-            raise typer.Exit(1) from e
-    else:
-        typer.echo('✓ Starting tap launcher in foreground...')
-        typer.echo('   Press Ctrl+C to stop')
-        daemon.daemonize(foreground=True)
+    notifier = _daemonize(daemon, foreground)
 
     daemon.write_runtime_state(
         LaunchRuntimeState(
@@ -145,25 +197,101 @@ def _start_daemon(
 
     setup_logging(app_config, foreground, debug)
 
-    matcher = HotkeyMatcher(app_config.hotkeys)
-    executor = CommandExecutor(log_commands=True)
-    monitor = LauncherMonitor(app_config, matcher, executor)
+    executor = CommandExecutor(log_commands=True, stats=LaunchStats(app_config.stats_log_interval))
+    try:
+        monitor = LauncherMonitor(app_config, validated_config.matcher, executor, notifier)
+    except Exception as e:  # noqa: BLE001
+        notifier.status(f'Failed to start: {e}')
+        get_logger('tap_launcher').error(f'Failed to start: {e}')
+        daemon.cleanup()
+        sys.exit(1)
+
+    control: LauncherControl | None = None
+    launcher_control = LauncherControl(monitor, validated_config.config_path, debug, foreground)
+    try:
+        launcher_control.start()
+        control = launcher_control
+    except OSError as e:
+        get_logger('tap_launcher').warning(f'Control socket unavailable: {e}')
 
-    setup_signal_handlers(monitor, daemon, foreground)
+    setup_signal_handlers(monitor, daemon, foreground, control)
 
     try:
         monitor.start()
     except KeyboardInterrupt:
         if foreground:
             typer.echo('\n\n👋 Stopping tap launcher...')
+        if control is not None:
+            control.stop()
         daemon.cleanup()
         sys.exit(0)
     except Exception as e:  # noqa: BLE001
+        notifier.status(f'Fatal error: {e}')
         get_logger('tap_launcher').error(f'Fatal error: {e}', exc_info=True)
+        if control is not None:
+            control.stop()
         daemon.cleanup()
         sys.exit(1)
 
 
+def _daemonize(daemon: DaemonManager, foreground: bool) -> SdNotifier:
+    """Detach from the terminal (unless foreground) and return the daemon's notifier.
+
+    In background mode the daemon reports readiness (or its failure) over
+    the notify protocol, and the original process waits for it before
+    exiting, so 'start' only reports success once keyboards are grabbed.
+    """
+    if not foreground:
+        typer.echo('✓ Starting tap launcher in background...')
+        outer_notifier = SdNotifier.from_env()
+        listener = NotifyListener()
+        os.environ['NOTIFY_SOCKET'] = listener.address
+        try:
+            daemon.daemonize(
+                foreground=False,
+                parent_exit=lambda: _wait_for_daemon_ready(listener, outer_notifier),
+            )
+        except RuntimeError as e:
+            typer.echo(f'❌ Failed to start daemon: {e}', err=True)
+            raise typer.Exit(1) from e
+        listener.close()
+        outer_notifier.close()
+    else:
+        typer.echo('✓ Starting tap launcher in foreground...')
+        typer.echo('   Press Ctrl+C to stop')
+        daemon.daemonize(foreground=True)
+
+    notifier = SdNotifier.from_env()
+    notifier.notify(f'MAINPID={os.getpid()}')
+    return notifier
+
+
+def _wait_for_daemon_ready(listener: NotifyListener, outer_notifier: SdNotifier) -> int:
+    """Wait in the original process until the background daemon is ready.
+
+    Args:
+        listener: Notify socket the daemon reports to
+        outer_notifier: Service manager of the original process, if any;
+            readiness and the daemon PID are forwarded to it
+
+    Returns:
+        int: Exit status for the original process
+    """
+    readiness = listener.wait_ready(DAEMON_READY_TIMEOUT)
+    if readiness.ready:
+        typer.echo(f'✓ Tap launcher is running (PID: {readiness.pid})')
+        outer_notifier.notify(f'MAINPID={readiness.pid}', 'READY=1')
+        return 0
+    if readiness.exited:
+        typer.echo('❌ Tap launcher failed to start', err=True)
+    else:
+        typer.echo(f'❌ Tap launcher did not become ready within {DAEMON_READY_TIMEOUT:.0f}s', err=True)
+    if readiness.status:
+        typer.echo(f'   {readiness.status}', err=True)
+    typer.echo('   See the log file for details', err=True)
+    return 1
+
+
 def _run_launcher(
     config: Path | None,
     foreground: bool,
@@ -230,8 +358,9 @@ def stop() -> None:
     pid = daemon.get_pid()
     typer.echo(f'Stopping tap launcher (PID: {pid})...')
 
+    stop_started = perf_counter()
     if daemon.stop():
-        typer.echo('✓ Tap launcher stopped')
+        typer.echo(f'✓ Tap launcher stopped in {(perf_counter() - stop_started) * 1000:.1f} ms')
         if pid:
             typer.echo(f'   Stopped PID: {pid}')
     else:
@@ -257,25 +386,102 @@ def restart(
 
     if daemon.is_running():
         typer.echo('Stopping tap launcher...')
+        stop_started = perf_counter()
         if not daemon.stop():
             typer.echo('❌ Failed to stop tap launcher', err=True)
             raise typer.Exit(1)
-        typer.echo('✓ Stopped')
+        typer.echo(f'✓ Stopped in {(perf_counter() - stop_started) * 1000:.1f} ms')
 
     typer.echo('Starting tap launcher...')
     _run_launcher(config, foreground=False)
 
 
+def _control_request(cmd: str, timeout: float = 1.0, **params: Any) -> dict[str, Any] | None:
+    """Send a control request, exiting with an error message if the daemon rejects it."""
+    try:
+        return send_control_request(cmd, timeout=timeout, **params)
+    except ControlError as e:
+        typer.echo(f'❌ {cmd} failed: {e}', err=True)
+        raise typer.Exit(1) from e
+
+
+def _require_control(cmd: str, timeout: float = 1.0, **params: Any) -> dict[str, Any]:
+    """Send a control request that needs a running daemon with a control socket."""
+    response = _control_request(cmd, timeout, **params)
+    if response is None:
+        typer.echo('❌ Tap launcher is not running (control socket unavailable)', err=True)
+        raise typer.Exit(1)
+    return response
+
+
+def _format_duration(seconds: float) -> str:
+    """Format an uptime in seconds as a compact string (e.g. '2h 05m 10s')."""
+    total = int(seconds)
+    hours, rest = divmod(total, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f'{hours}h {minutes:02d}m {secs:02d}s'
+    if minutes:
+        return f'{minutes}m {secs:02d}s'
+    return f'{seconds:.1f}s'
+
+
+def _print_live_status(live: dict[str, Any]) -> None:
+    """Print status reported by the daemon through the control socket."""
+    typer.echo('✓ Tap launcher is running')
+    typer.echo(f'   PID: {live["pid"]}')
+    typer.echo(f'   Version: {live["version"]}')
+    typer.echo(f'   Uptime: {_format_duration(live["uptime"])}')
+    typer.echo(f'   Config: {live["config_path"]}')
+    typer.echo(f'   Debug: {str(live["debug"]).lower()}')
+    typer.echo(f'   Foreground: {str(live["foreground"]).lower()}')
+    typer.echo(f'   Hotkeys: {live["hotkeys"]} (tap timeout {live["tap_timeout"]}s)')
+
+    counters = live.get('counters', {})
+    state = 'suspended' if counters.get('suspended') else 'grabbed'
+    devices = counters.get('devices', [])
+    typer.echo(f'   Keyboards: {len(devices)} ({state})')
+    for device in devices:
+        typer.echo(f'     - {device["name"]} ({device["path"]})')
+    typer.echo(
+        f'   Events: {counters.get("key_events", 0)} key, '
+        f'{counters.get("suppressed_events", 0)} suppressed, '
+        f'queue depth {counters.get("queue_depth", 0)}'
+    )
+    typer.echo(
+        f'   Taps: {counters.get("taps_detected", 0)} detected, '
+        f'{counters.get("taps_matched", 0)} matched, '
+        f'{counters.get("launches", 0)} launched, '
+        f'{counters.get("launch_failures", 0)} failed'
+    )
+    if 'prewarm_hits' in counters:
+        typer.echo(
+            f'   Prewarm: {counters["prewarm_hits"]} hits, '
+            f'{counters["prewarm_misses"]} misses, '
+            f'{counters["prewarm_wasted"]} wasted'
+        )
+    if live.get('memory_rss_bytes'):
+        typer.echo(f'   Memory: {live["memory_rss_bytes"] / 1024 / 1024:.1f} MB')
+    typer.echo(f'   CPU: {live["cpu_seconds"]:.2f}s total ({live["cpu_percent_avg"]:.2f}% average)')
+
+
 @app.command()  # type: ignore[misc]
 def status() -> None:
     """Show tap launcher status.
 
     This command displays the current status of the tap launcher daemon.
-    It shows whether the daemon is running, its PID, memory usage, and CPU usage.
+    When the daemon's control socket is available, live internal state is
+    shown (devices, counters, memory and CPU usage). Otherwise the PID file
+    and runtime state file are used.
 
     Examples:
         tap-launcher status
     """
+    live = _control_request('status')
+    if live is not None:
+        _print_live_status(live)
+        return
+
     daemon = DaemonManager()
 
     if daemon.is_running():
@@ -307,6 +513,141 @@ def status() -> None:
         raise typer.Exit(1)
 
 
+@app.command()  # type: ignore[misc]
+def stats() -> None:
+    """Show live counters and per-hotkey launch latency of the running daemon.
+
+    Examples:
+        tap-launcher stats
+    """
+    response = _require_control('stats')
+    counters = response.get('counters', {})
+    typer.echo('📊 Tap launcher statistics\n')
+    for name, value in counters.items():
+        if name != 'devices':
+            typer.echo(f'   {name}: {value}')
+
+    latency = response.get('launch_latency', {})
+    if not latency:
+        typer.echo('\nNo commands launched yet')
+        return
+    typer.echo('\nLaunch latency (tap → exec, ms):')
+    for label, entry in latency.items():
+        total = entry['total']
+        wait_p99 = entry.get('wait', {}).get('p99_ms', 0.0)
+        typer.echo(
+            f'   {label}: n={total["count"]} failures={entry["failures"]} '
+            f'p50={total["p50_ms"]:.2f} p99={total["p99_ms"]:.2f} max={total["max_ms"]:.2f} '
+            f'(wait p99={wait_p99:.2f}, '
+            f'dispatch p99={entry["dispatch"]["p99_ms"]:.2f}, spawn p99={entry["spawn"]["p99_ms"]:.2f})'
+        )
+
+
+@app.command()  # type: ignore[misc]
+def metrics() -> None:
+    """Print the running daemon's metrics in the Prometheus text format.
+
+    Examples:
+        tap-launcher metrics
+        tap-launcher metrics > /var/lib/node_exporter/textfile/tap_launcher.prom
+    """
+    response = _require_control('metrics')
+    typer.echo(response['text'], nl=False)
+
+
+@app.command()  # type: ignore[misc]
+def trace(
+    output: Path | None = typer.Option(None, '--output', '-o', help='Write the trace to this file'),  # noqa: B008
+) -> None:
+    """Dump the flight recorder: the last key events and tap decisions.
+
+    The running daemon keeps recent key handling steps in memory; use this
+    right after a hotkey misfired (sending SIGUSR1 to the daemon writes the
+    same dump to ~/.local/share/tap-launcher/tap-launcher.trace).
+
+    Examples:
+        tap-launcher trace
+        tap-launcher trace --output misfire.trace
+    """
+    response = _require_control('trace', timeout=5.0)
+    if response['capacity'] == 0:
+        typer.echo('❌ Flight recorder is disabled (trace_buffer_size = 0)', err=True)
+        raise typer.Exit(1)
+    if output is None:
+        typer.echo(response['text'], nl=False)
+        return
+    output.write_text(response['text'])
+    typer.echo(f'✓ {response["records"]} record(s) written to {output}')
+
+
+@app.command()  # type: ignore[misc]
+def profile(
+    seconds: float = typer.Option(10.0, '--seconds', '-s', help='How long to profile'),
+    cprofile: bool = typer.Option(
+        False, '--cprofile', help='Run cProfile and write pstats (covers every thread on Python 3.12+)'
+    ),
+    output: Path | None = typer.Option(None, '--output', '-o', help='Write the profile to this file'),  # noqa: B008
+) -> None:
+    """Profile the running daemon, e.g. when typing feels laggy.
+
+    By default the event thread's stack is sampled and collapsed stacks are
+    written (~/.local/share/tap-launcher/tap-launcher.folded) for flamegraph
+    tools. With --cprofile a pstats file is written instead
+    (tap-launcher.prof); on Python 3.12+ it covers the whole process, every
+    thread included, not only the event thread. Keep typing while it runs.
+
+    Examples:
+        tap-launcher profile --seconds 30
+        flamegraph.pl ~/.local/share/tap-launcher/tap-launcher.folded > lag.svg
+        tap-launcher profile --cprofile --seconds 30 --output lag.prof
+        python -m pstats lag.prof
+    """
+    params: dict[str, Any] = {'seconds': seconds, 'cprofile': cprofile}
+    if output is not None:
+        params['output'] = str(output.resolve())
+    typer.echo(f'Profiling the daemon for {seconds:g}s...')
+    response = _require_control('profile', timeout=seconds + 10.0, **params)
+    if response['mode'] == 'sample':
+        typer.echo(f'✓ {response["samples"]} stack sample(s) written to {response["path"]}')
+    else:
+        typer.echo(f'✓ {response["functions"]} profiled function(s) written to {response["path"]}')
+
+
+@app.command()  # type: ignore[misc]
+def reload() -> None:
+    """Reload the configuration file of the running daemon without restarting it.
+
+    Hotkeys, tap timeout and verbosity are applied immediately.
+
+    Examples:
+        tap-launcher reload
+    """
+    response = _require_control('reload', timeout=5.0)
+    typer.echo(f'✓ Configuration reloaded: {response["hotkeys"]} hotkey(s) from {response["config_path"]}')
+
+
+@app.command()  # type: ignore[misc]
+def suspend() -> None:
+    """Temporarily release keyboards so hotkeys are not handled.
+
+    Examples:
+        tap-launcher suspend
+    """
+    response = _require_control('suspend', timeout=3.0)
+    typer.echo('✓ Keyboard grabbing suspended' if response['changed'] else 'Already suspended')
+
+
+@app.command()  # type: ignore[misc]
+def resume() -> None:
+    """Grab keyboards again after 'suspend'.
+
+    Examples:
+        tap-launcher resume
+    """
+    response = _require_control('resume', timeout=3.0)
+    typer.echo('✓ Keyboard grabbing resumed' if response['changed'] else 'Not suspended')
+
+
 @app.command()  # type: ignore[misc]
 def check_config(
     config: Path | None = typer.Option(None, help='Path to config file'),  # noqa: B008
@@ -334,6 +675,12 @@ def check_config(
 
     typer.echo(f'Config file: {config_path}')
     typer.echo(f'Tap timeout: {app_config.tap_timeout}s')
+    if any(hotkey.sequence for hotkey in app_config.all_hotkeys()):
+        typer.echo(f'Sequence timeout: {app_config.sequence_timeout}s')
+    if app_config.press_buffer_ms:
+        typer.echo(f'Press buffer: {app_config.press_buffer_ms} ms')
+    if app_config.prewarm:
+        typer.echo('Prewarm: enabled')
     typer.echo(f'Log level: {app_config.log_level}')
     if app_config.log_file:
         typer.echo(f'Log file: {app_config.log_file}')
@@ -342,21 +689,59 @@ def check_config(
 
     typer.echo(f'\nConfigured hotkeys ({len(app_config.hotkeys)}):')
 
-    for idx, hotkey in enumerate(app_config.hotkeys, 1):
-        keys_str = '+'.join(sorted(hotkey.keys))
-        cmd_str = hotkey.command
-        if hotkey.args:
-            cmd_str += ' ' + ' '.join(hotkey.args)
+    from .command_executor import CommandExecutor  # noqa: PLC0415
+    from .hotkey_matcher import HotkeyMatcher  # noqa: PLC0415
+
+    executor = CommandExecutor(log_commands=False)
+    matcher = HotkeyMatcher(app_config.hotkeys, app_config.tap_timeout)
+    _echo_hotkeys(app_config.hotkeys, matcher, executor)
+    for layer in app_config.layers:
+        typer.echo(f'\nLayer {layer.name} ({len(layer.hotkeys)} hotkeys, timeout {layer.timeout}s):')
+        _echo_hotkeys(layer.hotkeys, HotkeyMatcher(layer.active_hotkeys(), app_config.tap_timeout), executor)
+    _echo_remaps(app_config)
 
-        typer.echo(f'\n{idx}. {keys_str}')
-        typer.echo(f'   Command: {cmd_str}')
-        if hotkey.description:
-            typer.echo(f'   Description: {hotkey.description}')
 
-        executor = CommandExecutor(log_commands=False)
-        if not executor.check_command_exists(hotkey.command):
+def _echo_hotkeys(hotkeys: list[HotkeyConfig], matcher: 'HotkeyMatcher', executor: 'CommandExecutor') -> None:
+    """Print hotkeys of ``check-config``, warning about missing commands."""
+    for idx, hotkey in enumerate(hotkeys, 1):
+        _echo_hotkey(idx, hotkey, matcher)
+        if hotkey.command and not executor.check_command_exists(hotkey.command):
             typer.echo('   ⚠️  Warning: Command not found')
 
 
+def _echo_remaps(app_config: AppConfig) -> None:
+    """Print the key remapping of ``check-config``."""
+    if not app_config.remaps:
+        return
+    typer.echo(f'\nKey remapping ({len(app_config.remaps)}):')
+    for remap in app_config.remaps:
+        devices = f" (devices: {', '.join(remap.devices)})" if remap.devices else ''
+        typer.echo(f'  {remap.source} → {remap.target}{devices}')
+
+
+def _echo_hotkey(idx: int, hotkey: HotkeyConfig, matcher: 'HotkeyMatcher') -> None:
+    """Print one hotkey of ``check-config``."""
+    cmd_str = hotkey.command
+    if hotkey.args:
+        cmd_str += ' ' + ' '.join(hotkey.args)
+
+    typer.echo(f'\n{idx}. {hotkey.label()}')
+    if hotkey.layer:
+        typer.echo(f'   Layer: {hotkey.layer}')
+    else:
+        typer.echo(f'   Command: {cmd_str}')
+    if hotkey.description:
+        typer.echo(f'   Description: {hotkey.description}')
+    if hotkey.trigger == 'hold':
+        typer.echo(f'   Hold: {hotkey.hold_ms} ms')
+    if hotkey.fire_on == 'press':
+        if matcher.fires_while_held(hotkey):
+            typer.echo(f'   Fire on: press (grace {hotkey.held_fire_ms()} ms)')
+        else:
+            typer.echo('   ⚠️  Fire on: release (another hotkey contains these keys)')
+    if hotkey.devices:
+        typer.echo(f"   Devices: {', '.join(hotkey.devices)}")
+
+
 if __name__ == '__main__':
     app()
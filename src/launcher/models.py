@@ -3,6 +3,31 @@
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from common.key_normalizer import is_modifier_key
+
+if TYPE_CHECKING:
+    from common.backends.base import DeviceInfo
+
+# Tap timeout in seconds used when neither the hotkey nor [app] sets one
+DEFAULT_TAP_TIMEOUT = 0.2
+
+# How a hotkey is triggered: a short tap, or keys held for ``hold_ms``
+TRIGGERS = ('tap', 'hold')
+
+# When a modifier-only tap hotkey fires: on the first release (the tap is
+# complete), or once all its keys are down and ``grace_ms`` has passed
+FIRE_ON = ('release', 'press')
+DEFAULT_GRACE_MS = 30
+MAX_GRACE_MS = 1000
+
+# Layer active at startup; ``layer = "base"`` in a hotkey returns to it
+BASE_LAYER = 'base'
+# Seconds without a matching hotkey after which a layer is left
+DEFAULT_LAYER_TIMEOUT = 5.0
+# Key that leaves any layer (unless the layer binds it)
+LAYER_EXIT_KEY = 'esc'
 
 
 @dataclass
@@ -11,19 +36,46 @@ class HotkeyConfig:
 
     Attributes:
         keys: List of normalized key names (e.g., ["ctrl_l", "shift_l"])
-        command: Path to command to execute
+        command: Path to command to execute (empty when ``layer`` is set)
         args: Command-line arguments for the command
         description: Human-readable description of the hotkey action
         start_timer_from_second_key: If True, tap timer starts from the second key press.
             This is useful for combinations where the first key may be held down
             while searching for the second key (e.g., Ctrl held, then Shift found).
             Default is False (classic behavior: timer starts from first key).
+        sequence: Taps that must follow each other within ``sequence_timeout``
+            (e.g., ``[["ctrl_l"], ["ctrl_l"]]`` for a double tap). Empty for a
+            single-tap hotkey; otherwise ``keys`` holds the first step.
+        tap_timeout: Maximum duration in seconds of a tap of this hotkey
+            (None uses the global ``tap_timeout``)
+        trigger: ``"tap"`` (default) or ``"hold"``: fire while the keys are
+            still held, once they have been held for ``hold_ms``
+        hold_ms: Hold threshold in milliseconds (required for ``"hold"``)
+        fire_on: ``"release"`` (default) or ``"press"``: fire a modifier-only
+            tap as soon as all its keys are down, unless another key is
+            pressed or one is released within ``grace_ms``
+        grace_ms: Grace window in milliseconds for ``fire_on = "press"``
+            (None uses ``DEFAULT_GRACE_MS``)
+        devices: Devices the hotkey is limited to: names (``*`` wildcards
+            allowed) or ``"vendor:product"`` ids in hex. Empty for all
+            devices; a scoped hotkey wins over an unscoped one with the
+            same keys.
+        layer: Layer the hotkey switches to instead of running a command
+            (``"base"`` leaves the current layer)
     """
     keys: list[str]
     command: str
     args: list[str] = field(default_factory=list)
     description: str = ''
     start_timer_from_second_key: bool = False
+    sequence: list[list[str]] = field(default_factory=list)
+    tap_timeout: float | None = None
+    trigger: str = 'tap'
+    hold_ms: int | None = None
+    fire_on: str = 'release'
+    grace_ms: int | None = None
+    devices: list[str] = field(default_factory=list)
+    layer: str = ''
 
     def keys_set(self) -> frozenset[str]:
         """Return keys as a frozen set for comparison.
@@ -36,12 +88,153 @@ class HotkeyConfig:
         """
         return frozenset(self.keys)
 
+    def steps(self) -> tuple[frozenset[str], ...]:
+        """Return the key sets of all taps (a single one for a plain hotkey)."""
+        if self.sequence:
+            return tuple(frozenset(step) for step in self.sequence)
+        return (self.keys_set(),)
+
+    def label(self) -> str:
+        """Return a stable label such as ``ctrl_l+shift_l`` or ``super_l, t``.
+
+        Used in logs, statistics and metrics.
+        """
+        label = ', '.join('+'.join(sorted(step)) for step in self.steps())
+        return f'{label} (hold)' if self.trigger == 'hold' else label
+
+    def held_fire_ms(self) -> int | None:
+        """Return how long the keys must stay down before the hotkey fires while they are held.
+
+        ``hold_ms`` for a hold hotkey, the grace window for ``fire_on =
+        "press"``, None for hotkeys fired when their tap completes.
+        """
+        if self.trigger == 'hold':
+            return self.hold_ms
+        if self.fire_on == 'press':
+            return self.grace_ms if self.grace_ms is not None else DEFAULT_GRACE_MS
+        return None
+
+    def matches_device(self, device: 'DeviceInfo') -> bool:
+        """Check if the hotkey applies to taps on ``device``."""
+        return not self.devices or any(device.matches(pattern) for pattern in self.devices)
+
     def __post_init__(self) -> None:
         """Validate the hotkey configuration."""
         if not self.keys:
             raise ValueError('Hotkey must have at least one key')  # noqa: TRY003
-        if not self.command:
-            raise ValueError('Hotkey must have a command')  # noqa: TRY003
+        if not self.command and not self.layer:
+            raise ValueError('Hotkey must have a command or a layer')  # noqa: TRY003
+        if self.command and self.layer:
+            raise ValueError('A hotkey either runs a command or switches layers, not both')  # noqa: TRY003
+        if self.tap_timeout is not None and self.tap_timeout <= 0:
+            raise ValueError(f'tap_timeout must be positive, got {self.tap_timeout}')  # noqa: TRY003
+        if self.sequence:
+            if len(self.sequence) < 2:  # noqa: PLR2004
+                raise ValueError('A sequence must have at least two taps')  # noqa: TRY003
+            if not all(self.sequence):
+                raise ValueError('Every tap of a sequence must have at least one key')  # noqa: TRY003
+        if self.sequence and self.devices:
+            raise ValueError('A sequence cannot be limited to devices')  # noqa: TRY003
+        self._check_trigger()
+        self._check_fire_on()
+
+    def _check_fire_on(self) -> None:
+        """Validate ``fire_on`` and ``grace_ms``."""
+        if self.fire_on not in FIRE_ON:
+            raise ValueError(f"fire_on must be one of {', '.join(FIRE_ON)}, got {self.fire_on!r}")  # noqa: TRY003
+        if self.fire_on == 'release':
+            if self.grace_ms is not None:
+                raise ValueError("grace_ms requires fire_on = 'press'")  # noqa: TRY003
+            return
+        if self.trigger != 'tap' or self.sequence:
+            raise ValueError("fire_on = 'press' requires a single tap hotkey")  # noqa: TRY003
+        if len(self.keys_set()) < 2 or not all(is_modifier_key(key) for key in self.keys):  # noqa: PLR2004
+            raise ValueError("fire_on = 'press' requires two or more keys, all modifiers")  # noqa: TRY003
+        if self.grace_ms is not None and not 0 <= self.grace_ms <= MAX_GRACE_MS:
+            raise ValueError(f'grace_ms must be between 0 and {MAX_GRACE_MS}, got {self.grace_ms}')  # noqa: TRY003
+
+    def _check_trigger(self) -> None:
+        """Validate ``trigger`` and ``hold_ms``."""
+        if self.trigger not in TRIGGERS:
+            raise ValueError(f"trigger must be one of {', '.join(TRIGGERS)}, got {self.trigger!r}")  # noqa: TRY003
+        if self.trigger == 'tap':
+            if self.hold_ms is not None:
+                raise ValueError("hold_ms requires trigger = 'hold'")  # noqa: TRY003
+            return
+        if self.hold_ms is None or self.hold_ms <= 0:
+            raise ValueError(f'A hold hotkey needs a positive hold_ms, got {self.hold_ms}')  # noqa: TRY003
+        if self.sequence:
+            raise ValueError('A hold hotkey cannot be a sequence')  # noqa: TRY003
+
+
+@dataclass
+class LayerConfig:
+    """A layer (mode) of hotkeys, entered by a hotkey whose ``layer`` names it.
+
+    While a layer is active its hotkeys replace the base hotkeys, so single
+    keys can fire actions. Esc (unless bound in the layer) or ``timeout``
+    seconds without a matching hotkey return to the base layer.
+
+    Attributes:
+        name: Name hotkeys refer to in ``layer``
+        hotkeys: Hotkeys of the layer
+        timeout: Seconds without a matching hotkey after which the layer is
+            left; each matching hotkey restarts it
+    """
+    name: str
+    hotkeys: list[HotkeyConfig] = field(default_factory=list)
+    timeout: float = DEFAULT_LAYER_TIMEOUT
+
+    def __post_init__(self) -> None:
+        """Validate the layer."""
+        if not self.name or self.name == BASE_LAYER:
+            raise ValueError(f'A layer needs a name other than {BASE_LAYER!r}')  # noqa: TRY003
+        if not self.hotkeys:
+            raise ValueError(f'Layer {self.name!r} must have at least one hotkey')  # noqa: TRY003
+        if self.timeout <= 0:
+            raise ValueError(f'Layer timeout must be positive, got {self.timeout}')  # noqa: TRY003
+
+    def active_hotkeys(self) -> list[HotkeyConfig]:
+        """Return the hotkeys matched in the layer: its own, plus Esc to leave it."""
+        exit_keys = frozenset((LAYER_EXIT_KEY,))
+        if any(hotkey.keys_set() == exit_keys and not hotkey.sequence for hotkey in self.hotkeys):
+            return self.hotkeys
+        leave = HotkeyConfig(keys=[LAYER_EXIT_KEY], command='', layer=BASE_LAYER, description=f'Leave {self.name}')
+        return [*self.hotkeys, leave]
+
+
+@dataclass
+class KeyRemap:
+    """Static remapping of a key, applied by the backend to every event of the key.
+
+    Attributes:
+        source: Key on the keyboard (e.g., "caps_lock")
+        target: Key reported and emitted instead (e.g., "ctrl_l")
+        devices: Devices the remapping is limited to, as for hotkeys; empty
+            for all devices. A scoped remapping of a key wins over an
+            unscoped one on the devices it matches
+    """
+    source: str
+    target: str
+    devices: list[str] = field(default_factory=list)
+
+    def matches_device(self, device: 'DeviceInfo') -> bool:
+        """Check if the remapping applies to ``device``."""
+        return not self.devices or any(device.matches(pattern) for pattern in self.devices)
+
+    def __post_init__(self) -> None:
+        """Validate the remapping."""
+        if not self.source or not self.target:
+            raise ValueError('A remapping needs both a source and a target key')  # noqa: TRY003
+        if self.source == self.target:
+            raise ValueError(f'A key cannot be remapped to itself: {self.source}')  # noqa: TRY003
+
+
+# Upper bound of the flight recorder size (16 bytes per record)
+MAX_TRACE_BUFFER_SIZE = 1_000_000
+
+# Upper bound of the delay press buffering may add to a key press
+MAX_PRESS_BUFFER_MS = 250
 
 
 @dataclass
@@ -49,38 +242,134 @@ class AppConfig:
     """Application configuration.
 
     Attributes:
-        tap_timeout: Maximum duration in seconds for a valid tap
+        tap_timeout: Maximum duration in seconds for a valid tap (hotkeys may
+            override it)
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Path to log file (None for no file logging)
+        log_max_bytes: Rotate the log file at this size in bytes (0 disables rotation)
+        log_backup_count: Number of gzip-compressed rotated log files to keep
         debug_mode: Enable debug mode with additional logging
         verbose_logging: Enable verbose logging of tap detection
+        stats_log_interval: Interval in seconds between launch latency summaries
+            in the log (0 disables periodic summaries)
+        metrics_file: Prometheus textfile rewritten every ``metrics_interval``
+            seconds (None disables it)
+        metrics_interval: Interval in seconds between metrics file writes
+        trace_buffer_size: Records kept by the in-memory flight recorder
+            (0 disables it)
+        sequence_timeout: Maximum pause in seconds between the taps of a
+            sequence; also how long a tap that could start a sequence waits
+            before its own hotkey runs
+        press_buffer_ms: Longest time in milliseconds the presses of a tap
+            that may become a modifier-only hotkey are held back, so a
+            matching tap never reaches the desktop (0 disables buffering)
+        prewarm: Fork a warm launch shell and resolve candidate commands as
+            soon as a tap starts, so a match only has to hand over the
+            command line
         hotkeys: List of configured hotkey combinations
+        remaps: Static key remappings, applied before tap detection (taking
+            effect on restart)
+        layers: Layers that hotkeys can switch to
     """
-    tap_timeout: float = 0.2
+    tap_timeout: float = DEFAULT_TAP_TIMEOUT
     log_level: str = 'INFO'
     log_file: Path | None = None
+    log_max_bytes: int = 10 * 1024 * 1024
+    log_backup_count: int = 5
     debug_mode: bool = False
     verbose_logging: bool = False
+    stats_log_interval: float = 300.0
+    metrics_file: Path | None = None
+    metrics_interval: float = 15.0
+    trace_buffer_size: int = 4096
+    sequence_timeout: float = 0.4
+    press_buffer_ms: int = 0
+    prewarm: bool = False
     hotkeys: list[HotkeyConfig] = field(default_factory=list)
+    remaps: list[KeyRemap] = field(default_factory=list)
+    layers: list[LayerConfig] = field(default_factory=list)
 
     def __post_init__(self) -> None:
         """Validate the application configuration."""
         if self.tap_timeout <= 0:
             raise ValueError(f'tap_timeout must be positive, got {self.tap_timeout}')  # noqa: TRY003
 
+        if self.stats_log_interval < 0:
+            raise ValueError(f'stats_log_interval must not be negative, got {self.stats_log_interval}')  # noqa: TRY003
+
+        if self.log_max_bytes < 0 or self.log_backup_count < 0:
+            raise ValueError('log_max_bytes and log_backup_count must not be negative')  # noqa: TRY003
+
+        if not 0 <= self.trace_buffer_size <= MAX_TRACE_BUFFER_SIZE:
+            raise ValueError(  # noqa: TRY003
+                f'trace_buffer_size must be between 0 and {MAX_TRACE_BUFFER_SIZE}, got {self.trace_buffer_size}'
+            )
+
+        if self.sequence_timeout <= 0:
+            raise ValueError(f'sequence_timeout must be positive, got {self.sequence_timeout}')  # noqa: TRY003
+
+        if not 0 <= self.press_buffer_ms <= MAX_PRESS_BUFFER_MS:
+            raise ValueError(  # noqa: TRY003
+                f'press_buffer_ms must be between 0 and {MAX_PRESS_BUFFER_MS}, got {self.press_buffer_ms}'
+            )
+
+        if self.metrics_interval <= 0:
+            raise ValueError(f'metrics_interval must be positive, got {self.metrics_interval}')  # noqa: TRY003
+
         if self.log_level not in ('DEBUG', 'INFO', 'WARNING', 'ERROR'):
             raise ValueError(f'Invalid log_level: {self.log_level}')  # noqa: TRY003
 
         if not self.hotkeys:
             raise ValueError('Configuration must have at least one hotkey')  # noqa: TRY003
 
-        # Check for duplicate key combinations
+        self._check_duplicates(self.hotkeys)
+        self._check_layers()
+        self._check_remaps()
+
+    def all_hotkeys(self) -> list[HotkeyConfig]:
+        """Return the base hotkeys followed by the hotkeys of each layer."""
+        return [*self.hotkeys, *(hotkey for layer in self.layers for hotkey in layer.hotkeys)]
+
+    def remap_for(self, device: 'DeviceInfo') -> dict[str, str]:
+        """Return the remapping of ``device`` as ``{source: target}`` key names."""
+        mapping = {remap.source: remap.target for remap in self.remaps if not remap.devices}
+        mapping.update(
+            (remap.source, remap.target) for remap in self.remaps if remap.devices and remap.matches_device(device)
+        )
+        return mapping
+
+    @staticmethod
+    def _check_duplicates(hotkeys: list[HotkeyConfig]) -> None:
+        """Reject hotkeys with the same key combination (or the same sequence) and devices."""
         seen_keys = set()
-        for hotkey in self.hotkeys:
-            keys_set = hotkey.keys_set()
-            if keys_set in seen_keys:
-                keys_str = '+'.join(sorted(hotkey.keys))
-                raise ValueError(f'Duplicate hotkey combination: {keys_str}')  # noqa: TRY003
-            seen_keys.add(keys_set)
+        for hotkey in hotkeys:
+            steps = (hotkey.steps(), tuple(sorted(hotkey.devices)))
+            if steps in seen_keys:
+                raise ValueError(f'Duplicate hotkey combination: {hotkey.label()}')  # noqa: TRY003
+            seen_keys.add(steps)
+
+    def _check_layers(self) -> None:
+        """Reject duplicate layer names and hotkeys switching to undefined layers."""
+        names = {BASE_LAYER}
+        for layer in self.layers:
+            if layer.name in names:
+                raise ValueError(f'Duplicate layer: {layer.name}')  # noqa: TRY003
+            names.add(layer.name)
+            try:
+                self._check_duplicates(layer.hotkeys)
+            except ValueError as e:
+                raise ValueError(f'In layer {layer.name!r}: {e}') from e  # noqa: TRY003
+        for hotkey in self.all_hotkeys():
+            if hotkey.layer and hotkey.layer not in names:
+                raise ValueError(f'Hotkey {hotkey.label()} switches to undefined layer {hotkey.layer!r}')  # noqa: TRY003
+
+    def _check_remaps(self) -> None:
+        """Reject two remappings of the same key for the same devices."""
+        seen_sources = set()
+        for remap in self.remaps:
+            source = (remap.source, tuple(sorted(remap.devices)))
+            if source in seen_sources:
+                raise ValueError(f'Duplicate remapping of {remap.source}')  # noqa: TRY003
+            seen_sources.add(source)
 
 
@@ -3,16 +3,49 @@
 This module integrates tap detection with command execution.
 """
 
+import threading
+from time import perf_counter
+from typing import TYPE_CHECKING
 from typing import Any
 
+from common import flight_recorder as fr
 from common.key_normalizer import format_keys_display, is_modifier_key
 from common.logging_utils import get_logger
+from common.metrics import REGISTRY
+from common.metrics import TextfileExporter
+from common.sd_notify import EventLoopWatchdog
+from common.sd_notify import SdNotifier
+from common.sd_notify import watchdog_interval
 from common.tap_monitor import TapMonitor
 from common.version import get_version_info
 
 from .command_executor import CommandExecutor
+from .hold_engine import HoldTracker
 from .hotkey_matcher import HotkeyMatcher
+from .layers import Layer
+from .models import BASE_LAYER
 from .models import AppConfig, HotkeyConfig
+from .press_buffer import PressBuffer
+from .prewarm import Prewarmer
+from .sequence_engine import CompletedTap
+from .sequence_engine import SequenceTracker
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+    from .hold_engine import Cancellable
+
+TAPS = REGISTRY.counter(
+    'tap_launcher_taps_total',
+    'Completed key combinations, by validity and the reason a tap was invalid',
+    ('result', 'reason'),
+)
+HOTKEY_MATCHES = REGISTRY.counter(
+    'tap_launcher_hotkey_matches_total',
+    'Taps that matched a configured hotkey',
+    ('hotkey',),
+)
 
 
 class LauncherMonitor:
@@ -29,6 +62,7 @@ class LauncherMonitor:
         config: AppConfig,
         matcher: HotkeyMatcher,
         executor: CommandExecutor,
+        notifier: SdNotifier | None = None,
     ) -> None:
         """Initialize the launcher monitor.
 
@@ -36,11 +70,34 @@ class LauncherMonitor:
             config: Application configuration
             matcher: Hotkey matcher for finding matching hotkeys
             executor: Command executor for running commands
+            notifier: Service manager notifier (READY=1, WATCHDOG=1, STOPPING=1)
         """
         self.config = config
         self.matcher = matcher
         self.executor = executor
+        self.notifier = notifier
         self.logger = get_logger('tap_launcher.monitor')
+        self._watchdog: EventLoopWatchdog | None = None
+        self._metrics_exporter: TextfileExporter | None = None
+
+        # Live counters (updated on the event thread only)
+        self.taps_detected = 0
+        self.taps_matched = 0
+        self.launches = 0
+        self.launch_failures = 0
+
+        # Observer of completed taps (keys, duration, matched hotkey label);
+        # set by the control socket while event stream subscribers exist
+        self._tap_observer: Callable[[set[Any], float, str | None], None] | None = None
+
+        # Metrics slots; the monitor is created on the thread that later runs
+        # the event loop, so this is the event thread's shard
+        self._metric_counts = REGISTRY.shard().values
+        self._valid_tap_slot = TAPS.slot('valid', '')
+        self._invalid_tap_slots: dict[str, int] = {}
+
+        fr.RECORDER.resize(config.trace_buffer_size)
+        self.sequences = self._create_sequence_tracker(config, matcher)
 
         # Create backend (auto-detects all available keyboards)
         from common.backends.detector import create_backend
@@ -52,10 +109,45 @@ class LauncherMonitor:
             timeout=config.tap_timeout,
             verbose=config.verbose_logging,
             on_keys_detected=self._on_tap_detected,
-            on_tap_invalid=None,  # We don't need invalid tap notifications
+            on_tap_invalid=self._on_tap_invalid,  # Counted in metrics
             check_timer_delay=self._check_timer_delay,  # Check if timer should be delayed
+            candidates=matcher,  # Drops taps no hotkey can match; per-hotkey timeouts
             backend=backend,  # Use configured backend
         )
+        if config.remaps:
+            if hasattr(backend, 'key_remapper'):
+                backend.key_remapper = config.remap_for
+            else:
+                self.logger.warning(f'Key remapping is not supported by the {backend.get_backend_name()} backend')
+        self.holds = self._create_hold_tracker(matcher)
+        self.tap_monitor.holds = self.holds
+        self.press_buffer = self._create_press_buffer(config, matcher)
+        self.tap_monitor.buffer = self.press_buffer
+        self.prewarmer: Prewarmer | None = None
+        self._set_prewarmer(config, matcher)
+        self._layer_timer: Cancellable | None = None
+        self._stats_timer: Cancellable | None = None
+        self._hotkey_indices: dict[int, int] = {}
+        self.layer, self._layers = self._compile_layers(config, matcher)
+        REGISTRY.gauge(
+            'tap_launcher_event_queue_depth',
+            'Input events waiting in the queue between reader threads and the event loop',
+            self._queue_depth_samples,
+        )
+
+    @property
+    def tap_observer(self) -> 'Callable[[set[Any], float, str | None], None] | None':
+        """Observer of completed taps (keys, duration, matched hotkey label).
+
+        The key set is only valid during the call: copy it to keep it.
+        """
+        return self._tap_observer
+
+    @tap_observer.setter
+    def tap_observer(self, observer: 'Callable[[set[Any], float, str | None], None] | None') -> None:
+        # Observers see every tap, so taps that match no hotkey are not pruned
+        self._tap_observer = observer
+        self.tap_monitor.prune = observer is None
 
     def start(self) -> None:
         """Start monitoring keyboard (blocking call).
@@ -65,6 +157,20 @@ class LauncherMonitor:
         """
         self._log_startup()
 
+        if self.config.metrics_file is not None:
+            self._metrics_exporter = TextfileExporter(
+                REGISTRY, self.config.metrics_file, self.config.metrics_interval
+            )
+            self._metrics_exporter.start()
+
+        # Report readiness from the event loop itself: the callable runs
+        # once devices are grabbed and events are being dispatched
+        call_soon = getattr(self.tap_monitor.backend, 'call_soon', None)
+        if call_soon is not None:
+            call_soon(self._on_backend_ready)
+        else:
+            self._on_backend_ready()
+
         # Start tap monitor - backend handles all event emulation internally
         try:
             self.tap_monitor.start()
@@ -78,9 +184,144 @@ class LauncherMonitor:
         This method stops the tap monitor listener, allowing
         the monitoring loop to exit cleanly.
         """
+        if self.notifier is not None:
+            self.notifier.stopping()
+        if self._watchdog is not None:
+            self._watchdog.stop()
         if self.tap_monitor:
             self.tap_monitor.stop()
             self.logger.info('Tap monitor stopped')
+        if self._stats_timer is not None:
+            self._stats_timer.cancel()
+            self._stats_timer = None
+        if self.executor.stats is not None:
+            self.executor.stats.log_summary()
+        if self._metrics_exporter is not None:
+            self._metrics_exporter.stop()
+        if self.prewarmer is not None:
+            self.prewarmer.close()
+
+    def _on_backend_ready(self) -> None:
+        """Notify the service manager that startup finished and start the watchdog."""
+        self.logger.info('Keyboard monitoring is running')
+        self._on_stats_timer()
+        if self.notifier is None or not self.notifier.enabled:
+            return
+        self.notifier.ready(f'Monitoring {len(self.config.hotkeys)} hotkey combination(s)')
+        interval = watchdog_interval()
+        call_soon = getattr(self.tap_monitor.backend, 'call_soon', None)
+        if interval is not None and call_soon is not None:
+            self._watchdog = EventLoopWatchdog(self.notifier, interval, call_soon)
+            self._watchdog.start()
+            self.logger.info(f'Service watchdog enabled: ping every {interval:.1f}s')
+
+    def _on_stats_timer(self) -> None:
+        """Log the launch latency summary if due and re-arm for the next one (event thread)."""
+        self._stats_timer = None
+        stats = self.executor.stats
+        if stats is None:
+            return
+        now = perf_counter()
+        stats.maybe_log(now)
+        delay = stats.next_log_delay(now)
+        if delay is not None:
+            self._stats_timer = self._schedule(delay, self._on_stats_timer)
+
+    def counters(self) -> dict[str, int]:
+        """Return live tap/launch counters."""
+        counters = {
+            'taps_detected': self.taps_detected,
+            'taps_matched': self.taps_matched,
+            'launches': self.launches,
+            'launch_failures': self.launch_failures,
+        }
+        if self.prewarmer is not None:
+            counters.update(self.prewarmer.counters())
+        return counters
+
+    def _queue_depth_samples(self) -> 'Iterable[tuple[tuple[str, ...], float]]':
+        backend = self.tap_monitor.backend
+        if hasattr(backend, 'get_stats'):
+            yield (), backend.get_stats().get('queue_depth', 0)
+
+    def apply_config(self, config: AppConfig, matcher: HotkeyMatcher) -> None:
+        """Switch to a reloaded configuration (call on the event thread).
+
+        Hotkeys, tap timeout and verbosity take effect immediately; logging
+        destination and level, the metrics file and key remapping keep
+        their startup values until restart.
+
+        Args:
+            config: Newly loaded application configuration
+            matcher: Matcher built from the new hotkeys
+        """
+        if config.remaps != self.config.remaps:
+            self.logger.warning('Key remapping changes take effect on restart')
+        self._cancel_layer_timeout()
+        self.config = config
+        self.matcher = matcher
+        self.sequences = self._create_sequence_tracker(config, matcher)
+        if self.holds is not None:
+            self.holds.cancel()
+        self.holds = self._create_hold_tracker(matcher)
+        self.tap_monitor.holds = self.holds
+        if self.press_buffer is not None:
+            self.press_buffer.cancel()
+        self.press_buffer = self._create_press_buffer(config, matcher)
+        self.tap_monitor.buffer = self.press_buffer
+        self._set_prewarmer(config, matcher)
+        self.layer, self._layers = self._compile_layers(config, matcher)
+        self.tap_monitor.timeout = config.tap_timeout
+        self.tap_monitor.verbose = config.verbose_logging
+        self.tap_monitor.candidates = matcher
+        self.tap_monitor.reset()
+        fr.RECORDER.resize(config.trace_buffer_size)
+        if self.executor.stats is not None and self.executor.stats.log_interval != config.stats_log_interval:
+            self.executor.stats.log_interval = config.stats_log_interval
+            if self._stats_timer is not None:
+                self._stats_timer.cancel()
+            self._on_stats_timer()
+        self.logger.info(f'Configuration reloaded: {len(config.hotkeys)} hotkey combination(s)')
+
+    def suspend(self) -> bool:
+        """Suspend keyboard grabbing (call on the event thread).
+
+        Returns:
+            bool: True if grabbing was suspended by this call
+        """
+        backend = self.tap_monitor.backend
+        if not hasattr(backend, 'suspend'):
+            raise RuntimeError('Backend does not support suspend')  # noqa: TRY003
+        self.tap_monitor.reset()
+        if self.sequences is not None:
+            self.sequences.reset()
+        if self.holds is not None:
+            self.holds.cancel(restore=False)
+        if self.press_buffer is not None:
+            self.press_buffer.cancel(restore=False)
+        if self.prewarmer is not None:
+            self.prewarmer.discard()
+        if self.layer.timeout is not None:
+            self._activate(self._layers[BASE_LAYER])
+        return bool(backend.suspend())
+
+    def resume(self) -> bool:
+        """Resume keyboard grabbing (call on the event thread).
+
+        Returns:
+            bool: True if grabbing was resumed by this call
+        """
+        backend = self.tap_monitor.backend
+        if not hasattr(backend, 'resume'):
+            raise RuntimeError('Backend does not support resume')  # noqa: TRY003
+        self.tap_monitor.reset()
+        if self.sequences is not None:
+            self.sequences.reset()
+        if self.holds is not None:
+            self.holds.cancel(restore=False)
+        if self.press_buffer is not None:
+            self.press_buffer.cancel(restore=False)
+        return bool(backend.resume())
 
     def _check_timer_delay(self, first_key_normalized: str) -> bool:
         """Check if timer should be delayed for the given first key.
@@ -96,6 +337,141 @@ class LauncherMonitor:
         """
         return self.matcher.should_delay_timer_start(first_key_normalized)
 
+    def _create_sequence_tracker(self, config: AppConfig, matcher: HotkeyMatcher) -> SequenceTracker | None:
+        """Return a tracker for sequence hotkeys (None if none are configured)."""
+        if not matcher.has_sequences:
+            return None
+        return SequenceTracker(matcher.sequence_root, config.sequence_timeout, self._fire_sequence, self._schedule)
+
+    def _create_hold_tracker(self, matcher: HotkeyMatcher) -> HoldTracker | None:
+        """Return a tracker for hotkeys fired while held (None if none are configured)."""
+        if not matcher.hold_mask:
+            return None
+        return HoldTracker(matcher, self._fire_hold, self._schedule, self.tap_monitor.backend)
+
+    def _create_press_buffer(self, config: AppConfig, matcher: HotkeyMatcher) -> PressBuffer | None:
+        """Return the press buffer (None if disabled or no modifier-only hotkey is configured)."""
+        if not config.press_buffer_ms or not matcher.buffer_masks:
+            return None
+        backend = self.tap_monitor.backend
+        if not hasattr(backend, 'buffer_key') or not hasattr(backend, 'restore_key'):
+            self.logger.warning("Backend doesn't support press buffering, press_buffer_ms ignored")
+            return None
+        return PressBuffer(matcher, config.press_buffer_ms / 1000, self._schedule, backend)
+
+    def _compile_layers(self, config: AppConfig, matcher: HotkeyMatcher) -> tuple[Layer, dict[str, Layer]]:
+        """Compile every layer; return the base layer (built on the current engines) and all layers by name.
+
+        Also indexes the configured hotkeys by identity for the flight recorder.
+        """
+        # The index is recorded in a 16-bit field, where 0xFFFF marks the synthetic layer exits
+        self._hotkey_indices = {id(hotkey): min(index, 0xFFFE) for index, hotkey in enumerate(config.all_hotkeys())}
+        base = Layer(BASE_LAYER, matcher, self.sequences, self.holds, self.press_buffer)
+        layers = {BASE_LAYER: base}
+        for layer_config in config.layers:
+            layer_matcher = HotkeyMatcher(layer_config.active_hotkeys(), config.tap_timeout)
+            layers[layer_config.name] = Layer(
+                layer_config.name,
+                layer_matcher,
+                self._create_sequence_tracker(config, layer_matcher),
+                self._create_hold_tracker(layer_matcher),
+                self._create_press_buffer(config, layer_matcher),
+                layer_config.timeout,
+            )
+        return base, layers
+
+    def _activate(self, layer: Layer) -> None:
+        """Make ``layer`` the active layer (call on the event thread).
+
+        Only references are swapped to the layer's precompiled matcher and
+        engines; the engines of the layer left are disarmed first.
+        """
+        if self.holds is not None:
+            self.holds.cancel()
+        if self.press_buffer is not None:
+            self.press_buffer.cancel()
+        if self.sequences is not None:
+            self.sequences.reset()
+        self._cancel_layer_timeout()
+        self.layer = layer
+        self.matcher = layer.matcher
+        self.sequences = layer.sequences
+        self.holds = layer.holds
+        self.press_buffer = layer.press_buffer
+        tap_monitor = self.tap_monitor
+        tap_monitor.reset()
+        tap_monitor.candidates = layer.matcher
+        tap_monitor.holds = layer.holds
+        tap_monitor.buffer = layer.press_buffer
+        # Prewarming follows the base hotkeys only
+        base = layer.timeout is None
+        tap_monitor.on_tap_start = self.prewarmer.on_prefix if self.prewarmer is not None and base else None
+        if not base:
+            self._arm_layer_timeout()
+        self.logger.info(f'Layer: {layer.name}')
+
+    def _switch_layer(self, name: str) -> None:
+        """Switch to the layer a matched hotkey names (its held-back presses are dropped)."""
+        if self.press_buffer is not None:
+            self.press_buffer.drop()
+        self._activate(self._layers[name])
+
+    def _arm_layer_timeout(self) -> None:
+        """(Re)start the timeout of the active layer."""
+        self._cancel_layer_timeout()
+        layer = self.layer
+        assert layer.timeout is not None
+        self._layer_timer = self._schedule(layer.timeout, lambda: self._on_layer_timeout(layer))
+
+    def _cancel_layer_timeout(self) -> None:
+        if self._layer_timer is not None:
+            self._layer_timer.cancel()
+            self._layer_timer = None
+
+    def _on_layer_timeout(self, layer: Layer) -> None:
+        if self.layer is not layer:
+            return
+        self._layer_timer = None
+        self.logger.info(f'Layer {layer.name} timed out')
+        self._activate(self._layers[BASE_LAYER])
+
+    def _set_prewarmer(self, config: AppConfig, matcher: HotkeyMatcher) -> None:
+        """Replace the prewarmer (none unless ``prewarm`` is enabled)."""
+        if self.prewarmer is not None:
+            self.prewarmer.close()
+        self.prewarmer = None
+        call_soon = getattr(self.tap_monitor.backend, 'call_soon', None)
+        if config.prewarm and call_soon is not None:
+            # A warm shell lives as long as the slowest hotkey can take to fire
+            hotkeys = config.all_hotkeys()
+            slowest_ms = max((hk.held_fire_ms() or 0 for hk in hotkeys), default=0)
+            keep_alive = max(
+                config.tap_timeout,
+                *(hk.tap_timeout for hk in hotkeys if hk.tap_timeout is not None),
+                slowest_ms / 1000,
+            )
+            if matcher.has_sequences:
+                keep_alive += config.sequence_timeout
+            self.prewarmer = Prewarmer(matcher, keep_alive, self._schedule, call_soon)
+        self.tap_monitor.on_tap_start = self.prewarmer.on_prefix if self.prewarmer is not None else None
+        self.executor.prewarm = self.prewarmer
+
+    def _schedule(self, delay: float, callback: 'Callable[[], None]') -> 'Cancellable':
+        """Run a callback on the event thread after ``delay`` seconds (call on the event thread).
+
+        Returns:
+            Cancellable: Handle whose ``cancel()`` stops the callback from running
+        """
+        backend = self.tap_monitor.backend
+        if hasattr(backend, 'call_later'):
+            return backend.call_later(delay, callback)
+        # Backends without an event loop timer: post back from a helper thread
+        call_soon = getattr(backend, 'call_soon', None)
+        timer = threading.Timer(delay, call_soon, (callback,)) if call_soon else threading.Timer(delay, callback)
+        timer.daemon = True
+        timer.start()
+        return timer
+
     def _on_tap_detected(
         self,
         keys: set[Any],
@@ -106,18 +482,42 @@ class LauncherMonitor:
         """Callback when a valid tap is detected.
 
         Args:
-            keys: Set of pynput Key/KeyCode objects that were pressed
+            keys: Set of pynput Key/KeyCode objects that were pressed (only
+                valid during the call: the tap monitor reuses it)
             duration: Duration of the tap in seconds
             trigger_key: The key that triggered completion
             has_non_modifier: True if tap contains non-modifier keys
         """
+        detected_at = perf_counter()
+        self.taps_detected += 1
+        self._metric_counts[self._valid_tap_slot] += 1
+        # The tap monitor's current state belongs to the device of this tap
+        device = self.tap_monitor.state.device
+
+        if self.sequences is not None and not self._has_device_match(keys, duration, device):
+            self._on_sequence_tap(
+                CompletedTap(self.matcher.normalize(keys), duration, trigger_key, has_non_modifier, detected_at)
+            )
+            return
+
         # Try to match against configured hotkeys
-        hotkey = self.matcher.match(keys)
+        hotkey = self.matcher.match(keys, duration, device)
+
+        if self.tap_observer is not None:
+            label = (hotkey.description or hotkey.label()) if hotkey else None
+            self.tap_observer(keys, duration, label)
 
         if hotkey:
-            self._handle_match(hotkey, duration, trigger_key, has_non_modifier)
+            self.taps_matched += 1
+            HOTKEY_MATCHES.inc(hotkey.label())
+            fr.RECORDER.record(fr.HOTKEY_MATCHED, self._hotkey_index(hotkey))
+            self._handle_match(hotkey, duration, detected_at)
+            self._suppress_trigger(trigger_key, has_non_modifier)
 
         else:
+            fr.RECORDER.record(fr.HOTKEY_UNMATCHED)
+            if self.prewarmer is not None:
+                self.prewarmer.discard()
             # No matching hotkey - all keys will be emitted normally by backend
             if self.config.debug_mode:
                 keys_str = format_keys_display(keys)
@@ -126,6 +526,94 @@ class LauncherMonitor:
                     f'(duration: {duration:.3f}s)'
                 )
 
+    def _has_device_match(self, keys: set[Any], duration: float, device: Any) -> bool:
+        """Check if a hotkey limited to ``device`` matches (it bypasses sequences)."""
+        if device is None or not self.matcher.has_device_hotkeys:
+            return False
+        return self.matcher.match_device(self.matcher.normalize(keys), duration, device) is not None
+
+    def _on_sequence_tap(self, tap: CompletedTap) -> None:
+        """Feed a valid tap to the sequence tracker.
+
+        Hotkeys are launched from ``_fire_sequence``: at once when the tap
+        completes a hotkey that no longer sequence extends, otherwise when
+        the sequence is resolved by a later tap or by its deadline. Only a
+        tap that fires at once can suppress its trigger key; the trigger of
+        a tap that has to wait was already passed through.
+        """
+        sequences = self.sequences
+        assert sequences is not None
+        node = sequences.on_tap(tap)
+        hotkey = (
+            node.hotkey if node is not None and not node.children and tap.duration <= node.hotkey_timeout else None
+        )
+        if self.tap_observer is not None:
+            self.tap_observer(set(tap.keys), tap.duration, (hotkey.description or hotkey.label()) if hotkey else None)
+        if hotkey is not None:
+            self._suppress_trigger(tap.trigger_key, tap.has_non_modifier)
+        elif node is None:
+            fr.RECORDER.record(fr.HOTKEY_UNMATCHED)
+            if self.prewarmer is not None:
+                self.prewarmer.discard()
+            if self.config.debug_mode:
+                self.logger.debug(
+                    f'Tap detected but no matching hotkey: {format_keys_display(tap.keys)} '
+                    f'(duration: {tap.duration:.3f}s)'
+                )
+        elif node.children and self.config.debug_mode:
+            self.logger.debug(f'Tap {"+".join(sorted(tap.keys))} may start a sequence, waiting for the next tap')
+
+    def _fire_sequence(self, hotkey: HotkeyConfig, tap: CompletedTap, resolved_at: float) -> None:
+        """Launch a hotkey resolved by the sequence tracker."""
+        self.taps_matched += 1
+        HOTKEY_MATCHES.inc(hotkey.label())
+        fr.RECORDER.record(fr.HOTKEY_MATCHED, self._hotkey_index(hotkey))
+        # The trigger key is suppressed by _on_sequence_tap (if at all)
+        self._handle_match(hotkey, tap.duration, tap.detected_at, resolved_at)
+
+    def _fire_hold(self, hotkey: HotkeyConfig, device: Any, pressed_at: float, fired_at: float) -> None:
+        """Launch a hotkey whose keys are still held (a hold, or a tap with ``fire_on = "press"``).
+
+        For a hold, the hold deadline counts as the detection time, so the
+        timer's lateness shows up as the ``wait`` stage of the launch
+        statistics. For a tap the chord counts as detected when its last key
+        went down, so ``wait`` also covers the grace window.
+        """
+        # Releasing the keys must not complete a tap as well
+        self.tap_monitor.drop_tap(device)
+        if self.press_buffer is not None:
+            self.press_buffer.drop()
+        self.taps_matched += 1
+        HOTKEY_MATCHES.inc(hotkey.label())
+        fr.RECORDER.record(fr.HOTKEY_MATCHED, self._hotkey_index(hotkey))
+        detected_at = pressed_at
+        if hotkey.trigger == 'hold' and hotkey.hold_ms:
+            detected_at += hotkey.hold_ms / 1000
+        self._handle_match(hotkey, fired_at - pressed_at, detected_at, fired_at)
+
+    def hotkey_labels(self) -> list[str]:
+        """Return hotkey labels by configuration index (for flight recorder dumps)."""
+        return [hk.description or hk.label() for hk in self.config.all_hotkeys()]
+
+    def _hotkey_index(self, hotkey: HotkeyConfig) -> int:
+        """Return the configuration index of ``hotkey`` (0xFFFF for the synthetic layer exits).
+
+        Indexes past 0xFFFE are clamped to it.
+        """
+        return self._hotkey_indices.get(id(hotkey), 0xFFFF)
+
+    def _on_tap_invalid(self, reason: str, _keys: set[Any], _duration: float) -> None:
+        """Count an invalid tap (a single key press, or a combination held too long).
+
+        The key set is only valid during the call.
+        """
+        if self.prewarmer is not None:
+            self.prewarmer.discard()
+        slot = self._invalid_tap_slots.get(reason)
+        if slot is None:
+            slot = self._invalid_tap_slots[reason] = TAPS.slot('invalid', reason.replace(' ', '_'))
+        self._metric_counts[slot] += 1
+
     def _log_startup(self) -> None:
         """Log startup information and configured hotkeys."""
         version_info = get_version_info()
@@ -139,7 +627,7 @@ class LauncherMonitor:
         if self.config.debug_mode:
             self.logger.debug('Debug mode enabled')
             for hotkey in self.config.hotkeys:
-                keys_str = '+'.join(sorted(hotkey.keys))
+                keys_str = hotkey.label()
                 self.logger.debug(
                     f"  {keys_str} → {hotkey.command} {' '.join(hotkey.args)}"
                 )
@@ -148,34 +636,48 @@ class LauncherMonitor:
         self,
         hotkey: 'HotkeyConfig',
         duration: float,
-        trigger_key: Any,
-        has_non_modifier: bool,
+        detected_at: float | None = None,
+        resolved_at: float | None = None,
     ) -> None:
-        """Handle matched hotkey: log, execute, and suppress trigger key if needed."""
-        keys_str = '+'.join(sorted(hotkey.keys))
+        """Handle matched hotkey: log and execute (or switch layers)."""
+        if hotkey.layer:
+            self._switch_layer(hotkey.layer)
+            return
+        if self.layer.timeout is not None:
+            self._arm_layer_timeout()
+        keys_str = hotkey.label()
+        kind = 'Hold' if hotkey.trigger == 'hold' else 'Tap'
         if hotkey.description:
             self.logger.info(
-                f'Tap detected: {hotkey.description} '
+                f'{kind} detected: {hotkey.description} '
                 f'(keys: {keys_str}, duration: {duration:.3f}s)'
             )
         else:
             self.logger.info(
-                f'Tap detected: {keys_str} (duration: {duration:.3f}s)'
+                f'{kind} detected: {keys_str} (duration: {duration:.3f}s)'
             )
-        success = self.executor.execute(hotkey)
-        if not success:
+        success = self.executor.execute(hotkey, detected_at, resolved_at)
+        fr.RECORDER.record(fr.LAUNCH_OK if success else fr.LAUNCH_FAILED, self._hotkey_index(hotkey))
+        if success:
+            self.launches += 1
+        else:
+            self.launch_failures += 1
             self.logger.warning(
                 f'Command execution failed for hotkey: {keys_str}'
             )
-        if has_non_modifier and trigger_key:
-            from common.key_normalizer import is_modifier_key
-            if not is_modifier_key(trigger_key):
-                backend = self.tap_monitor.backend
-                if hasattr(backend, 'suppress_key'):
-                    backend.suppress_key(trigger_key)
-                    if self.config.debug_mode:
-                        self.logger.debug(f'Suppressed trigger key: {trigger_key}')
-                else:
-                    self.logger.warning('Backend doesn\'t support key suppression')
+
+    def _suppress_trigger(self, trigger_key: Any, has_non_modifier: bool) -> None:
+        """Suppress the keys of a matched tap: held-back presses and a non-modifier trigger key."""
+        if self.press_buffer is not None:
+            self.press_buffer.drop()
+        if not has_non_modifier or not trigger_key or is_modifier_key(trigger_key):
+            return
+        backend = self.tap_monitor.backend
+        if hasattr(backend, 'suppress_key'):
+            backend.suppress_key(trigger_key)
+            if self.config.debug_mode:
+                self.logger.debug(f'Suppressed trigger key: {trigger_key}')
+        else:
+            self.logger.warning('Backend doesn\'t support key suppression')
 
 
@@ -0,0 +1,163 @@
+"""Press buffering for modifier-only hotkeys.
+
+A tap of a modifier-only hotkey (e.g., ``ctrl_l+shift_l``) completes on
+the release of its first key, by which time every press has reached the
+desktop, which may act on the combination as well (a layout switcher,
+for instance). With ``press_buffer_ms`` set, ``PressBuffer`` holds back
+the presses of a tap while its keys can still become such a hotkey:
+
+- the tap matches a hotkey: the held-back presses are dropped, and so
+  are the releases of their keys;
+- anything else happens (another key, a release that matches nothing,
+  another device), or ``press_buffer_ms`` passes: the presses are
+  emitted in their original order before that event.
+
+The delay added to a press is thus at most ``press_buffer_ms`` (plus the
+event loop's timer lateness). Each flush records the delay of its first
+(longest held) press in the ``tap_launcher_press_buffer_delay_seconds``
+histogram.
+
+All methods run on the event thread.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING
+from typing import Any
+
+from common.metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .hold_engine import Cancellable
+    from .hotkey_matcher import HotkeyMatcher
+
+BUFFERED_PRESSES = REGISTRY.counter(
+    'tap_launcher_buffered_presses_total',
+    'Key presses held back for modifier-only hotkeys, by whether they were emitted later or dropped',
+    ('outcome',),
+)
+BUFFER_DELAY = REGISTRY.histogram(
+    'tap_launcher_press_buffer_delay_seconds',
+    'Time held-back presses waited before being emitted',
+)
+
+
+class PressBuffer:
+    """Hold back the presses of a tap that can still become a modifier-only hotkey.
+
+    Args:
+        matcher: Matcher whose ``buffer_masks`` decide which taps are held back
+        limit: Longest time in seconds a press is held back
+        schedule: Called as ``schedule(delay, callback)`` to run a callback
+            on the event thread after ``delay`` seconds; returns a handle
+            that can be cancelled
+        backend: Keyboard backend with ``buffer_key``, ``restore_key`` and
+            ``suppress_key``
+    """
+
+    def __init__(
+        self,
+        matcher: HotkeyMatcher,
+        limit: float,
+        schedule: Callable[[float, Callable[[], None]], Cancellable],
+        backend: Any,
+    ) -> None:
+        self._masks = matcher.buffer_masks
+        self._key_bit = matcher.key_bit
+        self._limit = limit
+        self._schedule = schedule
+        self._backend = backend
+        self.mask = matcher.buffer_mask
+        self.active = False
+        self._device: Any = None
+        self._held: list[Any] = []
+        self._held_mask = 0
+        self._since = 0.0
+        self._timer: Cancellable | None = None
+        self._generation = 0
+        # Created on the event thread, so this is the event thread's shard
+        self._counts = REGISTRY.shard().values
+        self._flushed_slot = BUFFERED_PRESSES.slot('flushed')
+        self._dropped_slot = BUFFERED_PRESSES.slot('dropped')
+        self._delay_slot = BUFFER_DELAY.slot()
+
+    def on_combination(self, mask: int, key: Any, device: Any) -> None:
+        """Hold back ``key`` if the tap's keys (``mask``) can still become a modifier-only hotkey.
+
+        Args:
+            mask: Bits of the keys of the current tap
+            key: The key just added to the tap
+            device: Device of the tap (None if taps are not tracked per device)
+        """
+        if mask not in self._masks or (self.active and device != self._device):
+            self.flush()
+            return
+        if not self.active:
+            self.active = True
+            self._device = device
+            self._since = perf_counter()
+            self._generation += 1
+            generation = self._generation
+            self._timer = self._schedule(self._limit, lambda: self._on_deadline(generation))
+        self._backend.buffer_key(key)
+        self._held.append(key)
+        self._held_mask = mask
+
+    def interrupt(self, key: Any, device: Any) -> None:
+        """Emit the held-back presses before a press that cannot continue the tap.
+
+        Args:
+            key: Key of the press
+            device: Device of the press
+        """
+        bit = self._key_bit(key)
+        if bit and device == self._device and (self._held_mask | bit) in self._masks:
+            # The key may still complete the hotkey (or repeats a held one)
+            return
+        self.flush()
+
+    def drop(self) -> None:
+        """Suppress the held-back presses (and the releases of their keys): a hotkey matched."""
+        if not self.active:
+            return
+        held = self._held
+        self._counts[self._dropped_slot] += len(held)
+        self._disarm()
+        for key in held:
+            self._backend.suppress_key(key)
+
+    def flush(self) -> None:
+        """Emit the held-back presses in their original order."""
+        if not self.active:
+            return
+        held = self._held
+        counts = self._counts
+        counts[self._flushed_slot] += len(held)
+        BUFFER_DELAY.observe_into(counts, self._delay_slot, perf_counter() - self._since)
+        self._disarm()
+        for key in held:
+            self._backend.restore_key(key)
+
+    def cancel(self, restore: bool = True) -> None:
+        """Stop buffering; the held-back presses are emitted unless ``restore`` is False."""
+        if restore:
+            self.flush()
+        else:
+            self._disarm()
+
+    def _disarm(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self.active = False
+        self._device = None
+        self._held = []
+        self._held_mask = 0
+
+    def _on_deadline(self, generation: int) -> None:
+        if generation == self._generation:
+            self._timer = None
+            self.flush()
@@ -0,0 +1,239 @@
+"""Speculative pre-warming of launches for tap-launcher.
+
+Once the first key of a tap is down, only the few hotkeys containing it can
+still fire. With ``prewarm`` enabled, ``Prewarmer`` uses the rest of the tap
+to prepare their launch: a helper thread resolves the commands of these
+candidates in PATH and forks a *warm* shell that waits for a single command
+line on its stdin::
+
+    sh -c 'IFS= read -r line; eval "exec $line"'
+
+Only taps starting with a modifier are prepared: a non-modifier first key
+completes its tap on the same press, before a shell could be ready.
+
+When the tap matches, launching is one write of the quoted command line;
+the shell then replaces itself with the command, so neither the fork nor
+the PATH lookup is left on the event thread. When the prefix dies (the tap
+matches nothing, or is still unresolved after ``keep_alive`` seconds), the
+shell's stdin is closed and it exits without running anything; the helper
+thread waits for it, so no zombie is left behind.
+
+Launches handed to a warm shell are hits; launches that found no shell ready
+(or a command that could not be resolved in advance) are misses and spawn
+as usual; shells discarded unused are wasted. All three are counted in
+``tap_launcher_prewarm_total`` and in the daemon status.
+
+``on_prefix``, ``launch`` and ``discard`` run on the event thread; the
+helper thread reports back through ``call_soon``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import queue
+import shlex
+import shutil
+import subprocess
+import threading
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import Any
+
+from common.logging_utils import get_logger
+from common.metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .hold_engine import Cancellable
+    from .hotkey_matcher import HotkeyMatcher
+
+PREWARM = REGISTRY.counter(
+    'tap_launcher_prewarm_total',
+    'Speculatively forked launch shells, by outcome (hit, miss or wasted)',
+    ('outcome',),
+)
+
+# Reads one command line and execs it; on EOF it exits without running anything
+WARM_SHELL = 'IFS= read -r line; eval "exec $line"'
+
+
+class Prewarmer:
+    """Prepare the launch of the hotkeys a starting tap can still become.
+
+    Args:
+        matcher: Matcher whose candidates are pre-resolved
+        keep_alive: Seconds a warm shell waits for its tap to resolve
+        schedule: Called as ``schedule(delay, callback)`` to run a callback
+            on the event thread after ``delay`` seconds; returns a handle
+            that can be cancelled
+        call_soon: Runs a callable on the event thread (from any thread)
+    """
+
+    def __init__(
+        self,
+        matcher: HotkeyMatcher,
+        keep_alive: float,
+        schedule: Callable[[float, Callable[[], None]], Cancellable],
+        call_soon: Callable[[Callable[[], None]], None],
+    ) -> None:
+        self.logger = get_logger('tap_launcher.prewarm')
+        self._matcher = matcher
+        self._keep_alive = keep_alive
+        self._schedule = schedule
+        self._call_soon = call_soon
+        self.hits = 0
+        self.misses = 0
+        self.wasted = 0
+        # Event thread state
+        self._shell: subprocess.Popen[bytes] | None = None
+        self._resolved: dict[str, str] = {}
+        self._pending = False
+        self._expiry: Cancellable | None = None
+        self._generation = 0
+        # Helper thread, started on the first prefix
+        # Prefixes to prepare, closed shells to reap, or None to stop
+        self._requests: queue.SimpleQueue[tuple[int, int, bool] | subprocess.Popen[bytes] | None] = (
+            queue.SimpleQueue()
+        )
+        self._thread: threading.Thread | None = None
+        # Created on the event thread, so this is the event thread's shard
+        self._counts = REGISTRY.shard().values
+        self._slots = {outcome: PREWARM.slot(outcome) for outcome in ('hit', 'miss', 'wasted')}
+
+    def counters(self) -> dict[str, int]:
+        """Return hit, miss and waste counts."""
+        return {'prewarm_hits': self.hits, 'prewarm_misses': self.misses, 'prewarm_wasted': self.wasted}
+
+    def on_prefix(self, mask: int, _device: Any = None) -> None:
+        """Start preparing the candidates of a tap whose first key has bits ``mask``."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='tap-launcher-prewarm', daemon=True)
+            self._thread.start()
+        if self._expiry is not None:
+            self._expiry.cancel()
+        generation = self._generation
+        self._expiry = self._schedule(self._keep_alive, lambda: self._on_expired(generation))
+        spawn = self._shell is None and not self._pending
+        self._pending = self._pending or spawn
+        self._requests.put((generation, mask, spawn))
+
+    def launch(self, cmd: list[str]) -> bool:
+        """Hand a command to the warm shell.
+
+        Args:
+            cmd: Command and arguments
+
+        Returns:
+            bool: True if the warm shell runs the command; False if the
+                caller must spawn it (counted as a miss)
+        """
+        shell = self._shell
+        path = self._resolved.get(cmd[0])
+        if shell is None or shell.stdin is None or path is None or any('\n' in arg for arg in cmd):
+            self._count('miss')
+            return False
+        self._shell = None
+        self._cancel_expiry()
+        try:
+            os.write(shell.stdin.fileno(), shlex.join([path, *cmd[1:]]).encode() + b'\n')
+            shell.stdin.close()
+        except OSError as e:
+            self.logger.debug(f'Warm shell unusable ({e}), spawning directly')
+            self._count('miss')
+            return False
+        self._count('hit')
+        return True
+
+    def discard(self) -> None:
+        """Drop the prepared launch: the prefix died without a hit."""
+        self._generation += 1
+        self._cancel_expiry()
+        self._close(self._shell)
+        self._shell = None
+
+    def close(self) -> None:
+        """Discard the warm shell and stop the helper thread."""
+        self.discard()
+        if self._thread is not None:
+            self._requests.put(None)
+            self._thread = None
+
+    def _count(self, outcome: str) -> None:
+        if outcome == 'hit':
+            self.hits += 1
+        elif outcome == 'miss':
+            self.misses += 1
+        else:
+            self.wasted += 1
+        self._counts[self._slots[outcome]] += 1
+
+    def _cancel_expiry(self) -> None:
+        if self._expiry is not None:
+            self._expiry.cancel()
+            self._expiry = None
+
+    def _close(self, shell: subprocess.Popen[bytes] | None) -> None:
+        """Let an unused warm shell exit (EOF on its stdin)."""
+        if shell is None:
+            return
+        self._count('wasted')
+        if shell.stdin is not None:
+            with contextlib.suppress(OSError):
+                shell.stdin.close()
+        self._requests.put(shell)  # reaped by the helper thread
+
+    def _on_expired(self, generation: int) -> None:
+        if generation == self._generation:
+            self._expiry = None
+            self.discard()
+
+    def _on_ready(
+        self,
+        generation: int,
+        spawn: bool,
+        shell: subprocess.Popen[bytes] | None,
+        resolved: dict[str, str],
+    ) -> None:
+        """Adopt the helper thread's work (on the event thread)."""
+        if spawn:
+            self._pending = False
+        if shell is not None:
+            if generation != self._generation or self._shell is not None:
+                self._close(shell)
+            else:
+                self._shell = shell
+        self._resolved.update(resolved)
+
+    def _run(self) -> None:
+        """Helper thread: resolve candidate commands and fork warm shells."""
+        while (request := self._requests.get()) is not None:
+            if isinstance(request, subprocess.Popen):
+                request.wait()
+                continue
+            generation, mask, spawn = request
+            resolved: dict[str, str] = {}
+            for hotkey in self._matcher.candidates(mask):
+                path = shutil.which(hotkey.command)
+                if path is not None:
+                    resolved[hotkey.command] = path
+            shell = None
+            if spawn:
+                try:
+                    shell = subprocess.Popen(  # noqa: S603
+                        ['/bin/sh', '-c', WARM_SHELL],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        start_new_session=True,
+                    )
+                except OSError as e:
+                    self.logger.warning(f'Cannot fork warm shell: {e}')
+            try:
+                self._call_soon(partial(self._on_ready, generation, spawn, shell, resolved))
+            except queue.Full:
+                # The event loop is flooded: nobody will adopt the shell
+                if shell is not None and shell.stdin is not None:
+                    shell.stdin.close()
+                    shell.wait()
@@ -0,0 +1,136 @@
+"""On-demand profiling of the running daemon.
+
+``tap-launcher profile`` asks the daemon, through the control socket, to
+profile it for a few seconds:
+
+- with the stack sampler (the default): a helper thread reads the keyboard
+  event thread's stack every ``interval`` seconds and writes the counts in
+  the collapsed-stack format of flamegraph tools (``flamegraph.pl``,
+  speedscope, ...). Only the event thread is sampled, and it runs unchanged;
+- with ``cProfile``: the profiler is enabled and disabled from the event
+  thread, and its statistics are written as a pstats file (``python -m
+  pstats``, snakeviz, ...). Since Python 3.12 cProfile is built on
+  ``sys.monitoring``, which is process-wide: the profile then covers every
+  thread (device readers, control connections, including the one sleeping
+  while the profile runs, logging, prewarm and metrics), not only the
+  event thread.
+
+Nothing is installed until a profile is requested, so the daemon pays
+nothing while no profile runs. One profile runs at a time.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from common.runtime_state import RUNTIME_DIR
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+    from types import CodeType
+    from types import FrameType
+
+PROFILE_FILE = RUNTIME_DIR / 'tap-launcher.prof'
+FOLDED_FILE = RUNTIME_DIR / 'tap-launcher.folded'
+MAX_PROFILE_SECONDS = 300.0
+DEFAULT_SAMPLE_INTERVAL = 0.001
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one runs."""
+
+
+class EventThreadProfiler:
+    """Profile the daemon for a while and write the result to a file.
+
+    Runs on a control connection thread, which waits for the profile to end.
+
+    Args:
+        run_on_event_thread: Runs a callable on the event thread and returns
+            its result (see ``LauncherControl``)
+    """
+
+    def __init__(self, run_on_event_thread: Callable[[Callable[[], Any]], Any]) -> None:
+        self._run_on_event_thread = run_on_event_thread
+        self._lock = threading.Lock()
+
+    def profile(self, seconds: float, output: Path = PROFILE_FILE) -> int:
+        """Run cProfile for ``seconds`` and write pstats to ``output``.
+
+        The profiler is switched on the event thread, but on Python 3.12+ it
+        records every thread of the process.
+
+        Returns:
+            int: Number of profiled functions
+        """
+        with self._exclusive():
+            profiler = cProfile.Profile()
+            self._run_on_event_thread(profiler.enable)
+            try:
+                time.sleep(seconds)
+            finally:
+                self._run_on_event_thread(profiler.disable)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(output)
+            return len(profiler.getstats())
+
+    def sample(self, seconds: float, output: Path = FOLDED_FILE, interval: float = DEFAULT_SAMPLE_INTERVAL) -> int:
+        """Sample the event thread's stack for ``seconds`` and write collapsed stacks to ``output``.
+
+        Returns:
+            int: Number of samples taken
+        """
+        with self._exclusive():
+            ident: int = self._run_on_event_thread(threading.get_ident)
+            stacks: Counter[str] = Counter()
+            names: dict[CodeType, str] = {}
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                frame = sys._current_frames().get(ident)
+                if frame is None:
+                    break
+                stacks[_collapse(frame, names)] += 1
+                del frame
+                time.sleep(interval)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            with output.open('w') as f:
+                for stack, count in stacks.most_common():
+                    f.write(f'{stack} {count}\n')
+            return stacks.total()
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Hold the profile lock, failing at once if another profile runs."""
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError('a profile is already running')  # noqa: TRY003
+        try:
+            yield
+        finally:
+            self._lock.release()
+
+
+def _collapse(frame: FrameType | None, names: dict[CodeType, str]) -> str:
+    """Return a stack as ``outermost;...;innermost`` frame labels.
+
+    Args:
+        frame: Innermost frame
+        names: Labels of the code objects seen so far (filled in)
+    """
+    labels = []
+    while frame is not None:
+        code = frame.f_code
+        label = names.get(code)
+        if label is None:
+            label = names[code] = f'{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})'
+        labels.append(label)
+        frame = frame.f_back
+    return ';'.join(reversed(labels))
@@ -0,0 +1,158 @@
+"""Tap sequence hotkeys for tap-launcher.
+
+A sequence hotkey fires after several taps that follow each other within
+``sequence_timeout`` (e.g., a double tap of ``ctrl_l``, or ``super_l``
+then ``t``). ``SequenceTracker`` walks the trie built by ``HotkeyMatcher``
+one completed tap at a time: each tap is a single dict lookup, and the only
+state kept is the current trie node, its deadline and at most one pending
+hotkey, so history never grows.
+
+When a tap matches a hotkey and also starts (or continues) a longer
+sequence, the tracker cannot tell yet which one was meant. It keeps the
+shorter hotkey pending until the next tap arrives or the deadline passes;
+this added wait is reported in the launch statistics.
+
+All methods run on the event thread.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .hotkey_matcher import SequenceNode
+    from .models import HotkeyConfig
+
+
+@dataclass(frozen=True)
+class CompletedTap:
+    """A valid tap as reported by ``TapMonitor``.
+
+    Attributes:
+        keys: Canonical names of the tapped keys
+        duration: Duration of the tap in seconds
+        trigger_key: The key that completed the tap
+        has_non_modifier: True if the tap contains non-modifier keys
+        detected_at: ``perf_counter()`` timestamp of the tap completion
+    """
+    keys: frozenset[str]
+    duration: float
+    trigger_key: Any
+    has_non_modifier: bool
+    detected_at: float
+
+
+class SequenceTracker:
+    """Match completed taps against the sequence trie.
+
+    Args:
+        root: Root of the trie (``HotkeyMatcher.sequence_root``)
+        timeout: Maximum pause in seconds between taps of a sequence
+        fire: Called as ``fire(hotkey, tap, resolved_at)`` when a hotkey is
+            resolved; ``tap`` is the last tap of the hotkey
+        schedule: Called as ``schedule(delay, callback)`` to run a callback
+            on the event thread after ``delay`` seconds
+    """
+
+    def __init__(
+        self,
+        root: SequenceNode,
+        timeout: float,
+        fire: Callable[[HotkeyConfig, CompletedTap, float], None],
+        schedule: Callable[[float, Callable[[], None]], object],
+    ) -> None:
+        self.timeout = timeout
+        self._root = root
+        self._fire = fire
+        self._schedule = schedule
+        self._node = root
+        self._deadline = 0.0
+        self._pending: tuple[HotkeyConfig, CompletedTap] | None = None
+        self._generation = 0
+
+    @property
+    def in_progress(self) -> bool:
+        """True while a sequence has been started but not resolved."""
+        return self._node is not self._root
+
+    def reset(self) -> None:
+        """Drop the sequence in progress without firing its pending hotkey."""
+        self._node = self._root
+        self._pending = None
+
+    def on_tap(self, tap: CompletedTap) -> SequenceNode | None:
+        """Advance the trie with a completed tap.
+
+        Args:
+            tap: The completed tap
+
+        Returns:
+            SequenceNode | None: The node the tap led to, or None if the tap
+                is not part of any configured hotkey
+        """
+        node = self._node
+        if node is not self._root and tap.detected_at > self._deadline:
+            # The pause was too long: the previous taps stand on their own
+            self._flush()
+            node = self._root
+        child = self._child(node, tap)
+        if child is None and node is not self._root:
+            # The tap breaks the sequence: resolve it, then start over
+            self._flush()
+            child = self._child(self._root, tap)
+        if child is None:
+            return None
+
+        hotkey = child.hotkey if tap.duration <= child.hotkey_timeout else None
+        if child.children:
+            # Wait for the next tap; a hotkey ending here becomes pending
+            self._node = child
+            self._deadline = tap.detected_at + self.timeout
+            self._pending = (hotkey, tap) if hotkey is not None else None
+            self._generation += 1
+            generation = self._generation
+            self._schedule(self.timeout, lambda: self.on_deadline(generation))
+        else:
+            self._node = self._root
+            self._pending = None
+            if hotkey is not None:
+                self._fire(hotkey, tap, perf_counter())
+        return child
+
+    @staticmethod
+    def _child(node: SequenceNode, tap: CompletedTap) -> SequenceNode | None:
+        """Return the node a tap leads to (None if it fits no hotkey or took too long)."""
+        child = node.children.get(tap.keys)
+        if child is None or tap.duration > child.tap_timeout:
+            return None
+        return child
+
+    def on_deadline(self, generation: int) -> None:
+        """Resolve the sequence in progress once its deadline has passed.
+
+        Args:
+            generation: Tap the callback was scheduled for; callbacks of
+                earlier taps are stale and do nothing
+        """
+        if generation != self._generation or self._node is self._root:
+            return
+        remaining = self._deadline - perf_counter()
+        if remaining > 0:
+            # Timer fired early
+            self._schedule(remaining, lambda: self.on_deadline(generation))
+            return
+        self._flush()
+
+    def _flush(self) -> None:
+        """Fire the pending hotkey (if any) and return to the root."""
+        pending = self._pending
+        self._node = self._root
+        self._pending = None
+        if pending is not None:
+            hotkey, tap = pending
+            self._fire(hotkey, tap, perf_counter())